@@ -33,6 +33,7 @@ import math
 import re
 from collections import defaultdict
 from pathlib import Path
+from typing import Any
 
 from psforge_grid.io.protocols import IParser
 from psforge_grid.models.branch import Branch
@@ -280,9 +281,9 @@ def _parse_bus_section(
     Returns:
         Tuple of (buses, loads, shunts)
     """
-    buses: list[Bus] = []
-    loads: list[Load] = []
-    shunts: list[Shunt] = []
+    bus_rows: list[tuple[Any, ...]] = []
+    load_rows: list[tuple[Any, ...]] = []
+    shunt_rows: list[tuple[Any, ...]] = []
 
     for row in rows:
         if len(row) < 13:
@@ -302,38 +303,32 @@ def _parse_bus_section(
         v_max = float(row[11])
         v_min = float(row[12])
 
-        bus = Bus(
-            bus_id=bus_id,
-            bus_type=bus_type,
-            v_magnitude=vm,
-            v_angle=math.radians(va_deg),
-            base_kv=base_kv,
-            area=area,
-            zone=zone,
-            v_max=v_max,
-            v_min=v_min,
+        # Bus fields in declaration order, built in bulk by Bus.from_rows()
+        bus_rows.append(
+            (
+                bus_id,
+                bus_type,
+                vm,
+                math.radians(va_deg),
+                base_kv,
+                area,
+                zone,
+                v_max,
+                v_min,
+                None,
+                None,
+            )
         )
-        buses.append(bus)
 
         # Create Load if Pd or Qd is non-zero
         if pd_mw != 0.0 or qd_mvar != 0.0:
-            load = Load(
-                bus_id=bus_id,
-                p_load=pd_mw / base_mva,
-                q_load=qd_mvar / base_mva,
-            )
-            loads.append(load)
+            load_rows.append((bus_id, pd_mw / base_mva, qd_mvar / base_mva, 1, "1", None, None))
 
         # Create Shunt if Gs or Bs is non-zero
         if gs_mw != 0.0 or bs_mvar != 0.0:
-            shunt = Shunt(
-                bus_id=bus_id,
-                g_pu=gs_mw / base_mva,
-                b_pu=bs_mvar / base_mva,
-            )
-            shunts.append(shunt)
+            shunt_rows.append((bus_id, gs_mw / base_mva, bs_mvar / base_mva, 1, "1", None, None))
 
-    return buses, loads, shunts
+    return Bus.from_rows(bus_rows), Load.from_rows(load_rows), Shunt.from_rows(shunt_rows)
 
 
 def _parse_gen_section(rows: list[list[str]], base_mva: float) -> list[Generator]:
@@ -427,7 +422,7 @@ def _parse_branch_section(rows: list[list[str]]) -> list[Branch]:
     Returns:
         List of Branch objects
     """
-    branches: list[Branch] = []
+    branch_rows: list[tuple[Any, ...]] = []
 
     for row in rows:
         if len(row) < 13:
@@ -462,24 +457,29 @@ def _parse_branch_section(rows: list[list[str]]) -> list[Branch]:
         angmin = math.radians(angmin_deg)
         angmax = math.radians(angmax_deg)
 
-        branch = Branch(
-            from_bus=from_bus,
-            to_bus=to_bus,
-            r_pu=r_pu,
-            x_pu=x_pu,
-            b_pu=b_pu,
-            tap_ratio=tap_ratio,
-            shift_angle=shift_angle,
-            rate_a=rate_a,
-            rate_b=rate_b,
-            rate_c=rate_c,
-            angmin=angmin,
-            angmax=angmax,
-            status=status,
+        # Branch fields in declaration order, built in bulk by Branch.from_rows()
+        branch_rows.append(
+            (
+                from_bus,
+                to_bus,
+                r_pu,
+                x_pu,
+                b_pu,
+                tap_ratio,
+                shift_angle,
+                rate_a,
+                rate_b,
+                rate_c,
+                angmin,
+                angmax,
+                status,
+                "1",
+                None,
+                None,
+            )
         )
-        branches.append(branch)
 
-    return branches
+    return Branch.from_rows(branch_rows)
 
 
 def _parse_gencost_section(rows: list[list[str]]) -> list[GeneratorCost]:
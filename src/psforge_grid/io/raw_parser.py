@@ -31,7 +31,9 @@ from __future__ import annotations
 
 import contextlib
 import math
+import sys
 from pathlib import Path
+from typing import Any
 
 from psforge_grid.io.protocols import IParser
 from psforge_grid.models.branch import Branch
@@ -41,6 +43,24 @@ from psforge_grid.models.load import Load
 from psforge_grid.models.shunt import Shunt
 from psforge_grid.models.system import System
 
+# Quote characters that delimit PSS/E string fields (NAME, ID, CKT)
+_QUOTE_CHARS = "'\""
+
+# Leading characters of lines that may be section markers: end markers
+# ("0 / END OF ...", "0", "Q") and bare "BEGIN ... DATA" lines. Any other
+# line is data and bypasses the marker tests in _split_sections().
+_MARKER_LEAD_CHARS = frozenset("0QBb")
+
+# Section start markers (matched against the upper-cased marker line)
+_SECTION_START_MARKERS = (
+    ("BEGIN BUS DATA", "BUS_DATA"),
+    ("BEGIN LOAD DATA", "LOAD_DATA"),
+    ("BEGIN FIXED SHUNT DATA", "FIXED_SHUNT_DATA"),
+    ("BEGIN GENERATOR DATA", "GENERATOR_DATA"),
+    ("BEGIN BRANCH DATA", "BRANCH_DATA"),
+    ("BEGIN TRANSFORMER DATA", "TRANSFORMER_DATA"),
+)
+
 
 class RawParser(IParser):
     """PSS/E RAW format parser.
@@ -198,9 +218,10 @@ def _split_sections(lines: list[str]) -> dict[str, list[str]]:
 
     for line in lines:
         line = line.strip()
+        lead = line[:1]
 
         # Skip comments
-        if line.startswith("@"):
+        if lead == "@":
             continue
 
         # Handle case identification (first 3 lines)
@@ -214,43 +235,38 @@ def _split_sections(lines: list[str]) -> dict[str, list[str]]:
                 current_section = "BUS_DATA"
             continue
 
+        # Fast path: data lines cannot be section markers, so skip the
+        # marker tests (and the upper() copy) for them entirely
+        if lead not in _MARKER_LEAD_CHARS:
+            # Add line to current section (quote delimiters removed at ingest);
+            # blank lines are dropped so fixed-size records stay aligned
+            if current_section and line:
+                current_lines.append(_strip_field_quotes(line))
+            continue
+
         # Section end markers (but check for next section on same line - v34 format)
         # v34 format: "0 / END OF SYSTEM-WIDE DATA, BEGIN BUS DATA"
-        if line.startswith("0 /") or line.startswith("Q") or line == "0":
+        is_end_marker = line.startswith("0 /") or lead == "Q" or line == "0"
+        if is_end_marker:
             if current_section:
                 sections[current_section] = current_lines
                 current_lines = []
             current_section = None
-            # Don't continue - check if this line also contains a section start marker
+            # Don't skip yet - check if this line also contains a section start marker
 
-        # Section start markers (check for various patterns)
-        line_upper = line.upper()
-        if "BEGIN BUS DATA" in line_upper:
-            current_section = "BUS_DATA"
-            continue
-        elif "BEGIN LOAD DATA" in line_upper:
-            current_section = "LOAD_DATA"
-            continue
-        elif "BEGIN FIXED SHUNT DATA" in line_upper:
-            current_section = "FIXED_SHUNT_DATA"
-            continue
-        elif "BEGIN GENERATOR DATA" in line_upper:
-            current_section = "GENERATOR_DATA"
-            continue
-        elif "BEGIN BRANCH DATA" in line_upper:
-            current_section = "BRANCH_DATA"
-            continue
-        elif "BEGIN TRANSFORMER DATA" in line_upper:
-            current_section = "TRANSFORMER_DATA"
+        # Section start markers
+        section_name = _match_section_start(line)
+        if section_name is not None:
+            current_section = section_name
             continue
 
         # If we hit an end marker without a new section start, skip the line
-        if line.startswith("0 /") or line.startswith("Q") or line == "0":
+        if is_end_marker:
             continue
 
-        # Add line to current section
+        # Add line to current section (quote delimiters removed at ingest)
         if current_section and line:
-            current_lines.append(line)
+            current_lines.append(_strip_field_quotes(line))
 
     # Save last section if any
     if current_section and current_lines:
@@ -259,6 +275,42 @@ def _split_sections(lines: list[str]) -> dict[str, list[str]]:
     return sections
 
 
+def _strip_field_quotes(line: str) -> str:
+    """Remove the quote delimiters around each comma-separated field.
+
+    Quotes are stripped only at the ends of a field, so apostrophes inside
+    a quoted name are kept ('O'HARE' becomes O'HARE). Lines without quote
+    characters are returned unchanged.
+
+    Args:
+        line: Stripped data line
+
+    Returns:
+        Line with the quote delimiters of every field removed
+    """
+    if "'" not in line and '"' not in line:
+        return line
+    return ",".join([f.strip().strip(_QUOTE_CHARS) for f in line.split(",")])
+
+
+def _match_section_start(line: str) -> str | None:
+    """Return the section name if the line contains a "BEGIN XXX DATA" marker.
+
+    Args:
+        line: Stripped marker candidate line
+
+    Returns:
+        Section name (e.g., "LOAD_DATA") or None if no known section starts
+    """
+    line_upper = line.upper()
+    if "BEGIN" not in line_upper:
+        return None
+    for marker, section_name in _SECTION_START_MARKERS:
+        if marker in line_upper:
+            return section_name
+    return None
+
+
 def _parse_case_id(lines: list[str]) -> tuple[float, str]:
     """Parse CASE ID section to extract base MVA and case title.
 
@@ -326,37 +378,40 @@ def _parse_bus_data(lines: list[str]) -> list[Bus]:
         if not line or line.startswith("0"):
             continue
 
-        try:
-            fields = [f.strip().strip("'\"") for f in line.split(",")]
-
-            # PSS/E v33 Bus Data Format:
-            # I, 'NAME', BASKV, IDE, AREA, ZONE, OWNER, VM, VA, NVHI, NVLO, EVHI, EVLO
-            # I: Bus number
-            # NAME: Bus name
-            # BASKV: Base voltage (kV)
-            # IDE: Bus type (1=PQ, 2=PV, 3=Slack, 4=Isolated)
-            # AREA: Area number
-            # ZONE: Zone number
-            # VM: Voltage magnitude (p.u.)
-            # VA: Voltage angle (degrees)
-            # NVHI, NVLO: Normal voltage limits
-            # EVHI, EVLO: Emergency voltage limits
+        # PSS/E v33 Bus Data Format:
+        # I, 'NAME', BASKV, IDE, AREA, ZONE, OWNER, VM, VA, NVHI, NVLO, EVHI, EVLO
+        # I: Bus number
+        # NAME: Bus name
+        # BASKV: Base voltage (kV)
+        # IDE: Bus type (1=PQ, 2=PV, 3=Slack, 4=Isolated)
+        # AREA: Area number
+        # ZONE: Zone number
+        # VM: Voltage magnitude (p.u.)
+        # VA: Voltage angle (degrees)
+        # NVHI, NVLO: Normal voltage limits
+        # EVHI, EVLO: Emergency voltage limits
+        #
+        # Fields are not stripped up front: int() and float() ignore
+        # surrounding whitespace, so only the NAME string is stripped.
+        fields = line.split(",")
+        num_fields = len(fields)
 
+        try:
             bus_id = int(fields[0])
-            name = fields[1] if len(fields) > 1 else None
-            base_kv = float(fields[2]) if len(fields) > 2 else 1.0
-            bus_type = int(fields[3]) if len(fields) > 3 else 1
-            area = int(fields[4]) if len(fields) > 4 else 1
-            zone = int(fields[5]) if len(fields) > 5 else 1
+            name = fields[1].strip() if num_fields > 1 else None
+            base_kv = float(fields[2]) if num_fields > 2 else 1.0
+            bus_type = int(fields[3]) if num_fields > 3 else 1
+            area = int(fields[4]) if num_fields > 4 else 1
+            zone = int(fields[5]) if num_fields > 5 else 1
 
             # Initial voltage values (may be overwritten by power flow)
-            v_magnitude = float(fields[7]) if len(fields) > 7 else 1.0
-            v_angle_deg = float(fields[8]) if len(fields) > 8 else 0.0
+            v_magnitude = float(fields[7]) if num_fields > 7 else 1.0
+            v_angle_deg = float(fields[8]) if num_fields > 8 else 0.0
             v_angle = v_angle_deg * math.pi / 180.0  # Convert to radians
 
             # Voltage limits (use normal limits if available)
-            v_max = float(fields[9]) if len(fields) > 9 else 1.1
-            v_min = float(fields[10]) if len(fields) > 10 else 0.9
+            v_max = float(fields[9]) if num_fields > 9 else 1.1
+            v_min = float(fields[10]) if num_fields > 10 else 0.9
 
             bus = Bus(
                 bus_id=bus_id,
@@ -372,7 +427,7 @@ def _parse_bus_data(lines: list[str]) -> list[Bus]:
             )
             buses.append(bus)
 
-        except (IndexError, ValueError):
+        except ValueError:
             # Skip malformed lines
             continue
 
@@ -389,47 +444,45 @@ def _parse_load_data(lines: list[str], base_mva: float) -> list[Load]:
     Returns:
         List of Load objects
     """
-    loads = []
+    # Load fields in declaration order, built in bulk by Load.from_rows()
+    load_rows: list[tuple[Any, ...]] = []
 
     for line in lines:
         if not line or line.startswith("0"):
             continue
 
-        try:
-            fields = [f.strip().strip("'\"") for f in line.split(",")]
-
-            # PSS/E v33 Load Data Format:
-            # I, ID, STATUS, AREA, ZONE, PL, QL, IP, IQ, YP, YQ, OWNER, SCALE, INTRPT
-            # I: Bus number
-            # ID: Load ID
-            # STATUS: Status (1=in-service, 0=out-of-service)
-            # PL: Active power (MW)
-            # QL: Reactive power (MVAr)
+        # PSS/E v33 Load Data Format:
+        # I, ID, STATUS, AREA, ZONE, PL, QL, IP, IQ, YP, YQ, OWNER, SCALE, INTRPT
+        # I: Bus number
+        # ID: Load ID
+        # STATUS: Status (1=in-service, 0=out-of-service)
+        # PL: Active power (MW)
+        # QL: Reactive power (MVAr)
+        fields = [f.strip() for f in line.split(",")]
+        num_fields = len(fields)
 
+        try:
             bus_id = int(fields[0])
-            load_id = fields[1] if len(fields) > 1 else "1"
-            status = int(fields[2]) if len(fields) > 2 else 1
+            # Interned: IDs repeat across most loads, so equal IDs share one string
+            load_id = sys.intern(fields[1]) if num_fields > 1 else "1"
+            status = int(fields[2]) if num_fields > 2 else 1
 
             # Power values (in MW/MVAr, convert to p.u.)
-            p_load_mw = float(fields[5]) if len(fields) > 5 else 0.0
-            q_load_mvar = float(fields[6]) if len(fields) > 6 else 0.0
+            p_load_mw = float(fields[5]) if num_fields > 5 else 0.0
+            q_load_mvar = float(fields[6]) if num_fields > 6 else 0.0
 
             p_load = p_load_mw / base_mva
             q_load = q_load_mvar / base_mva
 
-            load = Load(
-                bus_id=bus_id,
-                p_load=p_load,
-                q_load=q_load,
-                status=status,
-                load_id=load_id,
-            )
-            loads.append(load)
+            # Rows with an invalid status are skipped, as Load() would reject them
+            if status != 0 and status != 1:
+                continue
+            load_rows.append((bus_id, p_load, q_load, status, load_id, None, None))
 
-        except (IndexError, ValueError):
+        except ValueError:
             continue
 
-    return loads
+    return Load.from_rows(load_rows)
 
 
 def _parse_fixed_shunt_data(lines: list[str], base_mva: float) -> list[Shunt]:
@@ -442,47 +495,44 @@ def _parse_fixed_shunt_data(lines: list[str], base_mva: float) -> list[Shunt]:
     Returns:
         List of Shunt objects
     """
-    shunts = []
+    # Shunt fields in declaration order, built in bulk by Shunt.from_rows()
+    shunt_rows: list[tuple[Any, ...]] = []
 
     for line in lines:
         if not line or line.startswith("0"):
             continue
 
-        try:
-            fields = [f.strip().strip("'\"") for f in line.split(",")]
-
-            # PSS/E v33 Fixed Shunt Data Format:
-            # I, ID, STATUS, GL, BL
-            # I: Bus number
-            # ID: Shunt ID
-            # STATUS: Status (1=in-service, 0=out-of-service)
-            # GL: Shunt conductance (MW at 1.0 p.u. voltage)
-            # BL: Shunt susceptance (MVAr at 1.0 p.u. voltage)
+        # PSS/E v33 Fixed Shunt Data Format:
+        # I, ID, STATUS, GL, BL
+        # I: Bus number
+        # ID: Shunt ID
+        # STATUS: Status (1=in-service, 0=out-of-service)
+        # GL: Shunt conductance (MW at 1.0 p.u. voltage)
+        # BL: Shunt susceptance (MVAr at 1.0 p.u. voltage)
+        fields = [f.strip() for f in line.split(",")]
+        num_fields = len(fields)
 
+        try:
             bus_id = int(fields[0])
-            shunt_id = fields[1] if len(fields) > 1 else "1"
-            status = int(fields[2]) if len(fields) > 2 else 1
+            shunt_id = sys.intern(fields[1]) if num_fields > 1 else "1"
+            status = int(fields[2]) if num_fields > 2 else 1
 
             # G, B values (in MW/MVAr, convert to p.u.)
-            g_mw = float(fields[3]) if len(fields) > 3 else 0.0
-            b_mvar = float(fields[4]) if len(fields) > 4 else 0.0
+            g_mw = float(fields[3]) if num_fields > 3 else 0.0
+            b_mvar = float(fields[4]) if num_fields > 4 else 0.0
 
             g_pu = g_mw / base_mva
             b_pu = b_mvar / base_mva
 
-            shunt = Shunt(
-                bus_id=bus_id,
-                g_pu=g_pu,
-                b_pu=b_pu,
-                status=status,
-                shunt_id=shunt_id,
-            )
-            shunts.append(shunt)
+            # Rows with an invalid status are skipped, as Shunt() would reject them
+            if status != 0 and status != 1:
+                continue
+            shunt_rows.append((bus_id, g_pu, b_pu, status, shunt_id, None, None))
 
-        except (IndexError, ValueError):
+        except ValueError:
             continue
 
-    return shunts
+    return Shunt.from_rows(shunt_rows)
 
 
 def _parse_generator_data(lines: list[str], base_mva: float) -> list[Generator]:
@@ -501,40 +551,40 @@ def _parse_generator_data(lines: list[str], base_mva: float) -> list[Generator]:
         if not line or line.startswith("0"):
             continue
 
-        try:
-            fields = [f.strip().strip("'\"") for f in line.split(",")]
-
-            # PSS/E v33 Generator Data Format:
-            # I, ID, PG, QG, QT, QB, VS, IREG, MBASE, ZR, ZX, RT, XT, GTAP, STAT, ...
-            # I: Bus number
-            # ID: Generator ID
-            # PG: Active power output (MW)
-            # QG: Reactive power output (MVAr)
-            # QT: Maximum reactive power (MVAr)
-            # QB: Minimum reactive power (MVAr)
-            # VS: Voltage setpoint (p.u.)
-            # MBASE: Machine base MVA
-            # STAT: Status (1=in-service, 0=out-of-service)
+        # PSS/E v33 Generator Data Format:
+        # I, ID, PG, QG, QT, QB, VS, IREG, MBASE, ZR, ZX, RT, XT, GTAP, STAT, ...
+        # I: Bus number
+        # ID: Generator ID
+        # PG: Active power output (MW)
+        # QG: Reactive power output (MVAr)
+        # QT: Maximum reactive power (MVAr)
+        # QB: Minimum reactive power (MVAr)
+        # VS: Voltage setpoint (p.u.)
+        # MBASE: Machine base MVA
+        # STAT: Status (1=in-service, 0=out-of-service)
+        fields = [f.strip() for f in line.split(",")]
+        num_fields = len(fields)
 
+        try:
             bus_id = int(fields[0])
-            gen_id = fields[1] if len(fields) > 1 else "1"
+            gen_id = sys.intern(fields[1]) if num_fields > 1 else "1"
 
             # Power values (in MW/MVAr, convert to p.u.)
-            p_gen_mw = float(fields[2]) if len(fields) > 2 else 0.0
-            q_gen_mvar = float(fields[3]) if len(fields) > 3 else 0.0
-            q_max_mvar = float(fields[4]) if len(fields) > 4 else None
-            q_min_mvar = float(fields[5]) if len(fields) > 5 else None
+            p_gen_mw = float(fields[2]) if num_fields > 2 else 0.0
+            q_gen_mvar = float(fields[3]) if num_fields > 3 else 0.0
+            q_max_mvar = float(fields[4]) if num_fields > 4 else None
+            q_min_mvar = float(fields[5]) if num_fields > 5 else None
 
             p_gen = p_gen_mw / base_mva
             q_gen = q_gen_mvar / base_mva
             q_max = q_max_mvar / base_mva if q_max_mvar is not None else None
             q_min = q_min_mvar / base_mva if q_min_mvar is not None else None
 
-            v_setpoint = float(fields[6]) if len(fields) > 6 else 1.0
-            mbase = float(fields[8]) if len(fields) > 8 else base_mva
+            v_setpoint = float(fields[6]) if num_fields > 6 else 1.0
+            mbase = float(fields[8]) if num_fields > 8 else base_mva
 
             # Status is at position 14 (0-indexed)
-            status = int(fields[14]) if len(fields) > 14 else 1
+            status = int(fields[14]) if num_fields > 14 else 1
 
             generator = Generator(
                 bus_id=bus_id,
@@ -549,7 +599,7 @@ def _parse_generator_data(lines: list[str], base_mva: float) -> list[Generator]:
             )
             generators.append(generator)
 
-        except (IndexError, ValueError):
+        except ValueError:
             continue
 
     return generators
@@ -558,80 +608,109 @@ def _parse_generator_data(lines: list[str], base_mva: float) -> list[Generator]:
 def _parse_branch_data(lines: list[str]) -> list[Branch]:
     """Parse BRANCH DATA section.
 
-    Supports both v33 and v34 formats.
+    Supports both v33 and v34 formats. The format is detected once from
+    the first data row (see _is_v34_branch_section()) and the rows are then
+    parsed with fixed column positions.
+
+    Column layout:
+        v33: I, J, CKT, R, X, B, RATEA, RATEB, RATEC, GI, BI, GJ, BJ, ST, MET, LEN
+        v34: I, J, CKT, R, X, B, NAME, RATE1-12, GI, BI, GJ, BJ, STAT, MET, LEN
 
     Args:
         lines: Lines from BRANCH_DATA section
 
+    Returns:
+        List of Branch objects
+    """
+    if _is_v34_branch_section(lines):
+        # v34 format: RATE1 at field[7], RATE2 at field[8], RATE3 at field[9]
+        # STAT at field[23]
+        return _parse_branch_rows(lines, rate_index=7, status_index=23)
+    # v33 format: RATEA at field[6], RATEB at field[7], RATEC at field[8]
+    # ST at field[13]
+    return _parse_branch_rows(lines, rate_index=6, status_index=13)
+
+
+def _is_v34_branch_section(lines: list[str]) -> bool:
+    """Detect whether a BRANCH DATA section uses the v34 column layout.
+
+    In v34, field[6] is the branch NAME (a string), whereas in v33 it is
+    RATEA (a number). Only the first data row is probed, so the cost of the
+    failed float conversion is paid once per section rather than per row.
+
+    Args:
+        lines: Lines from BRANCH_DATA section
+
+    Returns:
+        True if the section uses the v34 layout, False otherwise
+    """
+    for line in lines:
+        if not line or line.startswith("0"):
+            continue
+        fields = line.split(",")
+        if len(fields) <= 6:
+            return False
+        try:
+            float(fields[6])
+        except ValueError:
+            return True
+        return False
+    return False
+
+
+def _parse_branch_rows(lines: list[str], rate_index: int, status_index: int) -> list[Branch]:
+    """Parse BRANCH DATA rows with a known column layout.
+
+    Args:
+        lines: Lines from BRANCH_DATA section
+        rate_index: Column of the first thermal rating (RATEA/RATE1).
+            The next two columns hold RATEB/RATE2 and RATEC/RATE3.
+        status_index: Column of the in-service status flag (ST/STAT)
+
     Returns:
         List of Branch objects
     """
     branches = []
+    rate_b_index = rate_index + 1
+    rate_c_index = rate_index + 2
 
     for line in lines:
         if not line or line.startswith("0"):
             continue
 
-        try:
-            fields = [f.strip().strip("'\"") for f in line.split(",")]
+        fields = [f.strip() for f in line.split(",")]
+        num_fields = len(fields)
+        if num_fields < 2:
+            # I and J are required
+            continue
 
+        try:
             # Common fields for both v33 and v34
             from_bus = int(fields[0])
             to_bus = int(fields[1])
-            circuit_id = fields[2] if len(fields) > 2 else "1"
-            r_pu = float(fields[3]) if len(fields) > 3 else 0.0
-            x_pu = float(fields[4]) if len(fields) > 4 else 0.0
-            b_pu = float(fields[5]) if len(fields) > 5 else 0.0
-
-            # Detect v34 format: field[6] is NAME (string), not RATEA (number)
-            # v34: I, J, CKT, R, X, B, NAME, RATE1-12, GI, BI, GJ, BJ, STAT, MET, LEN
-            # v33: I, J, CKT, R, X, B, RATEA, RATEB, RATEC, GI, BI, GJ, BJ, ST, MET, LEN
-            is_v34 = False
-            if len(fields) > 6:
-                try:
-                    float(fields[6])
-                except ValueError:
-                    is_v34 = True
+            circuit_id = sys.intern(fields[2]) if num_fields > 2 else "1"
+            r_pu = float(fields[3]) if num_fields > 3 else 0.0
+            x_pu = float(fields[4]) if num_fields > 4 else 0.0
+            b_pu = float(fields[5]) if num_fields > 5 else 0.0
 
+            # Ratings: 0 means unlimited -> None
             rate_a = None
             rate_b = None
             rate_c = None
-            status = 1
+            if num_fields > rate_index:
+                rate_val = float(fields[rate_index])
+                if rate_val > 0:
+                    rate_a = rate_val
+            if num_fields > rate_b_index:
+                rate_val = float(fields[rate_b_index])
+                if rate_val > 0:
+                    rate_b = rate_val
+            if num_fields > rate_c_index:
+                rate_val = float(fields[rate_c_index])
+                if rate_val > 0:
+                    rate_c = rate_val
 
-            if is_v34:
-                # v34 format: RATE1 at field[7], RATE2 at field[8], RATE3 at field[9]
-                # STAT at field[23]
-                if len(fields) > 7:
-                    rate_val = float(fields[7])
-                    if rate_val > 0:
-                        rate_a = rate_val
-                if len(fields) > 8:
-                    rate_val = float(fields[8])
-                    if rate_val > 0:
-                        rate_b = rate_val
-                if len(fields) > 9:
-                    rate_val = float(fields[9])
-                    if rate_val > 0:
-                        rate_c = rate_val
-                if len(fields) > 23:
-                    status = int(fields[23])
-            else:
-                # v33 format: RATEA at field[6], RATEB at field[7], RATEC at field[8]
-                # ST at field[13]
-                if len(fields) > 6:
-                    rate_val = float(fields[6])
-                    if rate_val > 0:
-                        rate_a = rate_val
-                if len(fields) > 7:
-                    rate_val = float(fields[7])
-                    if rate_val > 0:
-                        rate_b = rate_val
-                if len(fields) > 8:
-                    rate_val = float(fields[8])
-                    if rate_val > 0:
-                        rate_c = rate_val
-                if len(fields) > 13:
-                    status = int(fields[13])
+            status = int(fields[status_index]) if num_fields > status_index else 1
 
             branch = Branch(
                 from_bus=from_bus,
@@ -647,7 +726,7 @@ def _parse_branch_data(lines: list[str]) -> list[Branch]:
             )
             branches.append(branch)
 
-        except (IndexError, ValueError):
+        except ValueError:
             continue
 
     return branches
@@ -663,6 +742,11 @@ def _parse_transformer_data(lines: list[str]) -> list[Branch]:
     - Line 4: WINDV2, NOMV2, ... (winding 2 data for 2-winding)
     - (Optional Line 5: WINDV3, ... for 3-winding transformers)
 
+    Comment and blank lines are removed by _split_sections(), so every record is a
+    strict 4-line (2-winding) or 5-line (3-winding) block. The section is
+    tokenized once and walked in fixed strides determined by the K field
+    of each record header.
+
     Args:
         lines: Lines from TRANSFORMER_DATA section
 
@@ -670,61 +754,51 @@ def _parse_transformer_data(lines: list[str]) -> list[Branch]:
         List of Branch objects representing transformers
     """
     branches = []
+    fields_list = [line.split(",") for line in lines]
+    num_lines = len(fields_list)
     i = 0
 
-    while i < len(lines):
-        line = lines[i].strip()
-        if not line or line.startswith("@"):
+    while i < num_lines:
+        # Line 1: Header with I, J, K, CKT, ...
+        fields1 = [f.strip() for f in fields_list[i]]
+        num_fields1 = len(fields1)
+        if num_fields1 < 3:
+            # Not a record header: resynchronize on the next line
             i += 1
             continue
 
         try:
-            # Line 1: Header with I, J, K, CKT, ...
-            fields1 = [f.strip().strip("'\"") for f in line.split(",")]
-
             from_bus = int(fields1[0])
             to_bus = int(fields1[1])
             k_bus = int(fields1[2])  # 0 for 2-winding, non-zero for 3-winding
-            circuit_id = fields1[3] if len(fields1) > 3 else "1"
+        except ValueError:
+            i += 1
+            continue
+
+        # Determine number of lines in this record
+        block_size = 5 if k_bus != 0 else 4
+        if i + block_size > num_lines:
+            break
+        block = fields_list[i : i + block_size]
+        i += block_size
+
+        try:
+            circuit_id = sys.intern(fields1[3]) if num_fields1 > 3 else "1"
 
             # STAT is typically at position 11 in v34
             status = 1
-            if len(fields1) > 11:
+            if num_fields1 > 11:
                 with contextlib.suppress(ValueError):
                     status = int(fields1[11])
 
-            # Determine number of windings
-            is_three_winding = k_bus != 0
-            num_data_lines = 5 if is_three_winding else 4
-
-            # Check if we have enough lines
-            if i + num_data_lines - 1 >= len(lines):
-                break
-
             # Line 2: Impedance data (R1-2, X1-2, SBASE1-2, ...)
-            i += 1
-            line2 = lines[i].strip()
-            if line2.startswith("@"):
-                i += 1
-                if i >= len(lines):
-                    break
-                line2 = lines[i].strip()
-
-            fields2 = [f.strip() for f in line2.split(",")]
-            r_pu = float(fields2[0]) if len(fields2) > 0 else 0.0
+            fields2 = block[1]
+            r_pu = float(fields2[0])
             x_pu = float(fields2[1]) if len(fields2) > 1 else 0.0
 
             # Line 3: Winding 1 data (WINDV1, NOMV1, ANG1, RATE1-1, ...)
-            i += 1
-            line3 = lines[i].strip()
-            if line3.startswith("@"):
-                i += 1
-                if i >= len(lines):
-                    break
-                line3 = lines[i].strip()
-
-            fields3 = [f.strip() for f in line3.split(",")]
-            windv1 = float(fields3[0]) if len(fields3) > 0 else 1.0
+            fields3 = block[2]
+            windv1 = float(fields3[0])
             ang1_deg = float(fields3[2]) if len(fields3) > 2 else 0.0
             ang1_rad = ang1_deg * math.pi / 180.0
 
@@ -736,27 +810,12 @@ def _parse_transformer_data(lines: list[str]) -> list[Branch]:
                     rate_a = rate_val
 
             # Line 4: Winding 2 data (WINDV2, NOMV2, ...)
-            i += 1
-            line4 = lines[i].strip()
-            if line4.startswith("@"):
-                i += 1
-                if i >= len(lines):
-                    break
-                line4 = lines[i].strip()
-
-            fields4 = [f.strip() for f in line4.split(",")]
-            windv2 = float(fields4[0]) if len(fields4) > 0 else 1.0
+            windv2 = float(block[3][0])
 
             # Calculate effective tap ratio
+            # (Line 5, winding 3 data for 3-winding transformers, is not used)
             tap_ratio = windv1 / windv2 if windv2 != 0 else windv1
 
-            # Skip winding 3 line for 3-winding transformers
-            if is_three_winding:
-                i += 1
-                line5 = lines[i].strip()
-                if line5.startswith("@"):
-                    i += 1
-
             branch = Branch(
                 from_bus=from_bus,
                 to_bus=to_bus,
@@ -771,10 +830,8 @@ def _parse_transformer_data(lines: list[str]) -> list[Branch]:
             )
             branches.append(branch)
 
-            i += 1
-
-        except (IndexError, ValueError):
-            i += 1
+        except ValueError:
+            # Skip malformed record
             continue
 
     return branches
@@ -8,6 +8,17 @@ New in LLM Affinity Update:
     - limits: Configurable limit settings (LimitsConfig)
     - description fields: All data classes now have description field
     - to_description(): All data classes have LLM-friendly description method
+
+Optional (requires NumPy, ``pip install psforge-grid[numpy]``):
+    - bus_array.BusArray: Structure-of-arrays view of bus data
+    - branch_array.BranchArray: Structure-of-arrays view of branch data
+    - generator_array.GeneratorArray: Structure-of-arrays view of generator data
+    - generator_cost_array.GeneratorCostArray: Vectorized generator cost evaluation
+    - load_array.LoadArray: Structure-of-arrays load data with bulk ingestion
+    - shunt_array.ShuntArray: Structure-of-arrays shunt data with bulk ingestion
+    - status_array: Vectorized voltage/loading status classification
+    - system_array.SystemArrays: All of the above for one System (System.as_arrays())
+    These are not imported here so that the core models stay dependency-free.
 """
 
 from psforge_grid.models.branch import Branch
@@ -0,0 +1,48 @@
+"""Bulk construction helpers for slotted model dataclasses.
+
+Parsers create thousands of Bus and Branch objects per case. Each call to
+the dataclass-generated __init__ pays for keyword argument parsing and
+__post_init__ validation. The helper here generates, once per class, a
+function that builds every object from a row tuple with object.__new__ and
+direct slot assignment. The calling classmethod validates the rows in bulk
+beforehand.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from dataclasses import fields
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+def make_row_constructor(cls: type[T]) -> Callable[[Iterable[tuple[Any, ...]]], list[T]]:
+    """Generate a function that builds instances of cls from row tuples.
+
+    Each row must hold one value per dataclass field, in field declaration
+    order. __init__ and __post_init__ are not called, so the caller is
+    responsible for validating the rows.
+
+    Args:
+        cls: Dataclass to construct
+
+    Returns:
+        Function mapping an iterable of row tuples to a list of instances
+    """
+    names = [f.name for f in fields(cls)]  # type: ignore[arg-type]
+    assignments = "".join(f"        _obj.{name} = {name}\n" for name in names)
+    source = (
+        "def from_rows(rows):\n"
+        "    _out = []\n"
+        "    _append = _out.append\n"
+        f"    for {', '.join(names)}, in rows:\n"
+        "        _obj = _new(_cls)\n"
+        f"{assignments}"
+        "        _append(_obj)\n"
+        "    return _out\n"
+    )
+    namespace: dict[str, Any] = {"_new": object.__new__, "_cls": cls}
+    exec(source, namespace)  # Source is built from dataclass field names only
+    from_rows: Callable[[Iterable[tuple[Any, ...]]], list[T]] = namespace["from_rows"]
+    return from_rows
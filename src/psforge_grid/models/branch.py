@@ -6,10 +6,24 @@ This module defines the Branch class representing transmission lines and transfo
 from __future__ import annotations
 
 import math
+from collections.abc import Iterable
 from dataclasses import dataclass
+from typing import IO, Any
 
+from psforge_grid.models._bulk import make_row_constructor
 
-@dataclass
+# Status codes accepted by Branch: out-of-service, in-service
+_VALID_STATUS: frozenset[int] = frozenset((0, 1))
+
+# Display names indexed by branch kind: line, transformer, phase shifter
+_BRANCH_TYPE_NAMES: tuple[str, str, str] = (
+    "Transmission Line",
+    "Transformer",
+    "Phase-Shifting Transformer",
+)
+
+
+@dataclass(slots=True)
 class Branch:
     """Branch data class for transmission lines and transformers.
 
@@ -79,18 +93,56 @@ class Branch:
         Raises:
             ValueError: If status is not 0 or 1, or if tap_ratio is zero.
         """
-        if self.status not in [0, 1]:
+        if self.status not in _VALID_STATUS:
             raise ValueError(
                 f"Invalid status: {self.status}. Must be 0 (out-of-service) or 1 (in-service)."
             )
         if self.tap_ratio == 0.0:
             raise ValueError("tap_ratio cannot be zero.")
 
+    @classmethod
+    def from_rows(cls, rows: Iterable[tuple[Any, ...]]) -> list[Branch]:
+        """Create many branches at once from row tuples.
+
+        Bulk counterpart of Branch(...) for parsers. Each row holds one
+        value per field in declaration order (from_bus, to_bus, r_pu, x_pu,
+        b_pu, tap_ratio, shift_angle, rate_a, rate_b, rate_c, angmin, angmax,
+        status, circuit_id, name, description). Status and tap ratio are
+        validated for all rows up front; objects are then built without
+        going through __init__.
+
+        Args:
+            rows: Row tuples, one per branch
+
+        Returns:
+            List of Branch objects, in row order
+
+        Raises:
+            ValueError: If any row has an invalid status or a zero tap_ratio.
+        """
+        rows = list(rows)
+        if not _VALID_STATUS.issuperset([row[12] for row in rows]) or 0.0 in [
+            row[5] for row in rows
+        ]:
+            for row in rows:
+                cls(*row)  # Raises the __post_init__ error for the first bad row
+        return _branch_from_rows(rows)
+
     @property
     def is_transformer(self) -> bool:
         """Check if this branch is a transformer (tap_ratio != 1.0 or shift_angle != 0.0)."""
         return self.tap_ratio != 1.0 or self.shift_angle != 0.0
 
+    @property
+    def key(self) -> tuple[int, int, str]:
+        """Get the (from_bus, to_bus, circuit_id) tuple identifying this branch.
+
+        Branch objects are mutable and therefore unhashable; use this key to
+        index branches in dicts or sets, e.g., when grouping parallel
+        circuits between the same pair of buses.
+        """
+        return (self.from_bus, self.to_bus, self.circuit_id)
+
     @property
     def is_in_service(self) -> bool:
         """Check if this branch is in service."""
@@ -99,17 +151,24 @@ class Branch:
     @property
     def branch_type_name(self) -> str:
         """Get human-readable branch type name."""
-        if self.is_transformer:
-            if self.shift_angle != 0.0:
-                return "Phase-Shifting Transformer"
-            return "Transformer"
-        return "Transmission Line"
+        if self.shift_angle != 0.0:
+            return _BRANCH_TYPE_NAMES[2]
+        return _BRANCH_TYPE_NAMES[self.tap_ratio != 1.0]
 
     @property
     def impedance_pu(self) -> complex:
         """Get series impedance as complex number [p.u.]."""
         return complex(self.r_pu, self.x_pu)
 
+    @property
+    def admittance_pu(self) -> complex:
+        """Get series admittance 1 / (r + jx) as complex number [p.u.].
+
+        Raises:
+            ZeroDivisionError: If both r_pu and x_pu are zero.
+        """
+        return 1.0 / complex(self.r_pu, self.x_pu)
+
     def to_description(self) -> str:
         """Generate human/LLM-readable description of this branch.
 
@@ -126,32 +185,45 @@ class Branch:
         """
         name_str = f" ({self.name})" if self.name else ""
         status_str = "In-service" if self.is_in_service else "Out-of-service"
+        charging_str = f"\n  Charging: B = {self.b_pu:.4f} pu" if self.b_pu != 0.0 else ""
+        tap_str = (
+            f"\n  Tap: {self.tap_ratio:.4f}, Shift: {math.degrees(self.shift_angle):.2f}°"
+            if self.is_transformer
+            else ""
+        )
+        rating_str = f"\n  Rating: {self.rate_a:.1f} MVA" if self.rate_a is not None else ""
+
+        angle_str = ""
+        if self.angmin is not None or self.angmax is not None:
+            min_str = f"{math.degrees(self.angmin):.1f}°" if self.angmin is not None else "-∞"
+            max_str = f"{math.degrees(self.angmax):.1f}°" if self.angmax is not None else "+∞"
+            angle_str = f"\n  Angle limits: [{min_str}, {max_str}]"
 
-        lines = [
-            f"Branch {self.from_bus}-{self.to_bus}{name_str}: {self.branch_type_name}",
-            f"  Impedance: {self.r_pu:.4f} + j{self.x_pu:.4f} pu",
-        ]
+        note_str = f"\n  Note: {self.description}" if self.description else ""
 
-        if self.b_pu != 0.0:
-            lines.append(f"  Charging: B = {self.b_pu:.4f} pu")
+        return (
+            f"Branch {self.from_bus}-{self.to_bus}{name_str}: {self.branch_type_name}\n"
+            f"  Impedance: {self.r_pu:.4f} + j{self.x_pu:.4f} pu"
+            f"{charging_str}{tap_str}{rating_str}{angle_str}\n"
+            f"  Status: {status_str}{note_str}"
+        )
 
-        if self.is_transformer:
-            shift_deg = self.shift_angle * 180.0 / math.pi
-            lines.append(f"  Tap: {self.tap_ratio:.4f}, Shift: {shift_deg:.2f}°")
+    def write_description(self, out: IO[str]) -> None:
+        """Write this branch's description, followed by a newline, to a text stream.
 
-        if self.rate_a is not None:
-            lines.append(f"  Rating: {self.rate_a:.1f} MVA")
+        Lets bulk reports stream many records into one buffer or file
+        instead of collecting a list of strings and joining it.
 
-        if self.angmin is not None or self.angmax is not None:
-            angmin_deg = math.degrees(self.angmin) if self.angmin is not None else None
-            angmax_deg = math.degrees(self.angmax) if self.angmax is not None else None
-            min_str = f"{angmin_deg:.1f}°" if angmin_deg is not None else "-∞"
-            max_str = f"{angmax_deg:.1f}°" if angmax_deg is not None else "+∞"
-            lines.append(f"  Angle limits: [{min_str}, {max_str}]")
+        Args:
+            out: Writable text stream (e.g., io.StringIO or an open file)
 
-        lines.append(f"  Status: {status_str}")
+        Example:
+            >>> buf = io.StringIO()
+            >>> for branch in system.branches:
+            ...     branch.write_description(buf)
+        """
+        out.write(self.to_description())
+        out.write("\n")
 
-        if self.description:
-            lines.append(f"  Note: {self.description}")
 
-        return "\n".join(lines)
+_branch_from_rows = make_row_constructor(Branch)
@@ -0,0 +1,356 @@
+"""Structure-of-arrays container for branch data.
+
+This module defines the BranchArray class, a column-oriented (structure-of-arrays)
+view of a list of Branch objects. Each numeric attribute is stored in its own
+contiguous NumPy array so that per-branch quantities (series admittance,
+tap ratios, ratings) can be computed for the whole network in one vectorized
+pass instead of a Python loop over Branch objects.
+
+Note:
+    This module requires the optional NumPy dependency. Install with:
+    pip install psforge-grid[numpy]
+
+Example:
+    >>> from psforge_grid.models.branch_array import BranchArray
+    >>> branches = BranchArray.from_branches(system.branches)
+    >>> y_series = 1.0 / (branches.r_pu + 1j * branches.x_pu)
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+try:
+    import numpy as np
+except ImportError as e:
+    raise ImportError(
+        "BranchArray requires NumPy.\nPlease install with: pip install psforge-grid[numpy]"
+    ) from e
+
+from psforge_grid.models.branch import Branch
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+    from psforge_grid.models.bus_array import BusArray
+
+
+# Fixed little-endian record layout of one branch, field for field with the
+# BranchArray columns. Binary case files or shared memory in this layout can be
+# loaded with np.fromfile()/np.memmap() and passed to BranchArray.from_records().
+_BRANCH_RECORD_FIELDS: tuple[tuple[str, str], ...] = (
+    ("from_bus", "<i4"),
+    ("to_bus", "<i4"),
+    ("r_pu", "<f8"),
+    ("x_pu", "<f8"),
+    ("b_pu", "<f8"),
+    ("tap_ratio", "<f8"),
+    ("shift_angle", "<f8"),
+    ("rate_a", "<f8"),
+    ("rate_b", "<f8"),
+    ("rate_c", "<f8"),
+    ("angmin", "<f8"),
+    ("angmax", "<f8"),
+    ("status", "i1"),
+)
+BRANCH_DTYPE = np.dtype(list(_BRANCH_RECORD_FIELDS))
+
+
+@dataclass
+class BranchArray:
+    """Column-oriented branch data for vectorized computation.
+
+    Row i of every array describes the i-th branch of the sequence passed to
+    from_branches(), so results computed on the arrays can be mapped back to
+    System.branches by position. Only numeric attributes are stored; circuit
+    IDs, names and descriptions stay on the Branch objects.
+
+    Optional ratings and angle limits that are None on the Branch objects
+    are stored as NaN, so "unset" needs no separate object per field and
+    NaN-aware reductions (np.nanmax, np.fmin, ...) skip unset entries. Use
+    has_rate_a / has_angle_limits where the None check is needed explicitly.
+
+    Attributes:
+        from_bus: From-bus IDs (int32)
+        to_bus: To-bus IDs (int32)
+        r_pu: Series resistance [p.u.] (float64)
+        x_pu: Series reactance [p.u.] (float64)
+        b_pu: Total line charging susceptance [p.u.] (float64)
+        tap_ratio: Off-nominal tap ratio (float64)
+        shift_angle: Phase shift angle [rad] (float64)
+        rate_a: Continuous thermal rating [MVA], NaN if unlimited (float64)
+        rate_b: Short-term thermal rating [MVA], NaN if unset (float64)
+        rate_c: Emergency thermal rating [MVA], NaN if unset (float64)
+        angmin: Minimum angle difference [rad], NaN if unlimited (float64)
+        angmax: Maximum angle difference [rad], NaN if unlimited (float64)
+        status: Operating status, 1: in-service, 0: out-of-service (int8)
+
+    Example:
+        >>> arr = BranchArray.from_branches(system.branches)
+        >>> n_xfmr = int((arr.tap_ratio != 1.0).sum())
+    """
+
+    from_bus: NDArray[np.int32]
+    to_bus: NDArray[np.int32]
+    r_pu: NDArray[np.float64]
+    x_pu: NDArray[np.float64]
+    b_pu: NDArray[np.float64]
+    tap_ratio: NDArray[np.float64]
+    shift_angle: NDArray[np.float64]
+    rate_a: NDArray[np.float64]
+    rate_b: NDArray[np.float64]
+    rate_c: NDArray[np.float64]
+    angmin: NDArray[np.float64]
+    angmax: NDArray[np.float64]
+    status: NDArray[np.int8]
+
+    @classmethod
+    def from_branches(cls, branches: Sequence[Branch]) -> BranchArray:
+        """Build a BranchArray from a sequence of Branch objects.
+
+        Args:
+            branches: Branches to convert (e.g., System.branches)
+
+        Returns:
+            BranchArray with one row per branch, in the same order
+        """
+        n = len(branches)
+        nan = float("nan")
+        return cls(
+            from_bus=np.fromiter((b.from_bus for b in branches), dtype=np.int32, count=n),
+            to_bus=np.fromiter((b.to_bus for b in branches), dtype=np.int32, count=n),
+            r_pu=np.fromiter((b.r_pu for b in branches), dtype=np.float64, count=n),
+            x_pu=np.fromiter((b.x_pu for b in branches), dtype=np.float64, count=n),
+            b_pu=np.fromiter((b.b_pu for b in branches), dtype=np.float64, count=n),
+            tap_ratio=np.fromiter((b.tap_ratio for b in branches), dtype=np.float64, count=n),
+            shift_angle=np.fromiter((b.shift_angle for b in branches), dtype=np.float64, count=n),
+            rate_a=np.fromiter(
+                (nan if b.rate_a is None else b.rate_a for b in branches),
+                dtype=np.float64,
+                count=n,
+            ),
+            rate_b=np.fromiter(
+                (nan if b.rate_b is None else b.rate_b for b in branches),
+                dtype=np.float64,
+                count=n,
+            ),
+            rate_c=np.fromiter(
+                (nan if b.rate_c is None else b.rate_c for b in branches),
+                dtype=np.float64,
+                count=n,
+            ),
+            angmin=np.fromiter(
+                (nan if b.angmin is None else b.angmin for b in branches),
+                dtype=np.float64,
+                count=n,
+            ),
+            angmax=np.fromiter(
+                (nan if b.angmax is None else b.angmax for b in branches),
+                dtype=np.float64,
+                count=n,
+            ),
+            status=np.fromiter((b.status for b in branches), dtype=np.int8, count=n),
+        )
+
+    def __len__(self) -> int:
+        """Return the number of branches."""
+        return len(self.from_bus)
+
+    @classmethod
+    def from_records(cls, records: NDArray[np.void]) -> BranchArray:
+        """Build a BranchArray from a structured array with BRANCH_DTYPE fields.
+
+        Each column is copied out into its own contiguous array, so the
+        result does not keep the record buffer (e.g., a memmap) alive.
+
+        Args:
+            records: Structured array containing at least the BRANCH_DTYPE fields
+
+        Returns:
+            BranchArray with one row per record
+
+        Raises:
+            ValueError: If a required field is missing from records
+        """
+        names = records.dtype.names or ()
+        missing = [name for name, _ in _BRANCH_RECORD_FIELDS if name not in names]
+        if missing:
+            raise ValueError(f"Record array is missing branch fields: {missing}")
+        return cls(
+            **{
+                name: np.ascontiguousarray(records[name], dtype=fmt)
+                for name, fmt in _BRANCH_RECORD_FIELDS
+            }
+        )
+
+    def to_records(self) -> NDArray[np.void]:
+        """Pack the columns into a structured array with dtype BRANCH_DTYPE.
+
+        Returns:
+            Structured array with one record per branch, suitable for
+            ndarray.tofile() or shared memory
+        """
+        records = np.empty(len(self), dtype=BRANCH_DTYPE)
+        for name, _ in _BRANCH_RECORD_FIELDS:
+            records[name] = getattr(self, name)
+        return records
+
+    @property
+    def in_service(self) -> NDArray[np.bool_]:
+        """Boolean mask of in-service branches (status == 1)."""
+        return np.equal(self.status, 1)
+
+    @property
+    def has_rate_a(self) -> NDArray[np.bool_]:
+        """Boolean mask of branches with a continuous rating (rate_a not NaN)."""
+        return np.logical_not(np.isnan(self.rate_a))
+
+    @property
+    def has_angle_limits(self) -> NDArray[np.bool_]:
+        """Boolean mask of branches with angmin and/or angmax set."""
+        return np.logical_not(np.isnan(self.angmin) & np.isnan(self.angmax))
+
+    def compute_admittances(
+        self,
+    ) -> tuple[
+        NDArray[np.complex128],
+        NDArray[np.complex128],
+        NDArray[np.complex128],
+        NDArray[np.complex128],
+    ]:
+        """Compute the pi-model branch admittance terms for all branches.
+
+        For each branch with series admittance ys = 1 / (r + jx), total
+        charging susceptance b and complex tap t = tap_ratio * exp(j*shift),
+        the two-port admittance matrix is::
+
+            [I_f]   [Yff  Yft] [V_f]
+            [I_t] = [Ytf  Ytt] [V_t]
+
+            Ytt = ys + j*b/2
+            Yff = Ytt / |t|^2
+            Yft = -ys / conj(t)
+            Ytf = -ys / t
+
+        These four vectors are the per-branch contributions that are summed
+        into the bus admittance matrix (Ybus).
+
+        Returns:
+            Tuple of (Yff, Yft, Ytf, Ytt) complex arrays [p.u.], one entry
+            per branch. Out-of-service branches contribute zeros.
+
+        Note:
+            In-service branches with zero series impedance (r = x = 0)
+            produce non-finite values; such branches must be merged or given a
+            small impedance before network analysis.
+        """
+        in_service = self.in_service
+        z = self.r_pu + 1j * self.x_pu
+        # Divide only where in service, so switched-off zero-impedance
+        # branches (bus ties) give exact zeros instead of 0/0 = NaN
+        ys: NDArray[np.complex128] = np.divide(1.0, z, out=np.zeros_like(z), where=in_service)
+        tap: NDArray[np.complex128] = self.tap_ratio * np.exp(1j * self.shift_angle)
+        ytt: NDArray[np.complex128] = ys + in_service * (0.5j * self.b_pu)
+        yff: NDArray[np.complex128] = np.divide(
+            ytt, self.tap_ratio * self.tap_ratio, out=np.zeros_like(ytt), where=in_service
+        )
+        yft: NDArray[np.complex128] = -ys / np.conj(tap)
+        ytf: NDArray[np.complex128] = -ys / tap
+        return yff, yft, ytf, ytt
+
+    def ybus_coo(
+        self, buses: BusArray
+    ) -> tuple[NDArray[np.complex128], NDArray[np.intp], NDArray[np.intp]]:
+        """Build the branch part of the bus admittance matrix in COO form.
+
+        Each branch contributes its four pi-model terms directly as
+        (value, row, col) triplets, so no connection matrices or
+        intermediate sparse products are formed. Duplicate (row, col) pairs
+        (parallel branches, several branches at one bus) are left to be
+        summed by the consumer, e.g.::
+
+            scipy.sparse.coo_matrix((values, (rows, cols)), shape=(n, n)).tocsr()
+
+        Bus shunt admittances are not included.
+
+        Args:
+            buses: Buses defining the row/column order of the matrix
+
+        Returns:
+            Tuple of (values, rows, cols) arrays of length 4 * len(self)
+
+        Raises:
+            ValueError: If a branch refers to a bus ID not in buses
+        """
+        f = buses.positions(self.from_bus)
+        t = buses.positions(self.to_bus)
+        yff, yft, ytf, ytt = self.compute_admittances()
+        values = np.concatenate((yff, yft, ytf, ytt))
+        rows = np.concatenate((f, f, t, t))
+        cols = np.concatenate((f, t, f, t))
+        return values, rows, cols
+
+    def bus_adjacency(
+        self, buses: BusArray, in_service_only: bool = True
+    ) -> tuple[NDArray[np.intp], NDArray[np.intp]]:
+        """Build the bus-to-branch incidence in compressed sparse row form.
+
+        Array counterpart of System.get_branches_at_bus() for every bus at
+        once: the branches at the bus in row i of buses are
+        branch_idx[indptr[i]:indptr[i + 1]], as row positions in this
+        array, in ascending order. Each branch is listed under both of its
+        terminal buses, and a branch from a bus to itself is listed once.
+
+        Args:
+            buses: Buses defining the row order of the adjacency
+            in_service_only: If True, only include in-service branches (default: True)
+
+        Returns:
+            Tuple of (indptr, branch_idx), with len(indptr) == len(buses) + 1
+
+        Raises:
+            ValueError: If a branch refers to a bus ID not in buses
+
+        Example:
+            >>> indptr, branch_idx = arr.bus_adjacency(buses)
+            >>> at_first_bus = branch_idx[indptr[0] : indptr[1]]
+        """
+        f = buses.positions(self.from_bus)
+        t = buses.positions(self.to_bus)
+        idx = np.arange(len(self), dtype=np.intp)
+        if in_service_only:
+            mask = self.in_service
+            f, t, idx = f[mask], t[mask], idx[mask]
+        other_end = f != t
+        bus_pos = np.concatenate((f, t[other_end]))
+        branch_idx = np.concatenate((idx, idx[other_end]))
+        order = np.lexsort((branch_idx, bus_pos))
+        indptr = np.zeros(len(buses) + 1, dtype=np.intp)
+        np.cumsum(np.bincount(bus_pos, minlength=len(buses)), out=indptr[1:])
+        return indptr, branch_idx[order]
+
+    def build_ybus(self, buses: BusArray) -> NDArray[np.complex128]:
+        """Build the branch part of the bus admittance matrix as a dense array.
+
+        Convenience for small and medium systems; use ybus_coo() with a
+        sparse matrix library for large networks. Bus shunt admittances are
+        not included.
+
+        Args:
+            buses: Buses defining the row/column order of the matrix
+
+        Returns:
+            Complex (n_bus, n_bus) admittance matrix [p.u.]
+
+        Raises:
+            ValueError: If a branch refers to a bus ID not in buses
+        """
+        values, rows, cols = self.ybus_coo(buses)
+        n = len(buses)
+        flat = rows * n + cols
+        ybus: NDArray[np.complex128] = np.bincount(flat, weights=values.real, minlength=n * n) + (
+            1j * np.bincount(flat, weights=values.imag, minlength=n * n)
+        )
+        return ybus.reshape(n, n)
@@ -5,10 +5,21 @@ This module defines the Bus class representing electrical buses in a power syste
 
 from __future__ import annotations
 
+import math
+from collections.abc import Iterable
 from dataclasses import dataclass
+from typing import IO, Any
 
+from psforge_grid.models._bulk import make_row_constructor
 
-@dataclass
+# Bus type codes accepted by Bus: PQ, PV, Slack, Isolated
+_VALID_BUS_TYPES: frozenset[int] = frozenset((1, 2, 3, 4))
+
+# Display names indexed by bus_type - 1
+_BUS_TYPE_NAMES: tuple[str, str, str, str] = ("PQ (Load)", "PV (Generator)", "Slack", "Isolated")
+
+
+@dataclass(slots=True)
 class Bus:
     """Bus data class for power system analysis.
 
@@ -64,12 +75,37 @@ class Bus:
         Raises:
             ValueError: If bus_type is not 1, 2, 3, or 4.
         """
-        if self.bus_type not in [1, 2, 3, 4]:
+        if self.bus_type not in _VALID_BUS_TYPES:
             raise ValueError(
                 f"Invalid bus_type: {self.bus_type}. "
                 "Must be 1 (PQ), 2 (PV), 3 (Slack), or 4 (Isolated)."
             )
 
+    @classmethod
+    def from_rows(cls, rows: Iterable[tuple[Any, ...]]) -> list[Bus]:
+        """Create many buses at once from row tuples.
+
+        Bulk counterpart of Bus(...) for parsers. Each row holds one value
+        per field in declaration order (bus_id, bus_type, v_magnitude,
+        v_angle, base_kv, area, zone, v_max, v_min, name, description).
+        Bus types are validated for all rows up front; objects are then
+        built without going through __init__.
+
+        Args:
+            rows: Row tuples, one per bus
+
+        Returns:
+            List of Bus objects, in row order
+
+        Raises:
+            ValueError: If any row has an invalid bus_type.
+        """
+        rows = list(rows)
+        if not _VALID_BUS_TYPES.issuperset([row[1] for row in rows]):
+            for row in rows:
+                cls(*row)  # Raises the __post_init__ error for the first bad row
+        return _bus_from_rows(rows)
+
     @property
     def is_pq(self) -> bool:
         """Check if this is a PQ (load) bus."""
@@ -93,8 +129,10 @@ class Bus:
     @property
     def bus_type_name(self) -> str:
         """Get human-readable bus type name."""
-        type_names = {1: "PQ (Load)", 2: "PV (Generator)", 3: "Slack", 4: "Isolated"}
-        return type_names.get(self.bus_type, f"Unknown ({self.bus_type})")
+        bus_type = self.bus_type
+        if 1 <= bus_type <= 4:
+            return _BUS_TYPE_NAMES[bus_type - 1]
+        return f"Unknown ({bus_type})"
 
     def to_description(self) -> str:
         """Generate human/LLM-readable description of this bus.
@@ -110,15 +148,30 @@ class Bus:
               Limits: 0.90 - 1.10 pu
         """
         name_str = f" ({self.name})" if self.name else ""
-        v_angle_deg = self.v_angle * 180.0 / 3.14159265359
+        note_str = f"\n  Note: {self.description}" if self.description else ""
+
+        return (
+            f"Bus {self.bus_id}{name_str}: {self.bus_type_name} at {self.base_kv:.1f} kV\n"
+            f"  Voltage: {self.v_magnitude:.4f} pu @ {math.degrees(self.v_angle):.2f}°\n"
+            f"  Limits: {self.v_min:.2f} - {self.v_max:.2f} pu{note_str}"
+        )
+
+    def write_description(self, out: IO[str]) -> None:
+        """Write this bus's description, followed by a newline, to a text stream.
 
-        lines = [
-            f"Bus {self.bus_id}{name_str}: {self.bus_type_name} at {self.base_kv:.1f} kV",
-            f"  Voltage: {self.v_magnitude:.4f} pu @ {v_angle_deg:.2f}°",
-            f"  Limits: {self.v_min:.2f} - {self.v_max:.2f} pu",
-        ]
+        Lets bulk reports stream many records into one buffer or file
+        instead of collecting a list of strings and joining it.
+
+        Args:
+            out: Writable text stream (e.g., io.StringIO or an open file)
+
+        Example:
+            >>> buf = io.StringIO()
+            >>> for bus in system.buses:
+            ...     bus.write_description(buf)
+        """
+        out.write(self.to_description())
+        out.write("\n")
 
-        if self.description:
-            lines.append(f"  Note: {self.description}")
 
-        return "\n".join(lines)
+_bus_from_rows = make_row_constructor(Bus)
@@ -0,0 +1,260 @@
+"""Structure-of-arrays container for bus data.
+
+This module defines the BusArray class, a column-oriented (structure-of-arrays)
+view of a list of Bus objects. Each numeric attribute is stored in its own
+contiguous NumPy array, which is the layout vectorized analysis code
+(Ybus assembly, power flow, voltage screening) works on.
+
+Note:
+    This module requires the optional NumPy dependency. Install with:
+    pip install psforge-grid[numpy]
+
+Example:
+    >>> from psforge_grid.models.bus_array import BusArray
+    >>> buses = BusArray.from_buses(system.buses)
+    >>> buses.v_magnitude.min()  # Lowest voltage in the system [p.u.]
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+try:
+    import numpy as np
+except ImportError as e:
+    raise ImportError(
+        "BusArray requires NumPy.\nPlease install with: pip install psforge-grid[numpy]"
+    ) from e
+
+from psforge_grid.models.bus import Bus
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+    from psforge_grid.models.generator_array import GeneratorArray
+    from psforge_grid.models.load_array import LoadArray
+
+
+# Fixed little-endian record layout of one bus, field for field with the
+# BusArray columns. Binary case files or shared memory in this layout can be
+# loaded with np.fromfile()/np.memmap() and passed to BusArray.from_records().
+_BUS_RECORD_FIELDS: tuple[tuple[str, str], ...] = (
+    ("bus_id", "<i4"),
+    ("bus_type", "i1"),
+    ("v_magnitude", "<f8"),
+    ("v_angle", "<f8"),
+    ("base_kv", "<f8"),
+    ("area", "<i4"),
+    ("zone", "<i4"),
+    ("v_max", "<f8"),
+    ("v_min", "<f8"),
+)
+BUS_DTYPE = np.dtype(list(_BUS_RECORD_FIELDS))
+
+
+@dataclass
+class BusArray:
+    """Column-oriented bus data for vectorized computation.
+
+    Row i of every array describes the i-th bus of the sequence passed to
+    from_buses(), so results computed on the arrays can be mapped back to
+    System.buses by position. Only numeric attributes are stored; names and
+    descriptions stay on the Bus objects.
+
+    Attributes:
+        bus_id: Bus IDs (int32)
+        bus_type: Bus type codes, 1: PQ, 2: PV, 3: Slack, 4: Isolated (int8)
+        v_magnitude: Voltage magnitude [p.u.] (float64)
+        v_angle: Voltage angle [rad] (float64)
+        base_kv: Base voltage [kV] (float64)
+        area: Area numbers (int32)
+        zone: Zone numbers (int32)
+        v_max: Maximum voltage limit [p.u.] (float64)
+        v_min: Minimum voltage limit [p.u.] (float64)
+
+    The bus-type masks and index arrays (is_pq_mask, pq_idx, ...) are
+    computed from bus_type on each access rather than cached, so they stay
+    correct when bus types are switched in place (e.g., PV to PQ on reactive
+    limit violation during power flow).
+
+    Example:
+        >>> arr = BusArray.from_buses(system.buses)
+        >>> low = arr.bus_id[arr.v_magnitude < 0.95]  # IDs of low-voltage buses
+        >>> v_pq = arr.v_magnitude[arr.pq_idx]  # Voltages of load buses
+    """
+
+    bus_id: NDArray[np.int32]
+    bus_type: NDArray[np.int8]
+    v_magnitude: NDArray[np.float64]
+    v_angle: NDArray[np.float64]
+    base_kv: NDArray[np.float64]
+    area: NDArray[np.int32]
+    zone: NDArray[np.int32]
+    v_max: NDArray[np.float64]
+    v_min: NDArray[np.float64]
+
+    @classmethod
+    def from_buses(cls, buses: Sequence[Bus]) -> BusArray:
+        """Build a BusArray from a sequence of Bus objects.
+
+        Args:
+            buses: Buses to convert (e.g., System.buses)
+
+        Returns:
+            BusArray with one row per bus, in the same order
+        """
+        n = len(buses)
+        return cls(
+            bus_id=np.fromiter((b.bus_id for b in buses), dtype=np.int32, count=n),
+            bus_type=np.fromiter((b.bus_type for b in buses), dtype=np.int8, count=n),
+            v_magnitude=np.fromiter((b.v_magnitude for b in buses), dtype=np.float64, count=n),
+            v_angle=np.fromiter((b.v_angle for b in buses), dtype=np.float64, count=n),
+            base_kv=np.fromiter((b.base_kv for b in buses), dtype=np.float64, count=n),
+            area=np.fromiter((b.area for b in buses), dtype=np.int32, count=n),
+            zone=np.fromiter((b.zone for b in buses), dtype=np.int32, count=n),
+            v_max=np.fromiter((b.v_max for b in buses), dtype=np.float64, count=n),
+            v_min=np.fromiter((b.v_min for b in buses), dtype=np.float64, count=n),
+        )
+
+    def __len__(self) -> int:
+        """Return the number of buses."""
+        return len(self.bus_id)
+
+    @classmethod
+    def from_records(cls, records: NDArray[np.void]) -> BusArray:
+        """Build a BusArray from a structured array with BUS_DTYPE fields.
+
+        Each column is copied out into its own contiguous array, so the
+        result does not keep the record buffer (e.g., a memmap) alive.
+
+        Args:
+            records: Structured array containing at least the BUS_DTYPE fields
+
+        Returns:
+            BusArray with one row per record
+
+        Raises:
+            ValueError: If a required field is missing from records
+        """
+        names = records.dtype.names or ()
+        missing = [name for name, _ in _BUS_RECORD_FIELDS if name not in names]
+        if missing:
+            raise ValueError(f"Record array is missing bus fields: {missing}")
+        return cls(
+            **{
+                name: np.ascontiguousarray(records[name], dtype=fmt)
+                for name, fmt in _BUS_RECORD_FIELDS
+            }
+        )
+
+    def to_records(self) -> NDArray[np.void]:
+        """Pack the columns into a structured array with dtype BUS_DTYPE.
+
+        Returns:
+            Structured array with one record per bus, suitable for
+            ndarray.tofile() or shared memory
+        """
+        records = np.empty(len(self), dtype=BUS_DTYPE)
+        for name, _ in _BUS_RECORD_FIELDS:
+            records[name] = getattr(self, name)
+        return records
+
+    @property
+    def is_pq_mask(self) -> NDArray[np.bool_]:
+        """Boolean mask of PQ (load) buses."""
+        return np.equal(self.bus_type, 1)
+
+    @property
+    def is_pv_mask(self) -> NDArray[np.bool_]:
+        """Boolean mask of PV (generator) buses."""
+        return np.equal(self.bus_type, 2)
+
+    @property
+    def is_slack_mask(self) -> NDArray[np.bool_]:
+        """Boolean mask of slack (reference) buses."""
+        return np.equal(self.bus_type, 3)
+
+    @property
+    def pq_idx(self) -> NDArray[np.intp]:
+        """Row positions of PQ buses, in ascending order."""
+        return np.flatnonzero(self.bus_type == 1)
+
+    @property
+    def pv_idx(self) -> NDArray[np.intp]:
+        """Row positions of PV buses, in ascending order."""
+        return np.flatnonzero(self.bus_type == 2)
+
+    @property
+    def slack_idx(self) -> NDArray[np.intp]:
+        """Row positions of slack buses, in ascending order."""
+        return np.flatnonzero(self.bus_type == 3)
+
+    def positions(self, bus_ids: Iterable[int] | NDArray[np.integer]) -> NDArray[np.intp]:
+        """Map bus IDs to row positions in this array.
+
+        Vectorized counterpart of System.get_bus_index(), used to turn
+        branch from_bus/to_bus IDs into matrix row/column indices.
+
+        Args:
+            bus_ids: Bus IDs to look up
+
+        Returns:
+            Array of 0-based row positions, one per requested ID
+
+        Raises:
+            ValueError: If any requested bus ID is not present
+        """
+        ids = np.asarray(bus_ids if isinstance(bus_ids, np.ndarray) else list(bus_ids))
+        if ids.size == 0:
+            return np.empty(0, dtype=np.intp)
+        order = np.argsort(self.bus_id, kind="stable")
+        sorted_ids = self.bus_id[order]
+        found = np.searchsorted(sorted_ids, ids)
+        found = np.minimum(found, max(len(sorted_ids) - 1, 0))
+        if len(sorted_ids) == 0 or not np.array_equal(sorted_ids[found], ids):
+            missing = sorted(set(ids.tolist()) - set(self.bus_id.tolist()))
+            raise ValueError(f"Bus IDs not found in system: {missing}")
+        return order[found]
+
+    def net_injections(
+        self, generators: GeneratorArray, loads: LoadArray
+    ) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """Compute net active and reactive power injection at every bus.
+
+        Vectorized counterpart of System.get_bus_pq_injection() for all
+        buses at once: in-service generation minus in-service load, scattered
+        onto bus rows with np.bincount.
+
+        Args:
+            generators: Generators of the system
+            loads: Loads of the system
+
+        Returns:
+            Tuple of (P_injection, Q_injection) arrays [p.u.], one entry per
+            bus in row order
+
+        Raises:
+            ValueError: If a generator or load refers to a bus ID not present
+
+        Example:
+            >>> p_inj, q_inj = buses.net_injections(
+            ...     GeneratorArray.from_generators(system.generators),
+            ...     LoadArray.from_loads(system.loads),
+            ... )
+        """
+        # Generators add and loads subtract, so both scatter in one bincount
+        pos = np.concatenate((self.positions(generators.bus_id), self.positions(loads.bus_id)))
+        gen_on = generators.status == 1
+        load_on = loads.status == 1
+        p = np.concatenate(
+            (np.where(gen_on, generators.p_gen, 0.0), np.where(load_on, -loads.p_load, 0.0))
+        )
+        q = np.concatenate(
+            (np.where(gen_on, generators.q_gen, 0.0), np.where(load_on, -loads.q_load, 0.0))
+        )
+        n = len(self)
+        p_inj = np.bincount(pos, weights=p, minlength=n).astype(np.float64, copy=False)
+        q_inj = np.bincount(pos, weights=q, minlength=n).astype(np.float64, copy=False)
+        return p_inj, q_inj
@@ -17,6 +17,11 @@ Example:
 """
 
 from enum import Enum
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import ArrayLike, NDArray
 
 
 class Severity(Enum):
@@ -120,6 +125,26 @@ class VoltageStatus(Enum):
         else:
             return cls.CRITICAL_HIGH
 
+    @classmethod
+    def classify_array(
+        cls,
+        v_pu: "ArrayLike",
+        v_min: float = 0.95,
+        v_max: float = 1.05,
+        critical_margin: float = 0.05,
+    ) -> "NDArray[np.int8]":
+        """Classify an array of voltage magnitudes (requires NumPy).
+
+        Vectorized counterpart of from_value(); see
+        psforge_grid.models.status_array.classify_voltages().
+
+        Returns:
+            int8 array of codes indexing status_array.VOLTAGE_STATUS_CODES
+        """
+        from psforge_grid.models.status_array import classify_voltages
+
+        return classify_voltages(v_pu, v_min, v_max, critical_margin)
+
     @property
     def is_classified(self) -> bool:
         """Check if voltage status has been classified.
@@ -142,7 +167,7 @@ class VoltageStatus(Enum):
 
         Returns False if status is NOT_CLASSIFIED (no judgment made).
         """
-        return self not in (VoltageStatus.NORMAL, VoltageStatus.NOT_CLASSIFIED)
+        return self not in _VOLTAGE_NON_VIOLATIONS
 
     @property
     def is_critical(self) -> bool:
@@ -150,7 +175,7 @@ class VoltageStatus(Enum):
 
         Returns False if status is NOT_CLASSIFIED (no judgment made).
         """
-        return self in (VoltageStatus.CRITICAL_LOW, VoltageStatus.CRITICAL_HIGH)
+        return self in _VOLTAGE_CRITICAL
 
     @property
     def severity(self) -> Severity:
@@ -158,12 +183,23 @@ class VoltageStatus(Enum):
 
         Returns INFO if status is NOT_CLASSIFIED.
         """
-        if self in (VoltageStatus.NORMAL, VoltageStatus.NOT_CLASSIFIED):
-            return Severity.INFO
-        elif self in (VoltageStatus.LOW, VoltageStatus.HIGH):
-            return Severity.WARNING
-        else:
-            return Severity.CRITICAL
+        return _VOLTAGE_SEVERITY[self._value_]
+
+
+# Member groups and severity table for VoltageStatus properties. Resolving a
+# member through the Enum class (VoltageStatus.NORMAL) goes through the
+# metaclass on every call, so the properties read these precomputed values.
+# The severity table is keyed by the string value, whose hash is cached.
+_VOLTAGE_NON_VIOLATIONS = (VoltageStatus.NORMAL, VoltageStatus.NOT_CLASSIFIED)
+_VOLTAGE_CRITICAL = (VoltageStatus.CRITICAL_LOW, VoltageStatus.CRITICAL_HIGH)
+_VOLTAGE_SEVERITY: dict[str, Severity] = {
+    "NOT_CLASSIFIED": Severity.INFO,
+    "CRITICAL_LOW": Severity.CRITICAL,
+    "LOW": Severity.WARNING,
+    "NORMAL": Severity.INFO,
+    "HIGH": Severity.WARNING,
+    "CRITICAL_HIGH": Severity.CRITICAL,
+}
 
 
 class LoadingStatus(Enum):
@@ -239,6 +275,28 @@ class LoadingStatus(Enum):
         else:
             return cls.OVERLOAD
 
+    @classmethod
+    def classify_array(
+        cls,
+        loading_percent: "ArrayLike",
+        light_threshold: float = 50.0,
+        heavy_threshold: float = 80.0,
+        overload_threshold: float = 100.0,
+    ) -> "NDArray[np.int8]":
+        """Classify an array of loading percentages (requires NumPy).
+
+        Vectorized counterpart of from_percent(); see
+        psforge_grid.models.status_array.classify_loadings().
+
+        Returns:
+            int8 array of codes indexing status_array.LOADING_STATUS_CODES
+        """
+        from psforge_grid.models.status_array import classify_loadings
+
+        return classify_loadings(
+            loading_percent, light_threshold, heavy_threshold, overload_threshold
+        )
+
     @property
     def is_classified(self) -> bool:
         """Check if loading status has been classified.
@@ -253,7 +311,7 @@ class LoadingStatus(Enum):
 
         Returns False if status is NOT_CLASSIFIED (no judgment made).
         """
-        return self in (LoadingStatus.LIGHT, LoadingStatus.NORMAL)
+        return self in _LOADING_NORMAL
 
     @property
     def is_overload(self) -> bool:
@@ -269,7 +327,7 @@ class LoadingStatus(Enum):
 
         Returns False if status is NOT_CLASSIFIED (no judgment made).
         """
-        return self in (LoadingStatus.HEAVY, LoadingStatus.OVERLOAD)
+        return self in _LOADING_HEAVY_OR_OVERLOAD
 
     @property
     def severity(self) -> Severity:
@@ -277,12 +335,20 @@ class LoadingStatus(Enum):
 
         Returns INFO if status is NOT_CLASSIFIED.
         """
-        if self in (LoadingStatus.LIGHT, LoadingStatus.NORMAL, LoadingStatus.NOT_CLASSIFIED):
-            return Severity.INFO
-        elif self == LoadingStatus.HEAVY:
-            return Severity.WARNING
-        else:
-            return Severity.ERROR
+        return _LOADING_SEVERITY[self._value_]
+
+
+# Member groups and severity table for LoadingStatus properties
+# (see the VoltageStatus tables above).
+_LOADING_NORMAL = (LoadingStatus.LIGHT, LoadingStatus.NORMAL)
+_LOADING_HEAVY_OR_OVERLOAD = (LoadingStatus.HEAVY, LoadingStatus.OVERLOAD)
+_LOADING_SEVERITY: dict[str, Severity] = {
+    "NOT_CLASSIFIED": Severity.INFO,
+    "LIGHT": Severity.INFO,
+    "NORMAL": Severity.INFO,
+    "HEAVY": Severity.WARNING,
+    "OVERLOAD": Severity.ERROR,
+}
 
 
 class ConvergenceStatus(Enum):
@@ -366,12 +432,11 @@ class SystemHealthStatus(Enum):
         Returns:
             SystemHealthStatus based on worst severity found
         """
-        if not severities:
-            return cls.HEALTHY
-
-        if any(s in (Severity.CRITICAL, Severity.ERROR) for s in severities):
+        # list.__contains__ scans in C with an identity check per element,
+        # which is far cheaper than a Python-level generator over findings.
+        if Severity.CRITICAL in severities or Severity.ERROR in severities:
             return cls.CRITICAL
-        elif any(s == Severity.WARNING for s in severities):
+        elif Severity.WARNING in severities:
             return cls.WARNING
         else:
             return cls.HEALTHY
@@ -402,13 +467,7 @@ class BusType(Enum):
 
     def __str__(self) -> str:
         """Return human-readable bus type name."""
-        names = {
-            BusType.PQ: "PQ (Load)",
-            BusType.PV: "PV (Generator)",
-            BusType.SLACK: "Slack (Reference)",
-            BusType.ISOLATED: "Isolated",
-        }
-        return names.get(self, f"Unknown ({self.value})")
+        return _BUS_TYPE_NAMES[self._value_]
 
     @classmethod
     def from_code(cls, code: int) -> "BusType":
@@ -431,9 +490,19 @@ class BusType(Enum):
     @property
     def is_generator(self) -> bool:
         """Check if bus type has generation (PV or Slack)."""
-        return self in (BusType.PV, BusType.SLACK)
+        return self in _BUS_TYPE_GENERATORS
 
     @property
     def is_load(self) -> bool:
         """Check if bus type is a load bus (PQ)."""
         return self == BusType.PQ
+
+
+# Display names and member groups for BusType (see the VoltageStatus tables above)
+_BUS_TYPE_NAMES: dict[int, str] = {
+    1: "PQ (Load)",
+    2: "PV (Generator)",
+    3: "Slack (Reference)",
+    4: "Isolated",
+}
+_BUS_TYPE_GENERATORS = (BusType.PV, BusType.SLACK)
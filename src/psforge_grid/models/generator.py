@@ -6,9 +6,13 @@ This module defines the Generator class representing power generation units.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import IO
 
+# Status codes accepted by Generator: out-of-service, in-service
+_VALID_STATUS: frozenset[int] = frozenset((0, 1))
 
-@dataclass
+
+@dataclass(slots=True)
 class Generator:
     """Generator data class for power generation units.
 
@@ -71,7 +75,7 @@ class Generator:
         Raises:
             ValueError: If status is not 0 or 1.
         """
-        if self.status not in [0, 1]:
+        if self.status not in _VALID_STATUS:
             raise ValueError(
                 f"Invalid status: {self.status}. Must be 0 (out-of-service) or 1 (in-service)."
             )
@@ -121,27 +125,43 @@ class Generator:
         name_str = f"{self.name}" if self.name else f"G{self.gen_id}"
         status_str = "In-service" if self.is_in_service else "Out-of-service"
 
-        lines = [
-            f"Generator {name_str} at Bus {self.bus_id}",
-            f"  Output: P = {self.p_gen:.4f} pu, Q = {self.q_gen:.4f} pu",
-            f"  Voltage setpoint: {self.v_setpoint:.2f} pu",
-        ]
-
         # P limits
+        p_limits_str = ""
         if self.p_min is not None or self.p_max is not None:
             p_min_str = f"{self.p_min:.2f}" if self.p_min is not None else "-∞"
             p_max_str = f"{self.p_max:.2f}" if self.p_max is not None else "+∞"
-            lines.append(f"  P limits: [{p_min_str}, {p_max_str}] pu")
+            p_limits_str = f"\n  P limits: [{p_min_str}, {p_max_str}] pu"
 
         # Q limits
+        q_limits_str = ""
         if self.q_min is not None or self.q_max is not None:
             q_min_str = f"{self.q_min:.2f}" if self.q_min is not None else "-∞"
             q_max_str = f"{self.q_max:.2f}" if self.q_max is not None else "+∞"
-            lines.append(f"  Q limits: [{q_min_str}, {q_max_str}] pu")
+            q_limits_str = f"\n  Q limits: [{q_min_str}, {q_max_str}] pu"
+
+        note_str = f"\n  Note: {self.description}" if self.description else ""
+
+        return (
+            f"Generator {name_str} at Bus {self.bus_id}\n"
+            f"  Output: P = {self.p_gen:.4f} pu, Q = {self.q_gen:.4f} pu\n"
+            f"  Voltage setpoint: {self.v_setpoint:.2f} pu"
+            f"{p_limits_str}{q_limits_str}\n"
+            f"  Status: {status_str}{note_str}"
+        )
 
-        lines.append(f"  Status: {status_str}")
+    def write_description(self, out: IO[str]) -> None:
+        """Write this generator's description, followed by a newline, to a text stream.
 
-        if self.description:
-            lines.append(f"  Note: {self.description}")
+        Lets bulk reports stream many records into one buffer or file
+        instead of collecting a list of strings and joining it.
 
-        return "\n".join(lines)
+        Args:
+            out: Writable text stream (e.g., io.StringIO or an open file)
+
+        Example:
+            >>> buf = io.StringIO()
+            >>> for gen in system.generators:
+            ...     gen.write_description(buf)
+        """
+        out.write(self.to_description())
+        out.write("\n")
@@ -0,0 +1,208 @@
+"""Structure-of-arrays container for generator data.
+
+This module defines the GeneratorArray class, a column-oriented
+(structure-of-arrays) view of a list of Generator objects. Each numeric
+attribute is stored in its own contiguous NumPy array so that fleet-wide
+operations (reactive limit checks, dispatch totals) run as single vectorized
+passes instead of a Python loop over Generator objects.
+
+Note:
+    This module requires the optional NumPy dependency. Install with:
+    pip install psforge-grid[numpy]
+
+Example:
+    >>> from psforge_grid.models.generator_array import GeneratorArray
+    >>> gens = GeneratorArray.from_generators(system.generators)
+    >>> total_p = gens.p_gen[gens.status == 1].sum()
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+try:
+    import numpy as np
+except ImportError as e:
+    raise ImportError(
+        "GeneratorArray requires NumPy.\nPlease install with: pip install psforge-grid[numpy]"
+    ) from e
+
+from psforge_grid.models.generator import Generator
+
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike, NDArray
+
+
+@dataclass
+class GeneratorArray:
+    """Column-oriented generator data for vectorized computation.
+
+    Row i of every array describes the i-th generator of the sequence passed
+    to from_generators(), so results computed on the arrays can be mapped
+    back to System.generators by position. Only numeric attributes are
+    stored; generator IDs, names and descriptions stay on the Generator
+    objects.
+
+    Active and reactive power limits that are None (unlimited) on the
+    Generator objects are stored as -inf (minimum) and +inf (maximum), so
+    limit checks and clipping need no special case for unset limits.
+
+    Attributes:
+        bus_id: Bus IDs where generators are connected (int32)
+        p_gen: Active power output [p.u.] (float64)
+        q_gen: Reactive power output [p.u.] (float64)
+        v_setpoint: Voltage setpoint [p.u.] (float64)
+        p_max: Maximum active power [p.u.], +inf if unlimited (float64)
+        p_min: Minimum active power [p.u.], -inf if unlimited (float64)
+        q_max: Maximum reactive power [p.u.], +inf if unlimited (float64)
+        q_min: Minimum reactive power [p.u.], -inf if unlimited (float64)
+        mbase: Machine base MVA (float64)
+        status: Operating status, 1: in-service, 0: out-of-service (int8)
+
+    Example:
+        >>> arr = GeneratorArray.from_generators(system.generators)
+        >>> within, q_limited = arr.check_q_limits(q_calc)
+    """
+
+    bus_id: NDArray[np.int32]
+    p_gen: NDArray[np.float64]
+    q_gen: NDArray[np.float64]
+    v_setpoint: NDArray[np.float64]
+    p_max: NDArray[np.float64]
+    p_min: NDArray[np.float64]
+    q_max: NDArray[np.float64]
+    q_min: NDArray[np.float64]
+    mbase: NDArray[np.float64]
+    status: NDArray[np.int8]
+
+    @classmethod
+    def from_generators(cls, generators: Sequence[Generator]) -> GeneratorArray:
+        """Build a GeneratorArray from a sequence of Generator objects.
+
+        Args:
+            generators: Generators to convert (e.g., System.generators)
+
+        Returns:
+            GeneratorArray with one row per generator, in the same order
+        """
+        n = len(generators)
+        inf = float("inf")
+        return cls(
+            bus_id=np.fromiter((g.bus_id for g in generators), dtype=np.int32, count=n),
+            p_gen=np.fromiter((g.p_gen for g in generators), dtype=np.float64, count=n),
+            q_gen=np.fromiter((g.q_gen for g in generators), dtype=np.float64, count=n),
+            v_setpoint=np.fromiter((g.v_setpoint for g in generators), dtype=np.float64, count=n),
+            p_max=np.fromiter(
+                (inf if g.p_max is None else g.p_max for g in generators),
+                dtype=np.float64,
+                count=n,
+            ),
+            p_min=np.fromiter(
+                (-inf if g.p_min is None else g.p_min for g in generators),
+                dtype=np.float64,
+                count=n,
+            ),
+            q_max=np.fromiter(
+                (inf if g.q_max is None else g.q_max for g in generators),
+                dtype=np.float64,
+                count=n,
+            ),
+            q_min=np.fromiter(
+                (-inf if g.q_min is None else g.q_min for g in generators),
+                dtype=np.float64,
+                count=n,
+            ),
+            mbase=np.fromiter((g.mbase for g in generators), dtype=np.float64, count=n),
+            status=np.fromiter((g.status for g in generators), dtype=np.int8, count=n),
+        )
+
+    def __len__(self) -> int:
+        """Return the number of generators."""
+        return len(self.bus_id)
+
+    def as_matpower_matrix(self, base_mva: float = 100.0) -> NDArray[np.float64]:
+        """Pack the generators into a MATPOWER gen matrix.
+
+        Columns follow the first 10 columns of the MATPOWER gen format, with
+        power quantities converted back from per-unit to MW/MVAr:
+        bus, Pg, Qg, Qmax, Qmin, Vg, mBase, status, Pmax, Pmin. The matrix
+        is built column by column from the arrays, so writers can emit it
+        with np.savetxt() or ndarray.tofile() without reading Generator
+        attributes.
+
+        Args:
+            base_mva: System base MVA for the per-unit conversion (default: 100.0)
+
+        Returns:
+            (n_gen, 10) float64 array. Unlimited limits are +inf/-inf.
+
+        Example:
+            >>> gen = arr.as_matpower_matrix(system.base_mva)
+            >>> np.savetxt(out, gen, fmt="%.6g", delimiter="\t")
+        """
+        return np.column_stack(
+            (
+                self.bus_id,
+                self.p_gen * base_mva,
+                self.q_gen * base_mva,
+                self.q_max * base_mva,
+                self.q_min * base_mva,
+                self.v_setpoint,
+                self.mbase,
+                self.status,
+                self.p_max * base_mva,
+                self.p_min * base_mva,
+            )
+        ).astype(np.float64, copy=False)
+
+    def check_q_limits(self, q_values: ArrayLike) -> tuple[NDArray[np.bool_], NDArray[np.float64]]:
+        """Check reactive power values against every generator's limits.
+
+        Vectorized counterpart of Generator.check_q_limits(); see
+        check_q_limits_batch().
+
+        Args:
+            q_values: Reactive power per generator [p.u.], one per row
+
+        Returns:
+            Tuple of (within_limits, limited_values)
+            - within_limits: True where q_value is within [q_min, q_max]
+            - limited_values: q_values clamped to the limits
+        """
+        return check_q_limits_batch(q_values, self.q_min, self.q_max)
+
+
+def check_q_limits_batch(
+    q_values: ArrayLike, q_min: ArrayLike, q_max: ArrayLike
+) -> tuple[NDArray[np.bool_], NDArray[np.float64]]:
+    """Check reactive power values against limits in one vectorized pass.
+
+    Batched form of Generator.check_q_limits() for callers that hold limits
+    in their own arrays. Limits broadcast against q_values, so a scalar
+    limit applies to every value. Use -inf/+inf for unlimited sides.
+
+    Args:
+        q_values: Reactive power values to check [p.u.]
+        q_min: Lower reactive power limits [p.u.]
+        q_max: Upper reactive power limits [p.u.]
+
+    Returns:
+        Tuple of (within_limits, limited_values)
+        - within_limits: True where q_value is within [q_min, q_max]
+        - limited_values: q_values clamped to the limits
+
+    Example:
+        >>> within, limited = check_q_limits_batch([0.7, 0.1], -0.3, 0.5)
+        >>> within.tolist(), limited.tolist()
+        ([False, True], [0.5, 0.1])
+    """
+    q = np.asarray(q_values, dtype=np.float64)
+    lo = np.asarray(q_min, dtype=np.float64)
+    hi = np.asarray(q_max, dtype=np.float64)
+    limited: NDArray[np.float64] = np.clip(q, lo, hi)
+    # Written as "not outside" rather than lo <= q <= hi so NaN inputs count
+    # as within limits, as in the scalar check.
+    within: NDArray[np.bool_] = ~((q > hi) | (q < lo))
+    return within, limited
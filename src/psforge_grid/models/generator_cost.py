@@ -7,9 +7,17 @@ Used by OPF (Optimal Power Flow) and UC (Unit Commitment) formulations.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
 
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import ArrayLike, NDArray
 
-@dataclass
+# Cost models accepted by GeneratorCost: piecewise linear, polynomial
+_VALID_MODELS: frozenset[int] = frozenset((1, 2))
+
+
+@dataclass(slots=True)
 class GeneratorCost:
     """Generator cost data class for economic dispatch and OPF.
 
@@ -61,7 +69,7 @@ class GeneratorCost:
         Raises:
             ValueError: If model is not 1 or 2.
         """
-        if self.model not in [1, 2]:
+        if self.model not in _VALID_MODELS:
             raise ValueError(
                 f"Invalid cost model: {self.model}. Must be 1 (piecewise linear) or 2 (polynomial)."
             )
@@ -115,6 +123,43 @@ class GeneratorCost:
             result = result * p_mw + coeff
         return result
 
+    def evaluate_series(self, p_mw: ArrayLike) -> NDArray[np.float64]:
+        """Evaluate cost function at many power outputs (requires NumPy).
+
+        Array counterpart of evaluate() for one generator over a time series
+        or set of scenarios. Horner's method runs once per coefficient over
+        the whole array, so the Python-level loop length is the polynomial
+        order, not the number of points.
+
+        Args:
+            p_mw: Active power outputs [MW]
+
+        Returns:
+            Generation cost per point [$/hr], same shape as p_mw
+
+        Raises:
+            ValueError: If model is piecewise linear (not yet supported)
+
+        Example:
+            >>> cost = GeneratorCost(gen_index=0, model=2,
+            ...     coefficients=[0.04, 20.0, 100.0])
+            >>> cost.evaluate_series([0.0, 50.0]).tolist()
+            [100.0, 1200.0]
+        """
+        import numpy as np
+
+        if self.is_piecewise_linear:
+            raise ValueError(
+                "Piecewise linear cost evaluation is not yet supported. "
+                "Use polynomial model (model=2) for evaluate_series()."
+            )
+        p = np.asarray(p_mw, dtype=np.float64)
+        if not self.coefficients:
+            return np.zeros_like(p)
+        # np.polyval takes coefficients highest order first, as stored here
+        result = np.asarray(np.polyval(self.coefficients, p), dtype=np.float64)
+        return result
+
     def to_description(self) -> str:
         """Generate human/LLM-readable description of this cost function.
 
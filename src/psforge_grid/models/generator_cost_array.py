@@ -0,0 +1,152 @@
+"""Structure-of-arrays container for generator cost functions.
+
+This module defines the GeneratorCostArray class, which packs the polynomial
+coefficients of many GeneratorCost objects into one 2-D NumPy array so that
+the cost of the whole fleet can be evaluated in a single vectorized Horner
+pass (one array operation per polynomial degree rather than a Python loop
+per generator).
+
+Note:
+    This module requires the optional NumPy dependency. Install with:
+    pip install psforge-grid[numpy]
+
+Example:
+    >>> from psforge_grid.models.generator_cost_array import GeneratorCostArray
+    >>> costs = GeneratorCostArray.from_costs(system.generator_costs)
+    >>> total = costs.evaluate_all(p_mw).sum()  # Total cost [$/hr]
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+try:
+    import numpy as np
+except ImportError as e:
+    raise ImportError(
+        "GeneratorCostArray requires NumPy.\nPlease install with: pip install psforge-grid[numpy]"
+    ) from e
+
+from psforge_grid.models.generator_cost import GeneratorCost
+
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike, NDArray
+
+
+@dataclass
+class GeneratorCostArray:
+    """Packed generator cost functions for vectorized evaluation.
+
+    Row i describes the i-th cost of the sequence passed to from_costs().
+    Polynomial coefficients are right-aligned in a zero-padded matrix, so a
+    quadratic [c2, c1, c0] stored in a cubic-width row is [0, c2, c1, c0];
+    the leading zeros do not change the Horner result.
+
+    Attributes:
+        gen_index: Index into System.generators for each cost (int32)
+        model: Cost model, 1: piecewise linear, 2: polynomial (int8)
+        coefficients: Zero-padded polynomial coefficients, highest order
+            first, shape (n_costs, max_terms) (float64). Rows of piecewise
+            linear costs are all zero.
+        startup: Startup cost [$] (float64)
+        shutdown: Shutdown cost [$] (float64)
+
+    Example:
+        >>> arr = GeneratorCostArray.from_costs(system.generator_costs)
+        >>> p_mw = np.array([g.p_gen for g in system.generators])[arr.gen_index] * 100.0
+        >>> arr.evaluate_all(p_mw)
+    """
+
+    gen_index: NDArray[np.int32]
+    model: NDArray[np.int8]
+    coefficients: NDArray[np.float64]
+    startup: NDArray[np.float64]
+    shutdown: NDArray[np.float64]
+
+    @classmethod
+    def from_costs(cls, costs: Sequence[GeneratorCost]) -> GeneratorCostArray:
+        """Build a GeneratorCostArray from a sequence of GeneratorCost objects.
+
+        Args:
+            costs: Cost functions to convert (e.g., System.generator_costs)
+
+        Returns:
+            GeneratorCostArray with one row per cost, in the same order
+        """
+        n = len(costs)
+        width = max((len(c.coefficients) for c in costs if c.is_polynomial), default=0)
+        coefficients = np.zeros((n, width), dtype=np.float64)
+        for i, cost in enumerate(costs):
+            if cost.is_polynomial and cost.coefficients:
+                coefficients[i, width - len(cost.coefficients) :] = cost.coefficients
+        return cls(
+            gen_index=np.fromiter((c.gen_index for c in costs), dtype=np.int32, count=n),
+            model=np.fromiter((c.model for c in costs), dtype=np.int8, count=n),
+            coefficients=coefficients,
+            startup=np.fromiter((c.startup for c in costs), dtype=np.float64, count=n),
+            shutdown=np.fromiter((c.shutdown for c in costs), dtype=np.float64, count=n),
+        )
+
+    def __len__(self) -> int:
+        """Return the number of cost functions."""
+        return len(self.gen_index)
+
+    def evaluate_all(self, p_mw: ArrayLike) -> NDArray[np.float64]:
+        """Evaluate every cost function at its generator's output.
+
+        Vectorized counterpart of GeneratorCost.evaluate(). Horner's method
+        runs over the coefficient columns, so the Python-level loop length
+        is the polynomial order, not the number of generators.
+
+        Args:
+            p_mw: Active power output per cost row [MW]
+
+        Returns:
+            Generation cost per row [$/hr]. Rows with piecewise linear
+            costs, which evaluate() does not support, are NaN.
+        """
+        p = np.asarray(p_mw, dtype=np.float64)
+        result = np.zeros(np.broadcast_shapes(p.shape, (len(self),)), dtype=np.float64)
+        for column in self.coefficients.T:
+            result *= p
+            result += column
+        result[self.model == 1] = np.nan
+        return result
+
+    def evaluate_with_grad(
+        self, p_mw: ArrayLike
+    ) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """Evaluate every cost function and its marginal cost in one pass.
+
+        The value and the derivative share one Horner sweep over the
+        coefficient columns (df = df * p + f; f = f * p + c), so the
+        gradient costs two extra array operations per polynomial degree
+        rather than a separate evaluation with differentiated coefficients.
+
+        Args:
+            p_mw: Active power output per cost row [MW]
+
+        Returns:
+            Tuple of (cost, marginal_cost)
+            - cost: Generation cost per row [$/hr]
+            - marginal_cost: dC/dP per row [$/MWh]
+            Rows with piecewise linear costs are NaN in both arrays.
+
+        Example:
+            >>> cost, dcost = arr.evaluate_with_grad(p_mw)  # OPF objective and gradient
+        """
+        p = np.asarray(p_mw, dtype=np.float64)
+        shape = np.broadcast_shapes(p.shape, (len(self),))
+        result = np.zeros(shape, dtype=np.float64)
+        grad = np.zeros(shape, dtype=np.float64)
+        for column in self.coefficients.T:
+            grad *= p
+            grad += result
+            result *= p
+            result += column
+        piecewise = self.model == 1
+        result[piecewise] = np.nan
+        grad[piecewise] = np.nan
+        return result, grad
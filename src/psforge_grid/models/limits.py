@@ -7,7 +7,8 @@ thermal loading, and other operational constraints.
 Design Philosophy:
     - User-Configurable: All limits can be customized
     - Sensible Defaults: Standard industry values as defaults
-    - Immutable after creation: Use dataclass(frozen=True) for safety
+    - Immutable after creation: frozen dataclass; derive variants with
+      dataclasses.replace() (assigning a field raises FrozenInstanceError)
 
 Example:
     >>> from psforge_grid.models.limits import LimitsConfig
@@ -23,11 +24,16 @@ Example:
     ... )
 """
 
+import functools
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import ArrayLike, NDArray
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class LimitsConfig:
     """Configuration for system operational limits.
 
@@ -145,8 +151,11 @@ class LimitsConfig:
     # =========================================================================
     # Factory methods for common scenarios
     # =========================================================================
+    # LimitsConfig is frozen, so each factory builds and validates its preset
+    # once and returns the same shared instance on later calls.
 
     @classmethod
+    @functools.cache
     def normal(cls) -> "LimitsConfig":
         """Create limits for normal operation (default values).
 
@@ -156,6 +165,7 @@ class LimitsConfig:
         return cls()
 
     @classmethod
+    @functools.cache
     def emergency(cls) -> "LimitsConfig":
         """Create limits for emergency operation.
 
@@ -173,6 +183,7 @@ class LimitsConfig:
         )
 
     @classmethod
+    @functools.cache
     def strict(cls) -> "LimitsConfig":
         """Create strict limits for conservative operation.
 
@@ -213,7 +224,10 @@ class LimitsConfig:
         Returns:
             True if voltage is below critical_low or above critical_high
         """
-        return v_pu < self.voltage_critical_low_pu or v_pu > self.voltage_critical_high_pu
+        # Thresholds computed inline (same expressions as voltage_critical_low_pu
+        # and voltage_critical_high_pu) to avoid two property calls per check
+        margin = self.voltage_critical_margin_pu
+        return v_pu < self.voltage_min_pu - margin or v_pu > self.voltage_max_pu + margin
 
     def is_loading_normal(self, loading_percent: float) -> bool:
         """Check if branch loading is within normal limits.
@@ -249,7 +263,9 @@ class LimitsConfig:
         """
         margin_to_min = (v_pu - self.voltage_min_pu) / self.voltage_min_pu * 100
         margin_to_max = (self.voltage_max_pu - v_pu) / self.voltage_max_pu * 100
-        return min(margin_to_min, margin_to_max)
+        # Same result as min(margin_to_min, margin_to_max), including for NaN,
+        # without the builtin call
+        return margin_to_max if margin_to_max < margin_to_min else margin_to_min
 
     def thermal_margin_percent(self, loading_percent: float) -> float:
         """Calculate thermal margin to limit.
@@ -263,6 +279,128 @@ class LimitsConfig:
         """
         return self.thermal_limit_percent - loading_percent
 
+    # =========================================================================
+    # Array methods (require NumPy)
+    # =========================================================================
+
+    def is_voltage_normal_array(self, v_pu: "ArrayLike") -> "NDArray[np.bool_]":
+        """Check an array of voltages against normal limits (requires NumPy).
+
+        Vectorized counterpart of is_voltage_normal().
+
+        Args:
+            v_pu: Voltage magnitudes in per-unit
+
+        Returns:
+            Boolean array, True where voltage is within [voltage_min_pu, voltage_max_pu]
+        """
+        import numpy as np
+
+        v = np.asarray(v_pu, dtype=np.float64)
+        result: NDArray[np.bool_] = (v >= self.voltage_min_pu) & (v <= self.voltage_max_pu)
+        return result
+
+    def is_voltage_critical_array(self, v_pu: "ArrayLike") -> "NDArray[np.bool_]":
+        """Check an array of voltages for critical values (requires NumPy).
+
+        Vectorized counterpart of is_voltage_critical().
+
+        Args:
+            v_pu: Voltage magnitudes in per-unit
+
+        Returns:
+            Boolean array, True where voltage is below critical_low or above critical_high
+        """
+        import numpy as np
+
+        v = np.asarray(v_pu, dtype=np.float64)
+        result: NDArray[np.bool_] = (v < self.voltage_critical_low_pu) | (
+            v > self.voltage_critical_high_pu
+        )
+        return result
+
+    def is_overload_array(self, loading_percent: "ArrayLike") -> "NDArray[np.bool_]":
+        """Check an array of branch loadings for overloads (requires NumPy).
+
+        Vectorized counterpart of is_overload().
+
+        Args:
+            loading_percent: Loadings as percentage of thermal limit
+
+        Returns:
+            Boolean array, True where loading exceeds thermal_limit_percent
+        """
+        import numpy as np
+
+        result: NDArray[np.bool_] = np.greater(loading_percent, self.thermal_limit_percent)
+        return result
+
+    def voltage_margin_percent_array(self, v_pu: "ArrayLike") -> "NDArray[np.float64]":
+        """Calculate voltage margins for an array of voltages (requires NumPy).
+
+        Vectorized counterpart of voltage_margin_percent().
+
+        Args:
+            v_pu: Voltage magnitudes in per-unit
+
+        Returns:
+            Margin to nearest limit as percentage, per element
+            Positive = within limits, Negative = beyond limits
+
+        Example:
+            >>> limits = LimitsConfig()
+            >>> worst = limits.voltage_margin_percent_array(bus_array.v_magnitude).min()
+        """
+        import numpy as np
+
+        v = np.asarray(v_pu, dtype=np.float64)
+        margin_to_min = (v - self.voltage_min_pu) / self.voltage_min_pu * 100
+        margin_to_max = (self.voltage_max_pu - v) / self.voltage_max_pu * 100
+        result: NDArray[np.float64] = np.minimum(margin_to_min, margin_to_max)
+        return result
+
+    def classify_voltage_array(self, v_pu: "ArrayLike") -> "NDArray[np.int8]":
+        """Classify an array of voltages with these limits (requires NumPy).
+
+        Applies voltage_min_pu, voltage_max_pu and voltage_critical_margin_pu
+        in a single pass; see psforge_grid.models.status_array.classify_voltages().
+
+        Args:
+            v_pu: Voltage magnitudes in per-unit
+
+        Returns:
+            int8 array of codes indexing status_array.VOLTAGE_STATUS_CODES
+
+        Example:
+            >>> codes = LimitsConfig.emergency().classify_voltage_array(bus_array.v_magnitude)
+        """
+        from psforge_grid.models.status_array import classify_voltages
+
+        return classify_voltages(
+            v_pu, self.voltage_min_pu, self.voltage_max_pu, self.voltage_critical_margin_pu
+        )
+
+    def classify_loading_array(self, loading_percent: "ArrayLike") -> "NDArray[np.int8]":
+        """Classify an array of branch loadings with these limits (requires NumPy).
+
+        Applies the light, heavy and thermal limit thresholds in a single
+        pass; see psforge_grid.models.status_array.classify_loadings().
+
+        Args:
+            loading_percent: Loadings as percentage of thermal limit
+
+        Returns:
+            int8 array of codes indexing status_array.LOADING_STATUS_CODES
+        """
+        from psforge_grid.models.status_array import classify_loadings
+
+        return classify_loadings(
+            loading_percent,
+            self.thermal_light_threshold_percent,
+            self.thermal_heavy_threshold_percent,
+            self.thermal_limit_percent,
+        )
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization.
 
@@ -295,14 +433,24 @@ class LimitsConfig:
     def to_description(self) -> str:
         """Generate human/LLM-readable description of limits.
 
+        The text depends only on the (frozen) field values, so it is built
+        once per distinct configuration and reused on later calls.
+
         Returns:
             Multi-line string describing the limits configuration
         """
-        return f"""Limits Configuration:
-  Voltage: {self.voltage_min_pu:.3f} - {self.voltage_max_pu:.3f} pu (normal)
-           {self.voltage_critical_low_pu:.3f} - {self.voltage_critical_high_pu:.3f} pu (critical bounds)
-  Thermal: {self.thermal_limit_percent:.1f}% limit
-           {self.thermal_heavy_threshold_percent:.1f}% heavy threshold
-           {self.thermal_light_threshold_percent:.1f}% light threshold
-  Convergence: {self.convergence_tolerance_pu:.0e} pu tolerance
-               {self.max_iterations} max iterations"""
+        return _describe_limits(self)
+
+
+# Bounded so that configs created in parameter sweeps are not kept alive indefinitely
+@functools.lru_cache(maxsize=32)
+def _describe_limits(limits: LimitsConfig) -> str:
+    """Format the description of a LimitsConfig (see LimitsConfig.to_description)."""
+    return f"""Limits Configuration:
+  Voltage: {limits.voltage_min_pu:.3f} - {limits.voltage_max_pu:.3f} pu (normal)
+           {limits.voltage_critical_low_pu:.3f} - {limits.voltage_critical_high_pu:.3f} pu (critical bounds)
+  Thermal: {limits.thermal_limit_percent:.1f}% limit
+           {limits.thermal_heavy_threshold_percent:.1f}% heavy threshold
+           {limits.thermal_light_threshold_percent:.1f}% light threshold
+  Convergence: {limits.convergence_tolerance_pu:.0e} pu tolerance
+               {limits.max_iterations} max iterations"""
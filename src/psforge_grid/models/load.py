@@ -6,10 +6,17 @@ This module defines the Load class representing electrical loads.
 from __future__ import annotations
 
 import math
+from collections.abc import Iterable
 from dataclasses import dataclass
+from typing import Any
 
+from psforge_grid.models._bulk import make_row_constructor
 
-@dataclass
+# Status codes accepted by Load: out-of-service, in-service
+_VALID_STATUS: frozenset[int] = frozenset((0, 1))
+
+
+@dataclass(slots=True)
 class Load:
     """Load data class for electrical consumption.
 
@@ -54,11 +61,35 @@ class Load:
         Raises:
             ValueError: If status is not 0 or 1.
         """
-        if self.status not in [0, 1]:
+        if self.status not in _VALID_STATUS:
             raise ValueError(
                 f"Invalid status: {self.status}. Must be 0 (out-of-service) or 1 (in-service)."
             )
 
+    @classmethod
+    def from_rows(cls, rows: Iterable[tuple[Any, ...]]) -> list[Load]:
+        """Create many loads at once from row tuples.
+
+        Bulk counterpart of Load(...) for parsers. Each row holds one value
+        per field in declaration order (bus_id, p_load, q_load, status,
+        load_id, name, description). Statuses are validated for all rows up
+        front; objects are then built without going through __init__.
+
+        Args:
+            rows: Row tuples, one per load
+
+        Returns:
+            List of Load objects, in row order
+
+        Raises:
+            ValueError: If any row has an invalid status.
+        """
+        rows = list(rows)
+        if not _VALID_STATUS.issuperset([row[3] for row in rows]):
+            for row in rows:
+                cls(*row)  # Raises the __post_init__ error for the first bad row
+        return _load_from_rows(rows)
+
     @property
     def is_in_service(self) -> bool:
         """Check if this load is in service."""
@@ -71,7 +102,7 @@ class Load:
         Returns:
             |S| = sqrt(P^2 + Q^2)
         """
-        return math.sqrt(self.p_load**2 + self.q_load**2)
+        return math.hypot(self.p_load, self.q_load)
 
     @property
     def power_factor(self) -> float:
@@ -80,7 +111,7 @@ class Load:
         Returns:
             Power factor = P / |S|. Returns 1.0 if S = 0.
         """
-        s = self.apparent_power
+        s = math.hypot(self.p_load, self.q_load)
         if s == 0.0:
             return 1.0
         return self.p_load / s
@@ -103,15 +134,17 @@ class Load:
         name_str = f"{self.name}" if self.name else f"L{self.load_id}"
         status_str = "In-service" if self.is_in_service else "Out-of-service"
 
-        lines = [
-            f"Load {name_str} at Bus {self.bus_id}",
-            f"  Demand: P = {self.p_load:.4f} pu, Q = {self.q_load:.4f} pu",
-            f"  Apparent power: {self.apparent_power:.4f} pu",
-            f"  Power factor: {self.power_factor:.2f}",
-            f"  Status: {status_str}",
-        ]
+        s = math.hypot(self.p_load, self.q_load)
+        pf = self.p_load / s if s != 0.0 else 1.0
+        note_str = f"\n  Note: {self.description}" if self.description else ""
+
+        return (
+            f"Load {name_str} at Bus {self.bus_id}\n"
+            f"  Demand: P = {self.p_load:.4f} pu, Q = {self.q_load:.4f} pu\n"
+            f"  Apparent power: {s:.4f} pu\n"
+            f"  Power factor: {pf:.2f}\n"
+            f"  Status: {status_str}{note_str}"
+        )
 
-        if self.description:
-            lines.append(f"  Note: {self.description}")
 
-        return "\n".join(lines)
+_load_from_rows = make_row_constructor(Load)
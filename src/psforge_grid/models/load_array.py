@@ -0,0 +1,167 @@
+"""Structure-of-arrays container for load data.
+
+This module defines the LoadArray class, a column-oriented (structure-of-arrays)
+store of constant-power loads. Large load tables (time series, synthetic cases,
+external datasets) can be ingested directly from NumPy arrays with
+from_arrays(), which validates every status code in one vectorized pass
+instead of constructing and validating one Load object per row. Individual
+Load objects are only materialized on indexing.
+
+Note:
+    This module requires the optional NumPy dependency. Install with:
+    pip install psforge-grid[numpy]
+
+Example:
+    >>> from psforge_grid.models.load_array import LoadArray
+    >>> loads = LoadArray.from_arrays(bus_ids, p_pu, q_pu)
+    >>> total_p = loads.p_load[loads.in_service].sum()
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+try:
+    import numpy as np
+except ImportError as e:
+    raise ImportError(
+        "LoadArray requires NumPy.\nPlease install with: pip install psforge-grid[numpy]"
+    ) from e
+
+from psforge_grid.models.load import Load
+
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike, NDArray
+
+
+@dataclass
+class LoadArray:
+    """Column-oriented load data for vectorized computation.
+
+    Row i of every array describes one load. Only numeric attributes are
+    stored; load IDs, names and descriptions stay on Load objects, and
+    loads materialized by indexing get the Load defaults for them.
+
+    Attributes:
+        bus_id: Bus IDs where loads are connected (int32)
+        p_load: Active power demand [p.u.] (float64)
+        q_load: Reactive power demand [p.u.] (float64)
+        status: Operating status, 1: in-service, 0: out-of-service (int8)
+
+    Example:
+        >>> arr = LoadArray.from_loads(system.loads)
+        >>> arr[0].to_description()
+    """
+
+    bus_id: NDArray[np.int32]
+    p_load: NDArray[np.float64]
+    q_load: NDArray[np.float64]
+    status: NDArray[np.int8]
+
+    @classmethod
+    def from_loads(cls, loads: Sequence[Load]) -> LoadArray:
+        """Build a LoadArray from a sequence of Load objects.
+
+        Args:
+            loads: Loads to convert (e.g., System.loads)
+
+        Returns:
+            LoadArray with one row per load, in the same order
+        """
+        n = len(loads)
+        return cls(
+            bus_id=np.fromiter((ld.bus_id for ld in loads), dtype=np.int32, count=n),
+            p_load=np.fromiter((ld.p_load for ld in loads), dtype=np.float64, count=n),
+            q_load=np.fromiter((ld.q_load for ld in loads), dtype=np.float64, count=n),
+            status=np.fromiter((ld.status for ld in loads), dtype=np.int8, count=n),
+        )
+
+    @classmethod
+    def from_arrays(
+        cls,
+        bus_id: ArrayLike,
+        p_load: ArrayLike,
+        q_load: ArrayLike | None = None,
+        status: ArrayLike | None = None,
+    ) -> LoadArray:
+        """Build a LoadArray directly from column arrays.
+
+        Status codes are validated for all rows at once, with the same rule
+        as Load.__post_init__().
+
+        Args:
+            bus_id: Bus IDs where loads are connected
+            p_load: Active power demand [p.u.]
+            q_load: Reactive power demand [p.u.] (default: all 0.0)
+            status: Operating status codes (default: all 1, in-service)
+
+        Returns:
+            LoadArray with one row per element of bus_id
+
+        Raises:
+            ValueError: If the columns differ in length, a bus ID is not an
+                integer in the int32 range, or a status is not 0 or 1
+
+        Example:
+            >>> arr = LoadArray.from_arrays([2, 3], [0.5, 0.2], [0.1, 0.05])
+            >>> arr[1].bus_id, arr[1].p_load
+            (3, 0.2)
+        """
+        bus = np.asarray(bus_id)
+        n = len(bus)
+        p = np.asarray(p_load, dtype=np.float64)
+        q = np.zeros(n) if q_load is None else np.asarray(q_load, dtype=np.float64)
+        st = np.ones(n, dtype=np.int8) if status is None else np.asarray(status)
+        if not len(p) == len(q) == len(st) == n:
+            raise ValueError(
+                f"Load columns must have equal length, got bus_id={n}, "
+                f"p_load={len(p)}, q_load={len(q)}, status={len(st)}"
+            )
+        # NaN/inf bus IDs make the cast warn; the round-trip check rejects them
+        with np.errstate(invalid="ignore"):
+            bus_int = bus.astype(np.int32, copy=False)
+        if not np.can_cast(bus.dtype, np.int32):
+            # Catches silent int64 wrap-around and truncated floats (1.5 -> 1)
+            bad_bus = bus[bus_int != bus]
+            if len(bad_bus):
+                raise ValueError(
+                    f"Invalid bus_id: {bad_bus[0]}. Must be an integer in the int32 range."
+                )
+        invalid = st[(st != 0) & (st != 1)]
+        if len(invalid):
+            raise ValueError(
+                f"Invalid status: {invalid[0]}. Must be 0 (out-of-service) or 1 (in-service)."
+            )
+        return cls(
+            bus_id=bus_int,
+            p_load=p,
+            q_load=q,
+            status=st.astype(np.int8, copy=False),
+        )
+
+    def __len__(self) -> int:
+        """Return the number of loads."""
+        return len(self.bus_id)
+
+    def __getitem__(self, index: int) -> Load:
+        """Materialize the load in row index as a Load object.
+
+        Args:
+            index: Row position (negative values count from the end)
+
+        Returns:
+            New Load object with the row's values
+        """
+        return Load(
+            bus_id=int(self.bus_id[index]),
+            p_load=float(self.p_load[index]),
+            q_load=float(self.q_load[index]),
+            status=int(self.status[index]),
+        )
+
+    @property
+    def in_service(self) -> NDArray[np.bool_]:
+        """Boolean mask of in-service loads (status == 1)."""
+        return np.equal(self.status, 1)
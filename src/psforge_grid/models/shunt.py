@@ -6,10 +6,17 @@ capacitors and reactors in a power system.
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from dataclasses import dataclass
+from typing import Any
 
+from psforge_grid.models._bulk import make_row_constructor
 
-@dataclass
+# Status codes accepted by Shunt: out-of-service, in-service
+_VALID_STATUS: frozenset[int] = frozenset((0, 1))
+
+
+@dataclass(slots=True)
 class Shunt:
     """Shunt data class for capacitors and reactors.
 
@@ -56,11 +63,35 @@ class Shunt:
         Raises:
             ValueError: If status is not 0 or 1.
         """
-        if self.status not in [0, 1]:
+        if self.status not in _VALID_STATUS:
             raise ValueError(
                 f"Invalid status: {self.status}. Must be 0 (out-of-service) or 1 (in-service)."
             )
 
+    @classmethod
+    def from_rows(cls, rows: Iterable[tuple[Any, ...]]) -> list[Shunt]:
+        """Create many shunts at once from row tuples.
+
+        Bulk counterpart of Shunt(...) for parsers. Each row holds one value
+        per field in declaration order (bus_id, g_pu, b_pu, status,
+        shunt_id, name, description). Statuses are validated for all rows up
+        front; objects are then built without going through __init__.
+
+        Args:
+            rows: Row tuples, one per shunt
+
+        Returns:
+            List of Shunt objects, in row order
+
+        Raises:
+            ValueError: If any row has an invalid status.
+        """
+        rows = list(rows)
+        if not _VALID_STATUS.issuperset([row[3] for row in rows]):
+            for row in rows:
+                cls(*row)  # Raises the __post_init__ error for the first bad row
+        return _shunt_from_rows(rows)
+
     @property
     def is_in_service(self) -> bool:
         """Check if this shunt is in service."""
@@ -102,13 +133,13 @@ class Shunt:
         name_str = f"{self.name}" if self.name else f"S{self.shunt_id}"
         status_str = "In-service" if self.is_in_service else "Out-of-service"
 
-        lines = [
-            f"Shunt {name_str} at Bus {self.bus_id}: {self.shunt_type_name}",
-            f"  Admittance: G = {self.g_pu:.4f} pu, B = {self.b_pu:.4f} pu",
-            f"  Status: {status_str}",
-        ]
+        note_str = f"\n  Note: {self.description}" if self.description else ""
+
+        return (
+            f"Shunt {name_str} at Bus {self.bus_id}: {self.shunt_type_name}\n"
+            f"  Admittance: G = {self.g_pu:.4f} pu, B = {self.b_pu:.4f} pu\n"
+            f"  Status: {status_str}{note_str}"
+        )
 
-        if self.description:
-            lines.append(f"  Note: {self.description}")
 
-        return "\n".join(lines)
+_shunt_from_rows = make_row_constructor(Shunt)
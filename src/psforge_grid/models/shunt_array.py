@@ -0,0 +1,180 @@
+"""Structure-of-arrays container for shunt data.
+
+This module defines the ShuntArray class, a column-oriented (structure-of-arrays)
+store of shunt admittances. Shunt tables can be ingested directly from NumPy
+arrays with from_arrays(), which validates every status code in one
+vectorized pass instead of constructing and validating one Shunt object per
+row. Individual Shunt objects are only materialized on indexing.
+
+Note:
+    This module requires the optional NumPy dependency. Install with:
+    pip install psforge-grid[numpy]
+
+Example:
+    >>> from psforge_grid.models.shunt_array import ShuntArray
+    >>> shunts = ShuntArray.from_shunts(system.shunts)
+    >>> total_b = shunts.b_pu[shunts.in_service].sum()
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+try:
+    import numpy as np
+except ImportError as e:
+    raise ImportError(
+        "ShuntArray requires NumPy.\nPlease install with: pip install psforge-grid[numpy]"
+    ) from e
+
+from psforge_grid.models.shunt import Shunt
+
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike, NDArray
+
+
+@dataclass
+class ShuntArray:
+    """Column-oriented shunt data for vectorized computation.
+
+    Row i of every array describes one shunt. Only numeric attributes are
+    stored; shunt IDs, names and descriptions stay on Shunt objects, and
+    shunts materialized by indexing get the Shunt defaults for them.
+
+    Attributes:
+        bus_id: Bus IDs where shunts are connected (int32)
+        g_pu: Shunt conductance [p.u.] (float64)
+        b_pu: Shunt susceptance [p.u.], positive for capacitors (float64)
+        status: Operating status, 1: in-service, 0: out-of-service (int8)
+
+    The type masks (is_capacitor_mask, is_reactor_mask) are computed from
+    b_pu on each access, so they follow in-place susceptance changes.
+
+    Example:
+        >>> arr = ShuntArray.from_shunts(system.shunts)
+        >>> n_caps = int(arr.is_capacitor_mask.sum())
+        >>> b_reactors = arr.b_pu[arr.is_reactor_mask & arr.in_service].sum()
+    """
+
+    bus_id: NDArray[np.int32]
+    g_pu: NDArray[np.float64]
+    b_pu: NDArray[np.float64]
+    status: NDArray[np.int8]
+
+    @classmethod
+    def from_shunts(cls, shunts: Sequence[Shunt]) -> ShuntArray:
+        """Build a ShuntArray from a sequence of Shunt objects.
+
+        Args:
+            shunts: Shunts to convert (e.g., System.shunts)
+
+        Returns:
+            ShuntArray with one row per shunt, in the same order
+        """
+        n = len(shunts)
+        return cls(
+            bus_id=np.fromiter((s.bus_id for s in shunts), dtype=np.int32, count=n),
+            g_pu=np.fromiter((s.g_pu for s in shunts), dtype=np.float64, count=n),
+            b_pu=np.fromiter((s.b_pu for s in shunts), dtype=np.float64, count=n),
+            status=np.fromiter((s.status for s in shunts), dtype=np.int8, count=n),
+        )
+
+    @classmethod
+    def from_arrays(
+        cls,
+        bus_id: ArrayLike,
+        g_pu: ArrayLike | None = None,
+        b_pu: ArrayLike | None = None,
+        status: ArrayLike | None = None,
+    ) -> ShuntArray:
+        """Build a ShuntArray directly from column arrays.
+
+        Status codes are validated for all rows at once, with the same rule
+        as Shunt.__post_init__().
+
+        Args:
+            bus_id: Bus IDs where shunts are connected
+            g_pu: Shunt conductance [p.u.] (default: all 0.0)
+            b_pu: Shunt susceptance [p.u.] (default: all 0.0)
+            status: Operating status codes (default: all 1, in-service)
+
+        Returns:
+            ShuntArray with one row per element of bus_id
+
+        Raises:
+            ValueError: If the columns differ in length, a bus ID is not an
+                integer in the int32 range, or a status is not 0 or 1
+
+        Example:
+            >>> arr = ShuntArray.from_arrays([1, 4], b_pu=[0.5, -0.3])
+            >>> arr[1].shunt_type_name
+            'Reactor'
+        """
+        bus = np.asarray(bus_id)
+        n = len(bus)
+        g = np.zeros(n) if g_pu is None else np.asarray(g_pu, dtype=np.float64)
+        b = np.zeros(n) if b_pu is None else np.asarray(b_pu, dtype=np.float64)
+        st = np.ones(n, dtype=np.int8) if status is None else np.asarray(status)
+        if not len(g) == len(b) == len(st) == n:
+            raise ValueError(
+                f"Shunt columns must have equal length, got bus_id={n}, "
+                f"g_pu={len(g)}, b_pu={len(b)}, status={len(st)}"
+            )
+        # NaN/inf bus IDs make the cast warn; the round-trip check rejects them
+        with np.errstate(invalid="ignore"):
+            bus_int = bus.astype(np.int32, copy=False)
+        if not np.can_cast(bus.dtype, np.int32):
+            # Catches silent int64 wrap-around and truncated floats (1.5 -> 1)
+            bad_bus = bus[bus_int != bus]
+            if len(bad_bus):
+                raise ValueError(
+                    f"Invalid bus_id: {bad_bus[0]}. Must be an integer in the int32 range."
+                )
+        invalid = st[(st != 0) & (st != 1)]
+        if len(invalid):
+            raise ValueError(
+                f"Invalid status: {invalid[0]}. Must be 0 (out-of-service) or 1 (in-service)."
+            )
+        return cls(
+            bus_id=bus_int,
+            g_pu=g,
+            b_pu=b,
+            status=st.astype(np.int8, copy=False),
+        )
+
+    def __len__(self) -> int:
+        """Return the number of shunts."""
+        return len(self.bus_id)
+
+    def __getitem__(self, index: int) -> Shunt:
+        """Materialize the shunt in row index as a Shunt object.
+
+        Args:
+            index: Row position (negative values count from the end)
+
+        Returns:
+            New Shunt object with the row's values
+        """
+        return Shunt(
+            bus_id=int(self.bus_id[index]),
+            g_pu=float(self.g_pu[index]),
+            b_pu=float(self.b_pu[index]),
+            status=int(self.status[index]),
+        )
+
+    @property
+    def in_service(self) -> NDArray[np.bool_]:
+        """Boolean mask of in-service shunts (status == 1)."""
+        return np.equal(self.status, 1)
+
+    @property
+    def is_capacitor_mask(self) -> NDArray[np.bool_]:
+        """Boolean mask of capacitors (b_pu > 0), as Shunt.is_capacitor."""
+        return np.greater(self.b_pu, 0.0)
+
+    @property
+    def is_reactor_mask(self) -> NDArray[np.bool_]:
+        """Boolean mask of reactors (b_pu < 0), as Shunt.is_reactor."""
+        return np.less(self.b_pu, 0.0)
@@ -0,0 +1,201 @@
+"""Vectorized status classification for voltage and loading arrays.
+
+This module provides array counterparts of VoltageStatus.from_value() and
+LoadingStatus.from_percent(). Instead of calling the scalar classifier once
+per bus or branch, a whole array is classified in C and returned as compact
+int8 status codes. Each classifier is a single np.searchsorted() pass over
+the data against a short sorted threshold array, so adding status levels
+does not add passes over memory. The codes index into VOLTAGE_STATUS_CODES
+and LOADING_STATUS_CODES to recover the enum members.
+
+Status codes map to int8 severity codes by a table gather
+(voltage_severities(), loading_severities()), and an array of severity codes
+reduces to a SystemHealthStatus with one max() (health_from_severity_codes()).
+
+Note:
+    This module requires the optional NumPy dependency. Install with:
+    pip install psforge-grid[numpy]
+
+Example:
+    >>> from psforge_grid.models.status_array import VOLTAGE_STATUS_CODES, classify_voltages
+    >>> codes = classify_voltages(bus_array.v_magnitude)
+    >>> statuses = [VOLTAGE_STATUS_CODES[c] for c in codes]
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+try:
+    import numpy as np
+except ImportError as e:
+    raise ImportError(
+        "Array status classification requires NumPy.\n"
+        "Please install with: pip install psforge-grid[numpy]"
+    ) from e
+
+from psforge_grid.models.enums import LoadingStatus, Severity, SystemHealthStatus, VoltageStatus
+
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike, NDArray
+
+# Status for each int8 code returned by classify_voltages()
+VOLTAGE_STATUS_CODES: tuple[VoltageStatus, ...] = (
+    VoltageStatus.CRITICAL_LOW,
+    VoltageStatus.LOW,
+    VoltageStatus.NORMAL,
+    VoltageStatus.HIGH,
+    VoltageStatus.CRITICAL_HIGH,
+)
+
+# Status for each int8 code returned by classify_loadings()
+LOADING_STATUS_CODES: tuple[LoadingStatus, ...] = (
+    LoadingStatus.LIGHT,
+    LoadingStatus.NORMAL,
+    LoadingStatus.HEAVY,
+    LoadingStatus.OVERLOAD,
+)
+
+# Severity for each int8 code returned by voltage_severities()/loading_severities().
+# Codes increase with severity, so the worst finding is the maximum code.
+SEVERITY_CODES: tuple[Severity, ...] = (
+    Severity.INFO,
+    Severity.WARNING,
+    Severity.ERROR,
+    Severity.CRITICAL,
+)
+
+# Severity code of each voltage/loading status code (matches the enum properties)
+_VOLTAGE_SEVERITY_BY_CODE = np.array([3, 1, 0, 1, 3], dtype=np.int8)
+_LOADING_SEVERITY_BY_CODE = np.array([0, 0, 1, 2], dtype=np.int8)
+
+
+def classify_voltages(
+    v_pu: ArrayLike,
+    v_min: float = 0.95,
+    v_max: float = 1.05,
+    critical_margin: float = 0.05,
+) -> NDArray[np.int8]:
+    """Classify an array of voltage magnitudes.
+
+    Applies the same thresholds as VoltageStatus.from_value() to every
+    element at once. critical_margin must be non-negative so that the
+    thresholds are sorted.
+
+    Args:
+        v_pu: Voltage magnitudes in per-unit
+        v_min: Lower normal limit (default: 0.95 pu)
+        v_max: Upper normal limit (default: 1.05 pu)
+        critical_margin: Margin beyond limits for critical status (default: 0.05 pu)
+
+    Returns:
+        int8 array of codes indexing VOLTAGE_STATUS_CODES
+        (0: CRITICAL_LOW, 1: LOW, 2: NORMAL, 3: HIGH, 4: CRITICAL_HIGH)
+
+    Example:
+        >>> classify_voltages([0.88, 0.97, 1.07]).tolist()
+        [0, 2, 3]
+    """
+    # Upper limits are inclusive (v <= v_max is NORMAL), so their thresholds
+    # are nudged to the next float up to make side="right" count v > v_max.
+    thresholds = np.array(
+        [
+            v_min - critical_margin,
+            v_min,
+            np.nextafter(v_max, np.inf),
+            np.nextafter(v_max + critical_margin, np.inf),
+        ]
+    )
+    v = np.asarray(v_pu, dtype=np.float64)
+    codes: NDArray[np.int8] = np.searchsorted(thresholds, v, side="right").astype(np.int8)
+    return codes
+
+
+def classify_loadings(
+    loading_percent: ArrayLike,
+    light_threshold: float = 50.0,
+    heavy_threshold: float = 80.0,
+    overload_threshold: float = 100.0,
+) -> NDArray[np.int8]:
+    """Classify an array of loading percentages.
+
+    Applies the same thresholds as LoadingStatus.from_percent() to every
+    element at once. Thresholds must be given in ascending order.
+
+    Args:
+        loading_percent: Loadings as percentage of thermal limit
+        light_threshold: Threshold for LIGHT/NORMAL boundary (default: 50%)
+        heavy_threshold: Threshold for NORMAL/HEAVY boundary (default: 80%)
+        overload_threshold: Threshold for HEAVY/OVERLOAD boundary (default: 100%)
+
+    Returns:
+        int8 array of codes indexing LOADING_STATUS_CODES
+        (0: LIGHT, 1: NORMAL, 2: HEAVY, 3: OVERLOAD)
+
+    Example:
+        >>> classify_loadings([45.0, 85.0, 110.0]).tolist()
+        [0, 2, 3]
+    """
+    thresholds = np.array([light_threshold, heavy_threshold, overload_threshold])
+    p = np.asarray(loading_percent, dtype=np.float64)
+    codes: NDArray[np.int8] = np.searchsorted(thresholds, p, side="right").astype(np.int8)
+    return codes
+
+
+def voltage_severities(codes: NDArray[np.int8]) -> NDArray[np.int8]:
+    """Map voltage status codes to severity codes.
+
+    Array counterpart of VoltageStatus.severity.
+
+    Args:
+        codes: Codes returned by classify_voltages()
+
+    Returns:
+        int8 array of codes indexing SEVERITY_CODES, same shape as codes
+    """
+    severities: NDArray[np.int8] = _VOLTAGE_SEVERITY_BY_CODE[codes]
+    return severities
+
+
+def loading_severities(codes: NDArray[np.int8]) -> NDArray[np.int8]:
+    """Map loading status codes to severity codes.
+
+    Array counterpart of LoadingStatus.severity.
+
+    Args:
+        codes: Codes returned by classify_loadings()
+
+    Returns:
+        int8 array of codes indexing SEVERITY_CODES, same shape as codes
+    """
+    severities: NDArray[np.int8] = _LOADING_SEVERITY_BY_CODE[codes]
+    return severities
+
+
+def health_from_severity_codes(severity_codes: NDArray[np.int8]) -> SystemHealthStatus:
+    """Determine system health from an array of severity codes.
+
+    Array counterpart of SystemHealthStatus.from_severities(): a single
+    max() reduction replaces scanning a list of Severity members.
+
+    Args:
+        severity_codes: Codes returned by voltage_severities() or
+            loading_severities() (any shape; may be empty)
+
+    Returns:
+        SystemHealthStatus based on the worst severity found
+
+    Example:
+        >>> pct = np.array([[45.0, 85.0], [70.0, 120.0]])  # branches x contingencies
+        >>> health_from_severity_codes(loading_severities(classify_loadings(pct)))
+        <SystemHealthStatus.CRITICAL: 'CRITICAL'>
+    """
+    if severity_codes.size == 0:
+        return SystemHealthStatus.HEALTHY
+    worst = int(severity_codes.max())
+    if worst >= 2:
+        return SystemHealthStatus.CRITICAL
+    elif worst == 1:
+        return SystemHealthStatus.WARNING
+    else:
+        return SystemHealthStatus.HEALTHY
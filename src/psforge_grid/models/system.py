@@ -11,8 +11,11 @@ Factory Methods:
 
 from __future__ import annotations
 
+import math
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from psforge_grid.models.branch import Branch
 from psforge_grid.models.bus import Bus
@@ -21,9 +24,30 @@ from psforge_grid.models.generator_cost import GeneratorCost
 from psforge_grid.models.load import Load
 from psforge_grid.models.shunt import Shunt
 
+if TYPE_CHECKING:
+    from psforge_grid.models.system_array import SystemArrays
 
-@dataclass
-class System:
+
+class _SystemCaches:
+    """Slot storage for System's private lookup caches.
+
+    Declared outside the dataclass so the caches are not dataclass fields:
+    they stay out of fields(), asdict() and replace() copies.
+    """
+
+    __slots__ = ("_bus_index",)
+
+    _bus_index: dict[int, tuple[int, Bus]] | None
+
+    def _set_bus_index(self, index: dict[int, tuple[int, Bus]] | None) -> None:
+        """Store (or with None, discard) the bus_id -> (index, bus) cache."""
+        # Assigned here rather than in System: mypy does not see slots
+        # inherited by a slotted dataclass
+        self._bus_index = index
+
+
+@dataclass(slots=True)
+class System(_SystemCaches):
     """Power system container class.
 
     Central data structure containing all power system components including
@@ -67,6 +91,10 @@ class System:
     name: str = ""
     description: str | None = None
 
+    def __post_init__(self) -> None:
+        """Start with empty lookup caches."""
+        self._set_bus_index(None)
+
     # =========================================================================
     # Factory methods
     # =========================================================================
@@ -191,6 +219,9 @@ class System:
                 f"Use a unique bus_id (current max: {max(b.bus_id for b in self.buses)})."
             )
         self.buses.append(bus)
+        # Register the new bus so that adding its components next needs no rebuild
+        if self._bus_index is not None:
+            self._bus_index[bus.bus_id] = (len(self.buses) - 1, bus)
 
     def add_branch(self, branch: Branch) -> None:
         """Add a branch with validation.
@@ -207,15 +238,15 @@ class System:
         Example:
             >>> system.add_branch(Branch(from_bus=14, to_bus=15, r_pu=0.01, x_pu=0.05))
         """
-        bus_ids = {b.bus_id for b in self.buses}
-        if branch.from_bus not in bus_ids:
+        if self._lookup_bus(branch.from_bus) is None:
             raise ValueError(
                 f"from_bus {branch.from_bus} not found in system. "
-                f"Available bus IDs: {sorted(bus_ids)}"
+                f"Available bus IDs: {sorted({b.bus_id for b in self.buses})}"
             )
-        if branch.to_bus not in bus_ids:
+        if self._lookup_bus(branch.to_bus) is None:
             raise ValueError(
-                f"to_bus {branch.to_bus} not found in system. Available bus IDs: {sorted(bus_ids)}"
+                f"to_bus {branch.to_bus} not found in system. "
+                f"Available bus IDs: {sorted({b.bus_id for b in self.buses})}"
             )
         self.branches.append(branch)
 
@@ -233,7 +264,7 @@ class System:
         Example:
             >>> system.add_generator(Generator(bus_id=15, p_gen=0.5, gen_id="PV1"))
         """
-        if not any(b.bus_id == generator.bus_id for b in self.buses):
+        if self._lookup_bus(generator.bus_id) is None:
             raise ValueError(
                 f"Bus {generator.bus_id} not found in system. Add the bus first with add_bus()."
             )
@@ -253,7 +284,7 @@ class System:
         Example:
             >>> system.add_shunt(Shunt(bus_id=15, b_pu=0.05))
         """
-        if not any(b.bus_id == shunt.bus_id for b in self.buses):
+        if self._lookup_bus(shunt.bus_id) is None:
             raise ValueError(
                 f"Bus {shunt.bus_id} not found in system. Add the bus first with add_bus()."
             )
@@ -273,7 +304,7 @@ class System:
         Example:
             >>> system.add_load(Load(bus_id=15, p_load=0.3, q_load=0.1))
         """
-        if not any(b.bus_id == load.bus_id for b in self.buses):
+        if self._lookup_bus(load.bus_id) is None:
             raise ValueError(
                 f"Bus {load.bus_id} not found in system. Add the bus first with add_bus()."
             )
@@ -391,10 +422,8 @@ class System:
         Returns:
             Bus object if found, None otherwise
         """
-        for bus in self.buses:
-            if bus.bus_id == bus_id:
-                return bus
-        return None
+        entry = self._lookup_bus(bus_id)
+        return entry[1] if entry is not None else None
 
     def get_bus_index(self, bus_id: int) -> int:
         """Get the index of a bus in the buses list.
@@ -408,10 +437,124 @@ class System:
         Raises:
             ValueError: If bus_id is not found
         """
+        entry = self._lookup_bus(bus_id)
+        if entry is None:
+            raise ValueError(f"Bus {bus_id} not found in system")
+        return entry[0]
+
+    def invalidate_caches(self) -> None:
+        """Discard cached lookup indexes.
+
+        Bus lookups check cached entries against the current buses list and
+        rebuild the index on a miss, so appending, removing or replacing
+        buses needs no action. Call this after reordering buses in place
+        or renumbering a bus to an ID that is already used by another bus.
+        """
+        self._set_bus_index(None)
+
+    def warm_caches(self) -> None:
+        """Build the bus lookup index now instead of on first use.
+
+        The bus_id -> (position, Bus) index behind get_bus(), get_bus_index()
+        and the add_*() bus checks is otherwise built lazily by the first
+        lookup that needs it. Call this before latency-sensitive work (e.g.,
+        an interactive session or a timed benchmark) to pay that one-time
+        cost up front. Per-bus component getters keep no index, so there is
+        nothing to warm for them.
+
+        Example:
+            >>> system = System.from_file("ACTIVSg2000.raw")
+            >>> system.warm_caches()
+        """
+        self._build_bus_index()
+
+    def _lookup_bus(self, bus_id: int) -> tuple[int, Bus] | None:
+        """Return (index, bus) for bus_id using the cached bus index.
+
+        A cached hit is trusted only if the bus is still at that position
+        with that ID; otherwise, and on every miss, the index is rebuilt
+        with one pass over the buses (first occurrence wins, as with a
+        linear scan).
+        """
+        buses = self.buses
+        if self._bus_index is not None:
+            entry = self._bus_index.get(bus_id)
+            if entry is not None:
+                i, bus = entry
+                if i < len(buses) and buses[i] is bus and bus.bus_id == bus_id:
+                    return entry
+        return self._build_bus_index().get(bus_id)
+
+    def _build_bus_index(self) -> dict[int, tuple[int, Bus]]:
+        """Rebuild and cache the bus_id -> (index, bus) index."""
+        index: dict[int, tuple[int, Bus]] = {}
         for i, bus in enumerate(self.buses):
-            if bus.bus_id == bus_id:
-                return i
-        raise ValueError(f"Bus {bus_id} not found in system")
+            index.setdefault(bus.bus_id, (i, bus))
+        self._set_bus_index(index)
+        return index
+
+    def _lookup_buses(self, bus_ids: Iterable[int]) -> list[tuple[int, Bus] | None]:
+        """Return (index, bus) or None for each ID, with the checks of _lookup_bus.
+
+        The index and buses list are bound once for the whole batch; only
+        an ID whose cached entry is missing or stale goes through
+        _lookup_bus (and its rebuild).
+        """
+        buses = self.buses
+        n = len(buses)
+        index = self._bus_index if self._bus_index is not None else self._build_bus_index()
+        entries: list[tuple[int, Bus] | None] = []
+        for bus_id in bus_ids:
+            entry = index.get(bus_id)
+            if entry is not None:
+                i, bus = entry
+                if i < n and buses[i] is bus and bus.bus_id == bus_id:
+                    entries.append(entry)
+                    continue
+            entries.append(self._lookup_bus(bus_id))
+            index = self._bus_index or {}
+        return entries
+
+    def get_buses(self, bus_ids: Iterable[int]) -> list[Bus | None]:
+        """Get several buses by ID in one call.
+
+        Bulk counterpart of get_bus(): the lookup index is fetched once for
+        all IDs instead of once per call.
+
+        Args:
+            bus_ids: Bus IDs to search for
+
+        Returns:
+            List with the Bus for each ID in order, None where not found
+
+        Example:
+            >>> from_buses = system.get_buses(br.from_bus for br in system.branches)
+        """
+        return [entry[1] if entry is not None else None for entry in self._lookup_buses(bus_ids)]
+
+    def get_bus_indices(self, bus_ids: Iterable[int]) -> list[int]:
+        """Get the indices of several buses in the buses list.
+
+        Bulk counterpart of get_bus_index().
+
+        Args:
+            bus_ids: Bus IDs to search for
+
+        Returns:
+            Indices in buses list (0-based), one per requested ID
+
+        Raises:
+            ValueError: If any bus_id is not found
+
+        Example:
+            >>> f = system.get_bus_indices(br.from_bus for br in system.branches)
+        """
+        ids = list(bus_ids)
+        entries = self._lookup_buses(ids)
+        missing = [bus_id for bus_id, entry in zip(ids, entries, strict=True) if entry is None]
+        if missing:
+            raise ValueError(f"Bus IDs not found in system: {sorted(set(missing))}")
+        return [entry[0] for entry in entries if entry is not None]
 
     def get_bus_ids(self) -> list[int]:
         """Get all bus IDs in the system.
@@ -424,6 +567,10 @@ class System:
     # =========================================================================
     # Component lookup by bus
     # =========================================================================
+    # These scan the component lists on every call, so they always reflect
+    # in-place edits. For whole-network work take one as_arrays() snapshot
+    # and use SystemArrays.net_injections() and BranchArray.bus_adjacency()
+    # instead of calling them once per bus.
 
     def get_bus_generators(self, bus_id: int, in_service_only: bool = True) -> list[Generator]:
         """Get all generators connected to a specific bus.
@@ -435,10 +582,9 @@ class System:
         Returns:
             List of Generator objects connected to the bus
         """
-        gens = [g for g in self.generators if g.bus_id == bus_id]
         if in_service_only:
-            gens = [g for g in gens if g.is_in_service]
-        return gens
+            return [g for g in self.generators if g.bus_id == bus_id and g.is_in_service]
+        return [g for g in self.generators if g.bus_id == bus_id]
 
     def get_bus_loads(self, bus_id: int, in_service_only: bool = True) -> list[Load]:
         """Get all loads connected to a specific bus.
@@ -450,10 +596,9 @@ class System:
         Returns:
             List of Load objects connected to the bus
         """
-        loads = [load for load in self.loads if load.bus_id == bus_id]
         if in_service_only:
-            loads = [load for load in loads if load.is_in_service]
-        return loads
+            return [load for load in self.loads if load.bus_id == bus_id and load.is_in_service]
+        return [load for load in self.loads if load.bus_id == bus_id]
 
     def get_bus_shunts(self, bus_id: int, in_service_only: bool = True) -> list[Shunt]:
         """Get all shunts connected to a specific bus.
@@ -465,10 +610,9 @@ class System:
         Returns:
             List of Shunt objects connected to the bus
         """
-        shunts = [s for s in self.shunts if s.bus_id == bus_id]
         if in_service_only:
-            shunts = [s for s in shunts if s.status == 1]
-        return shunts
+            return [s for s in self.shunts if s.bus_id == bus_id and s.status == 1]
+        return [s for s in self.shunts if s.bus_id == bus_id]
 
     def get_branches_at_bus(self, bus_id: int, in_service_only: bool = True) -> list[Branch]:
         """Get all branches connected to a specific bus.
@@ -482,13 +626,40 @@ class System:
         """
         branches = [b for b in self.branches if b.from_bus == bus_id or b.to_bus == bus_id]
         if in_service_only:
-            branches = [b for b in branches if b.is_in_service]
+            return [b for b in branches if b.is_in_service]
         return branches
 
     # =========================================================================
     # Power injection calculations
     # =========================================================================
 
+    def get_bus_pq_injection(self, bus_id: int) -> tuple[float, float]:
+        """Calculate net active and reactive power injection at a bus [p.u.].
+
+        Computes get_bus_p_injection() and get_bus_q_injection() together,
+        walking the bus's in-service generators and loads once.
+
+        Args:
+            bus_id: Bus ID
+
+        Returns:
+            Tuple of (P_injection, Q_injection) [p.u.]
+
+        Example:
+            >>> p_inj, q_inj = system.get_bus_pq_injection(2)
+        """
+        p_gen = q_gen = 0.0
+        for g in self.generators:
+            if g.bus_id == bus_id and g.status == 1:
+                p_gen += g.p_gen
+                q_gen += g.q_gen
+        p_load = q_load = 0.0
+        for load in self.loads:
+            if load.bus_id == bus_id and load.status == 1:
+                p_load += load.p_load
+                q_load += load.q_load
+        return p_gen - p_load, q_gen - q_load
+
     def get_bus_p_injection(self, bus_id: int) -> float:
         """Calculate net active power injection at a bus [p.u.].
 
@@ -500,9 +671,7 @@ class System:
         Returns:
             Net active power injection (generation - load) [p.u.]
         """
-        p_gen = sum(g.p_gen for g in self.get_bus_generators(bus_id))
-        p_load = sum(load.p_load for load in self.get_bus_loads(bus_id))
-        return p_gen - p_load
+        return self.get_bus_pq_injection(bus_id)[0]
 
     def get_bus_q_injection(self, bus_id: int) -> float:
         """Calculate net reactive power injection at a bus [p.u.].
@@ -517,9 +686,7 @@ class System:
         Returns:
             Net reactive power injection [p.u.] (excluding voltage-dependent shunt)
         """
-        q_gen = sum(g.q_gen for g in self.get_bus_generators(bus_id))
-        q_load = sum(load.q_load for load in self.get_bus_loads(bus_id))
-        return q_gen - q_load
+        return self.get_bus_pq_injection(bus_id)[1]
 
     def get_bus_shunt_admittance(self, bus_id: int) -> tuple[float, float]:
         """Get total shunt admittance at a bus.
@@ -530,8 +697,11 @@ class System:
         Returns:
             Tuple of (G_total, B_total) [p.u.]
         """
-        g_total = sum(s.g_pu for s in self.get_bus_shunts(bus_id))
-        b_total = sum(s.b_pu for s in self.get_bus_shunts(bus_id))
+        g_total = b_total = 0.0
+        for s in self.shunts:
+            if s.bus_id == bus_id and s.status == 1:
+                g_total += s.g_pu
+                b_total += s.b_pu
         return g_total, b_total
 
     # =========================================================================
@@ -544,7 +714,7 @@ class System:
         Returns:
             List of Bus objects with bus_type == 3
         """
-        return [bus for bus in self.buses if bus.is_slack]
+        return [bus for bus in self.buses if bus.bus_type == 3]
 
     def get_pv_buses(self) -> list[Bus]:
         """Get all PV (generator) buses in the system.
@@ -552,7 +722,7 @@ class System:
         Returns:
             List of Bus objects with bus_type == 2
         """
-        return [bus for bus in self.buses if bus.is_pv]
+        return [bus for bus in self.buses if bus.bus_type == 2]
 
     def get_pq_buses(self) -> list[Bus]:
         """Get all PQ (load) buses in the system.
@@ -560,7 +730,7 @@ class System:
         Returns:
             List of Bus objects with bus_type == 1
         """
-        return [bus for bus in self.buses if bus.is_pq]
+        return [bus for bus in self.buses if bus.bus_type == 1]
 
     def get_in_service_branches(self) -> list[Branch]:
         """Get all in-service branches.
@@ -582,8 +752,9 @@ class System:
         gens = self.generators
         if in_service_only:
             gens = [g for g in gens if g.is_in_service]
-        total_p = sum(g.p_gen for g in gens)
-        total_q = sum(g.q_gen for g in gens)
+        # fsum: correctly rounded on every supported Python version
+        total_p = math.fsum(g.p_gen for g in gens)
+        total_q = math.fsum(g.q_gen for g in gens)
         return total_p, total_q
 
     def total_load(self, in_service_only: bool = True) -> tuple[float, float]:
@@ -598,10 +769,33 @@ class System:
         loads = self.loads
         if in_service_only:
             loads = [load for load in loads if load.is_in_service]
-        total_p = sum(load.p_load for load in loads)
-        total_q = sum(load.q_load for load in loads)
+        total_p = math.fsum(load.p_load for load in loads)
+        total_q = math.fsum(load.q_load for load in loads)
         return total_p, total_q
 
+    def as_arrays(self) -> SystemArrays:
+        """Snapshot all components as NumPy structure-of-arrays containers.
+
+        Builds a SystemArrays with BusArray, BranchArray, GeneratorArray,
+        LoadArray, ShuntArray and GeneratorCostArray columns in the order of
+        the component lists. The result is not cached: it is a copy of the
+        current values, so call this again after modifying the system.
+
+        Returns:
+            SystemArrays snapshot of this system
+
+        Raises:
+            ImportError: If NumPy is not installed
+
+        Example:
+            >>> arrays = system.as_arrays()
+            >>> ybus = arrays.branches.build_ybus(arrays.buses)
+        """
+        # Lazy import: the array layer requires the optional NumPy dependency
+        from psforge_grid.models.system_array import SystemArrays
+
+        return SystemArrays.from_system(self)
+
     # =========================================================================
     # LLM-friendly output methods
     # =========================================================================
@@ -628,15 +822,15 @@ class System:
         lines = [
             f"Power System: {name_str}",
             f"  Base MVA: {self.base_mva:.1f}",
-            f"  Components: {self.num_buses()} buses, {self.num_branches()} branches, "
-            f"{self.num_generators()} generators, {self.num_loads()} loads, "
-            f"{self.num_shunts()} shunts",
+            f"  Components: {len(self.buses)} buses, {len(self.branches)} branches, "
+            f"{len(self.generators)} generators, {len(self.loads)} loads, "
+            f"{len(self.shunts)} shunts",
             f"  Total Generation: {p_gen:.2f} pu P, {q_gen:.2f} pu Q",
             f"  Total Load: {p_load:.2f} pu P, {q_load:.2f} pu Q",
         ]
 
         if self.generator_costs:
-            lines.append(f"  Generator Costs: {self.num_generator_costs()} cost functions")
+            lines.append(f"  Generator Costs: {len(self.generator_costs)} cost functions")
 
         if self.description:
             lines.append(f"  Note: {self.description}")
@@ -678,10 +872,10 @@ class System:
                 "| Property | Value |",
                 "|----------|-------|",
                 f"| Base MVA | {self.base_mva:.1f} |",
-                f"| Buses | {self.num_buses()} |",
-                f"| Branches | {self.num_branches()} |",
-                f"| Generators | {self.num_generators()} |",
-                f"| Loads | {self.num_loads()} |",
+                f"| Buses | {len(self.buses)} |",
+                f"| Branches | {len(self.branches)} |",
+                f"| Generators | {len(self.generators)} |",
+                f"| Loads | {len(self.loads)} |",
                 f"| Total Gen (P) | {p_gen * self.base_mva:.1f} MW |",
                 f"| Total Load (P) | {p_load * self.base_mva:.1f} MW |",
             ]
@@ -689,8 +883,8 @@ class System:
             lines = [
                 f"Power System: {self.name or 'Unnamed'}",
                 f"Base MVA: {self.base_mva:.1f}",
-                f"Buses: {self.num_buses()}, Branches: {self.num_branches()}",
-                f"Generators: {self.num_generators()}, Loads: {self.num_loads()}",
+                f"Buses: {len(self.buses)}, Branches: {len(self.branches)}",
+                f"Generators: {len(self.generators)}, Loads: {len(self.loads)}",
                 f"Total Gen: {p_gen * self.base_mva:.1f} MW, Load: {p_load * self.base_mva:.1f} MW",
             ]
 
@@ -701,12 +895,20 @@ class System:
         if include_components:
             lines.append("")
             lines.append("### Bus Types:")
-            slack = [b for b in self.buses if b.is_slack]
-            pv = [b for b in self.buses if b.is_pv]
-            pq = [b for b in self.buses if b.is_pq]
-            lines.append(f"- Slack: {len(slack)} ({', '.join(str(b.bus_id) for b in slack)})")
-            lines.append(f"- PV: {len(pv)}")
-            lines.append(f"- PQ: {len(pq)}")
+            # One pass over the buses instead of one comprehension per type
+            slack_ids: list[str] = []
+            n_pv = n_pq = 0
+            for b in self.buses:
+                bus_type = b.bus_type
+                if bus_type == 3:
+                    slack_ids.append(str(b.bus_id))
+                elif bus_type == 2:
+                    n_pv += 1
+                elif bus_type == 1:
+                    n_pq += 1
+            lines.append(f"- Slack: {len(slack_ids)} ({', '.join(slack_ids)})")
+            lines.append(f"- PV: {n_pv}")
+            lines.append(f"- PQ: {n_pq}")
 
         return "\n".join(lines)
 
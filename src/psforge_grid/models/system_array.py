@@ -0,0 +1,108 @@
+"""Structure-of-arrays snapshot of a whole power system.
+
+This module defines the SystemArrays class, which bundles the column-oriented
+containers of every component list of a System (BusArray, BranchArray,
+GeneratorArray, LoadArray, ShuntArray, GeneratorCostArray). Analysis code
+(Ybus assembly, power flow, OPF) can take one SystemArrays instead of
+repacking each list itself.
+
+Note:
+    This module requires the optional NumPy dependency. Install with:
+    pip install psforge-grid[numpy]
+
+Example:
+    >>> arrays = system.as_arrays()
+    >>> ybus = arrays.branches.build_ybus(arrays.buses)
+    >>> p_inj, q_inj = arrays.net_injections()
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+try:
+    import numpy as np
+except ImportError as e:
+    raise ImportError(
+        "SystemArrays requires NumPy.\nPlease install with: pip install psforge-grid[numpy]"
+    ) from e
+
+from psforge_grid.models.branch_array import BranchArray
+from psforge_grid.models.bus_array import BusArray
+from psforge_grid.models.generator_array import GeneratorArray
+from psforge_grid.models.generator_cost_array import GeneratorCostArray
+from psforge_grid.models.load_array import LoadArray
+from psforge_grid.models.shunt_array import ShuntArray
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+    from psforge_grid.models.system import System
+
+
+@dataclass
+class SystemArrays:
+    """Column-oriented snapshot of all components of a System.
+
+    Each container keeps the row order of the corresponding System list,
+    so results map back to System.buses, System.generators, etc. by
+    position. The arrays are copies taken when the snapshot is built:
+    later changes to the System are not reflected, and changes to the
+    arrays are not written back.
+
+    Attributes:
+        buses: Bus data (from System.buses)
+        branches: Branch data (from System.branches)
+        generators: Generator data (from System.generators)
+        loads: Load data (from System.loads)
+        shunts: Shunt data (from System.shunts)
+        generator_costs: Cost functions (from System.generator_costs)
+        base_mva: System base MVA
+
+    Example:
+        >>> arrays = SystemArrays.from_system(system)
+        >>> arrays.buses.v_magnitude[arrays.buses.pq_idx]
+    """
+
+    buses: BusArray
+    branches: BranchArray
+    generators: GeneratorArray
+    loads: LoadArray
+    shunts: ShuntArray
+    generator_costs: GeneratorCostArray
+    base_mva: float = 100.0
+
+    @classmethod
+    def from_system(cls, system: System) -> SystemArrays:
+        """Build a SystemArrays snapshot from a System.
+
+        Args:
+            system: System to convert
+
+        Returns:
+            SystemArrays with one container per component list
+        """
+        return cls(
+            buses=BusArray.from_buses(system.buses),
+            branches=BranchArray.from_branches(system.branches),
+            generators=GeneratorArray.from_generators(system.generators),
+            loads=LoadArray.from_loads(system.loads),
+            shunts=ShuntArray.from_shunts(system.shunts),
+            generator_costs=GeneratorCostArray.from_costs(system.generator_costs),
+            base_mva=system.base_mva,
+        )
+
+    def net_injections(self) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """Compute net active and reactive power injection at every bus.
+
+        Shorthand for buses.net_injections(generators, loads).
+
+        Returns:
+            Tuple of (P_injection, Q_injection) arrays [p.u.], one entry per
+            bus in System.buses order
+
+        Raises:
+            ValueError: If a generator or load refers to a bus ID not present
+        """
+        return self.buses.net_injections(self.generators, self.loads)
@@ -0,0 +1,667 @@
+"""Tests for structure-of-arrays containers and vectorized helpers.
+
+These containers require the optional NumPy dependency; the module is
+skipped when NumPy is not installed.
+"""
+
+import math
+import warnings
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from psforge_grid.models.branch import Branch  # noqa: E402
+from psforge_grid.models.branch_array import BRANCH_DTYPE, BranchArray  # noqa: E402
+from psforge_grid.models.bus import Bus  # noqa: E402
+from psforge_grid.models.bus_array import BUS_DTYPE, BusArray  # noqa: E402
+from psforge_grid.models.enums import (  # noqa: E402
+    LoadingStatus,
+    Severity,
+    SystemHealthStatus,
+    VoltageStatus,
+)
+from psforge_grid.models.generator import Generator  # noqa: E402
+from psforge_grid.models.generator_array import (  # noqa: E402
+    GeneratorArray,
+    check_q_limits_batch,
+)
+from psforge_grid.models.generator_cost import GeneratorCost  # noqa: E402
+from psforge_grid.models.generator_cost_array import GeneratorCostArray  # noqa: E402
+from psforge_grid.models.limits import LimitsConfig  # noqa: E402
+from psforge_grid.models.load import Load  # noqa: E402
+from psforge_grid.models.load_array import LoadArray  # noqa: E402
+from psforge_grid.models.shunt import Shunt  # noqa: E402
+from psforge_grid.models.shunt_array import ShuntArray  # noqa: E402
+from psforge_grid.models.status_array import (  # noqa: E402
+    LOADING_STATUS_CODES,
+    SEVERITY_CODES,
+    VOLTAGE_STATUS_CODES,
+    classify_loadings,
+    classify_voltages,
+    health_from_severity_codes,
+    loading_severities,
+    voltage_severities,
+)
+from psforge_grid.models.system import System  # noqa: E402
+from psforge_grid.models.system_array import SystemArrays  # noqa: E402
+
+
+@pytest.fixture
+def ieee14_system() -> System:
+    """Load IEEE 14-bus system from RAW file."""
+    return System.from_raw("tests/fixtures/ieee14.raw")
+
+
+class TestBusArray:
+    """Test cases for BusArray."""
+
+    def test_from_buses_columns(self):
+        """Test that each column mirrors the Bus attributes in order."""
+        buses = [
+            Bus(bus_id=1, bus_type=3, v_magnitude=1.06, base_kv=138.0),
+            Bus(bus_id=5, bus_type=1, v_magnitude=0.98, v_angle=-0.1, area=2),
+        ]
+        arr = BusArray.from_buses(buses)
+
+        assert len(arr) == 2
+        assert arr.bus_id.tolist() == [1, 5]
+        assert arr.bus_type.tolist() == [3, 1]
+        assert arr.v_magnitude.tolist() == [1.06, 0.98]
+        assert arr.v_angle.tolist() == [0.0, -0.1]
+        assert arr.area.tolist() == [1, 2]
+        assert arr.bus_type.dtype == np.int8
+        assert arr.v_magnitude.dtype == np.float64
+
+    def test_from_empty_list(self):
+        """Test that an empty bus list produces empty arrays."""
+        arr = BusArray.from_buses([])
+        assert len(arr) == 0
+        assert arr.positions([]).tolist() == []
+
+    def test_bus_type_partitions(self, ieee14_system):
+        """Test bus-type masks and index arrays against Bus properties."""
+        arr = BusArray.from_buses(ieee14_system.buses)
+        buses = ieee14_system.buses
+
+        assert arr.is_pq_mask.tolist() == [b.is_pq for b in buses]
+        assert arr.is_pv_mask.tolist() == [b.is_pv for b in buses]
+        assert arr.is_slack_mask.tolist() == [b.is_slack for b in buses]
+        assert arr.pq_idx.tolist() == [i for i, b in enumerate(buses) if b.is_pq]
+        assert arr.pv_idx.tolist() == [i for i, b in enumerate(buses) if b.is_pv]
+        assert arr.slack_idx.tolist() == [i for i, b in enumerate(buses) if b.is_slack]
+
+    def test_bus_type_partitions_follow_switching(self, ieee14_system):
+        """Test that index arrays reflect in-place bus type changes."""
+        arr = BusArray.from_buses(ieee14_system.buses)
+        pv = arr.pv_idx[0]
+        arr.bus_type[pv] = 1
+        assert pv in arr.pq_idx
+        assert pv not in arr.pv_idx
+
+    def test_positions(self, ieee14_system):
+        """Test vectorized bus ID to row position lookup."""
+        arr = BusArray.from_buses(ieee14_system.buses)
+        ids = [14, 1, 7]
+        expected = [ieee14_system.get_bus_index(i) for i in ids]
+        assert arr.positions(ids).tolist() == expected
+        assert arr.positions(np.array(ids)).tolist() == expected
+
+    def test_positions_unknown_id(self, ieee14_system):
+        """Test that unknown bus IDs raise ValueError."""
+        arr = BusArray.from_buses(ieee14_system.buses)
+        with pytest.raises(ValueError, match=r"\[99\]"):
+            arr.positions([1, 99])
+
+    def test_net_injections_match_system(self, ieee14_system):
+        """Test all-bus injections against System.get_bus_pq_injection."""
+        ieee14_system.generators[1].status = 0
+        ieee14_system.loads[0].status = 0
+        arr = BusArray.from_buses(ieee14_system.buses)
+        p_inj, q_inj = arr.net_injections(
+            GeneratorArray.from_generators(ieee14_system.generators),
+            LoadArray.from_loads(ieee14_system.loads),
+        )
+        expected = [ieee14_system.get_bus_pq_injection(i) for i in ieee14_system.get_bus_ids()]
+        np.testing.assert_allclose(p_inj, [p for p, _ in expected], atol=1e-12)
+        np.testing.assert_allclose(q_inj, [q for _, q in expected], atol=1e-12)
+
+    def test_net_injections_empty_components(self):
+        """Test buses without generators or loads get zero injection."""
+        arr = BusArray.from_buses([Bus(bus_id=1, bus_type=3), Bus(bus_id=2, bus_type=1)])
+        p_inj, q_inj = arr.net_injections(
+            GeneratorArray.from_generators([]), LoadArray.from_loads([])
+        )
+        assert p_inj.tolist() == [0.0, 0.0]
+        assert q_inj.tolist() == [0.0, 0.0]
+
+
+class TestBranchArray:
+    """Test cases for BranchArray."""
+
+    def test_from_branches_columns(self):
+        """Test that each column mirrors the Branch attributes in order."""
+        branches = [
+            Branch(from_bus=1, to_bus=2, r_pu=0.01, x_pu=0.1, b_pu=0.02, rate_a=100.0),
+            Branch(from_bus=2, to_bus=3, r_pu=0.0, x_pu=0.05, tap_ratio=1.05, status=0),
+        ]
+        arr = BranchArray.from_branches(branches)
+
+        assert len(arr) == 2
+        assert arr.from_bus.tolist() == [1, 2]
+        assert arr.to_bus.tolist() == [2, 3]
+        assert arr.x_pu.tolist() == [0.1, 0.05]
+        assert arr.tap_ratio.tolist() == [1.0, 1.05]
+        assert arr.status.tolist() == [1, 0]
+
+    def test_unset_optionals_are_nan(self):
+        """Test that None ratings and angle limits are stored as NaN."""
+        arr = BranchArray.from_branches([Branch(from_bus=1, to_bus=2, r_pu=0.01, x_pu=0.1)])
+        assert math.isnan(arr.rate_a[0])
+        assert math.isnan(arr.rate_b[0])
+        assert math.isnan(arr.rate_c[0])
+        assert math.isnan(arr.angmin[0])
+        assert math.isnan(arr.angmax[0])
+
+    def test_presence_masks(self):
+        """Test has_rate_a/has_angle_limits mirror the None checks on Branch."""
+        branches = [
+            Branch(from_bus=1, to_bus=2, r_pu=0.01, x_pu=0.1, rate_a=100.0),
+            Branch(from_bus=2, to_bus=3, r_pu=0.01, x_pu=0.1, angmax=0.5),
+            Branch(from_bus=3, to_bus=4, r_pu=0.01, x_pu=0.1),
+        ]
+        arr = BranchArray.from_branches(branches)
+        assert arr.has_rate_a.tolist() == [True, False, False]
+        assert arr.has_angle_limits.tolist() == [False, True, False]
+        assert np.nanmax(arr.rate_a) == 100.0
+
+    def test_ieee14_round_trip(self, ieee14_system):
+        """Test that a parsed system converts without loss of numeric data."""
+        arr = BranchArray.from_branches(ieee14_system.branches)
+        assert len(arr) == ieee14_system.num_branches()
+        for i, branch in enumerate(ieee14_system.branches):
+            assert arr.r_pu[i] == branch.r_pu
+            assert arr.x_pu[i] == branch.x_pu
+            assert arr.tap_ratio[i] == branch.tap_ratio
+
+    def test_compute_admittances_matches_scalar(self, ieee14_system):
+        """Test pi-model admittances against a per-branch scalar computation."""
+        arr = BranchArray.from_branches(ieee14_system.branches)
+        yff, yft, ytf, ytt = arr.compute_admittances()
+
+        assert yff.dtype == np.complex128
+        for i, branch in enumerate(ieee14_system.branches):
+            ys = 1.0 / branch.impedance_pu
+            tap = branch.tap_ratio * complex(
+                math.cos(branch.shift_angle), math.sin(branch.shift_angle)
+            )
+            exp_ytt = ys + 1j * branch.b_pu / 2
+            assert ytt[i] == pytest.approx(exp_ytt)
+            assert yff[i] == pytest.approx(exp_ytt / (tap * tap.conjugate()))
+            assert yft[i] == pytest.approx(-ys / tap.conjugate())
+            assert ytf[i] == pytest.approx(-ys / tap)
+
+    def test_compute_admittances_phase_shifter(self):
+        """Test that a phase shift makes Yft and Ytf differ."""
+        arr = BranchArray.from_branches(
+            [Branch(from_bus=1, to_bus=2, r_pu=0.0, x_pu=0.1, shift_angle=math.radians(10.0))]
+        )
+        yff, yft, ytf, ytt = arr.compute_admittances()
+        assert yff[0] == pytest.approx(-10j)
+        assert ytt[0] == pytest.approx(-10j)
+        assert yft[0] != pytest.approx(ytf[0])
+        assert abs(yft[0]) == pytest.approx(10.0)
+
+    def test_compute_admittances_out_of_service(self):
+        """Test that out-of-service branches contribute zero admittance."""
+        arr = BranchArray.from_branches(
+            [
+                Branch(from_bus=1, to_bus=2, r_pu=0.01, x_pu=0.1, b_pu=0.02),
+                Branch(from_bus=2, to_bus=3, r_pu=0.01, x_pu=0.1, b_pu=0.02, status=0),
+            ]
+        )
+        for y in arr.compute_admittances():
+            assert y[0] != 0
+            assert y[1] == 0
+
+    def test_compute_admittances_out_of_service_zero_impedance(self):
+        """Test that an out-of-service r = x = 0 branch gives zeros, not NaN."""
+        arr = BranchArray.from_branches(
+            [
+                Branch(from_bus=1, to_bus=2, r_pu=0.01, x_pu=0.1, b_pu=0.02),
+                Branch(from_bus=2, to_bus=3, r_pu=0.0, x_pu=0.0, b_pu=0.02, status=0),
+            ]
+        )
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", RuntimeWarning)
+            admittances = arr.compute_admittances()
+        for y in admittances:
+            assert np.all(np.isfinite(y))
+            assert y[0] != 0
+            assert y[1] == 0
+
+
+class TestGeneratorArray:
+    """Test cases for GeneratorArray."""
+
+    def test_from_generators_columns(self):
+        """Test columns, and that unset limits become +/-inf."""
+        gens = [
+            Generator(bus_id=1, p_gen=1.0, q_max=0.5, q_min=-0.3, p_max=2.0),
+            Generator(bus_id=3, p_gen=0.4, v_setpoint=1.02, status=0),
+        ]
+        arr = GeneratorArray.from_generators(gens)
+
+        assert len(arr) == 2
+        assert arr.bus_id.tolist() == [1, 3]
+        assert arr.v_setpoint.tolist() == [1.0, 1.02]
+        assert arr.q_max.tolist() == [0.5, math.inf]
+        assert arr.q_min.tolist() == [-0.3, -math.inf]
+        assert arr.p_min.tolist() == [-math.inf, -math.inf]
+        assert arr.status.tolist() == [1, 0]
+
+    def test_check_q_limits_matches_scalar(self):
+        """Test vectorized Q-limit check against Generator.check_q_limits."""
+        gens = [
+            Generator(bus_id=1, p_gen=1.0, q_max=0.5, q_min=-0.3),
+            Generator(bus_id=2, p_gen=1.0, q_max=0.5, q_min=-0.3),
+            Generator(bus_id=3, p_gen=1.0, q_max=0.5, q_min=-0.3),
+            Generator(bus_id=4, p_gen=1.0),
+            Generator(bus_id=5, p_gen=1.0, q_max=0.2),
+        ]
+        q = [0.7, -0.5, 0.1, 9.0, 0.2]
+        within, limited = GeneratorArray.from_generators(gens).check_q_limits(np.array(q))
+        for i, gen in enumerate(gens):
+            exp_within, exp_limited = gen.check_q_limits(q[i])
+            assert within[i] == exp_within
+            assert limited[i] == exp_limited
+
+    def test_check_q_limits_batch_broadcast(self):
+        """Test the module-level batch check with scalar limits."""
+        within, limited = check_q_limits_batch([0.7, -0.5, 0.1, math.nan], -0.3, 0.5)
+        assert within.tolist() == [False, False, True, True]
+        assert limited[:3].tolist() == [0.5, -0.3, 0.1]
+        assert math.isnan(limited[3])
+
+    def test_as_matpower_matrix(self):
+        """Test that the gen matrix reproduces the MATPOWER source rows."""
+        system = System.from_matpower("tests/fixtures/pglib_opf_case14_ieee.m")
+        gen = GeneratorArray.from_generators(system.generators).as_matpower_matrix(system.base_mva)
+
+        assert gen.shape == (len(system.generators), 10)
+        assert np.allclose(gen[0], [1, 170.0, 5.0, 10.0, 0.0, 1.0, 100.0, 1, 340, 0.0])
+        assert np.allclose(gen[1], [2, 29.5, 0.0, 30.0, -30.0, 1.0, 100.0, 1, 59, 0.0])
+
+
+class TestLoadShuntArrays:
+    """Test cases for LoadArray and ShuntArray."""
+
+    def test_load_round_trip(self):
+        """Test that indexing materializes the converted Load objects."""
+        loads = [Load(bus_id=2, p_load=0.5, q_load=0.2), Load(bus_id=3, p_load=0.1, status=0)]
+        arr = LoadArray.from_loads(loads)
+        assert len(arr) == 2
+        assert arr[0] == loads[0]
+        assert arr[-1] == loads[1]
+        assert arr.in_service.tolist() == [True, False]
+
+    def test_load_from_arrays_defaults(self):
+        """Test column defaults and dtypes of bulk load ingestion."""
+        arr = LoadArray.from_arrays(np.array([4, 5]), np.array([0.3, 0.4]))
+        assert arr.q_load.tolist() == [0.0, 0.0]
+        assert arr.status.tolist() == [1, 1]
+        assert arr.bus_id.dtype == np.int32
+        assert arr[1].apparent_power == pytest.approx(0.4)
+
+    def test_shunt_round_trip(self):
+        """Test that indexing materializes the converted Shunt objects."""
+        shunts = [Shunt(bus_id=1, b_pu=0.5), Shunt(bus_id=4, g_pu=0.01, b_pu=-0.3, status=0)]
+        arr = ShuntArray.from_shunts(shunts)
+        assert [arr[i] for i in range(len(arr))] == shunts
+        assert ShuntArray.from_arrays([1, 4], b_pu=[0.5, -0.3])[1].is_reactor
+
+    def test_shunt_type_masks(self):
+        """Test shunt type masks against the Shunt properties."""
+        shunts = [Shunt(bus_id=1, b_pu=0.5), Shunt(bus_id=2, b_pu=-0.3), Shunt(bus_id=3)]
+        arr = ShuntArray.from_shunts(shunts)
+        assert arr.is_capacitor_mask.tolist() == [s.is_capacitor for s in shunts]
+        assert arr.is_reactor_mask.tolist() == [s.is_reactor for s in shunts]
+
+    @pytest.mark.parametrize("factory", [LoadArray.from_arrays, ShuntArray.from_arrays])
+    def test_from_arrays_validation(self, factory):
+        """Test that bulk ingestion rejects bad status codes and ragged columns."""
+        with pytest.raises(ValueError, match="Invalid status: 2"):
+            factory([1, 2, 3], [0.1, 0.2, 0.3], [0.0, 0.0, 0.0], [1, 2, 0])
+        with pytest.raises(ValueError, match="equal length"):
+            factory([1, 2], [0.1])
+
+    @pytest.mark.parametrize("factory", [LoadArray.from_arrays, ShuntArray.from_arrays])
+    def test_from_arrays_bus_id_validation(self, factory):
+        """Test that bus IDs that do not fit int32 exactly are rejected, not wrapped."""
+        with pytest.raises(ValueError, match="Invalid bus_id: 2147483648"):
+            factory(np.array([1, 2**31], dtype=np.int64), [0.1, 0.2])
+        with pytest.raises(ValueError, match="Invalid bus_id: 1.5"):
+            factory([1.5, 2.0], [0.1, 0.2])
+        with pytest.raises(ValueError, match="Invalid bus_id: nan"):
+            factory([float("nan")], [0.1])
+        arr = factory(np.array([1, 2**31 - 1], dtype=np.int64), [0.1, 0.2])
+        assert arr.bus_id.tolist() == [1, 2**31 - 1]
+        assert factory([3.0], [0.1]).bus_id.tolist() == [3]
+
+
+class TestGeneratorCostArray:
+    """Test cases for GeneratorCostArray."""
+
+    def test_evaluate_all_matches_scalar(self):
+        """Test mixed-order polynomials against GeneratorCost.evaluate."""
+        costs = [
+            GeneratorCost(gen_index=0, model=2, coefficients=[0.04, 20.0, 100.0]),
+            GeneratorCost(gen_index=1, model=2, coefficients=[30.0, 0.0]),
+            GeneratorCost(gen_index=2, model=2, coefficients=[0.001, 0.02, 15.0, 50.0]),
+            GeneratorCost(gen_index=3, model=2, coefficients=[]),
+        ]
+        arr = GeneratorCostArray.from_costs(costs)
+        p = [50.0, 80.0, 120.0, 10.0]
+
+        assert arr.coefficients.shape == (4, 4)
+        result = arr.evaluate_all(p)
+        for i, cost in enumerate(costs):
+            assert result[i] == pytest.approx(cost.evaluate(p[i]))
+
+    def test_piecewise_rows_are_nan(self):
+        """Test that piecewise linear costs evaluate to NaN in bulk."""
+        costs = [
+            GeneratorCost(gen_index=0, model=1, coefficients=[0.0, 0.0, 100.0, 2000.0]),
+            GeneratorCost(gen_index=1, model=2, coefficients=[20.0, 0.0]),
+        ]
+        result = GeneratorCostArray.from_costs(costs).evaluate_all([50.0, 50.0])
+        assert math.isnan(result[0])
+        assert result[1] == 1000.0
+
+    def test_case14_costs(self):
+        """Test evaluation of costs parsed from a MATPOWER case."""
+        system = System.from_matpower("tests/fixtures/pglib_opf_case14_ieee.m")
+        arr = GeneratorCostArray.from_costs(system.generator_costs)
+        p = np.full(len(arr), 40.0)
+        expected = [c.evaluate(40.0) for c in system.generator_costs]
+        assert np.allclose(arr.evaluate_all(p), expected)
+
+    def test_evaluate_with_grad(self):
+        """Test fused cost and marginal cost evaluation."""
+        costs = [
+            GeneratorCost(gen_index=0, model=2, coefficients=[0.04, 20.0, 100.0]),
+            GeneratorCost(gen_index=1, model=2, coefficients=[0.001, 0.02, 15.0, 50.0]),
+            GeneratorCost(gen_index=2, model=1, coefficients=[0.0, 0.0, 100.0, 2000.0]),
+        ]
+        arr = GeneratorCostArray.from_costs(costs)
+        cost, grad = arr.evaluate_with_grad([50.0, 120.0, 50.0])
+
+        assert np.allclose(cost[:2], arr.evaluate_all([50.0, 120.0, 50.0])[:2])
+        assert grad[0] == pytest.approx(2 * 0.04 * 50.0 + 20.0)
+        assert grad[1] == pytest.approx(3 * 0.001 * 120.0**2 + 2 * 0.02 * 120.0 + 15.0)
+        assert math.isnan(cost[2]) and math.isnan(grad[2])
+
+    def test_scalar_cost_evaluate_series(self):
+        """Test GeneratorCost.evaluate_series against evaluate."""
+        cost = GeneratorCost(gen_index=0, model=2, coefficients=[0.001, 0.02, 15.0, 50.0])
+        p = np.linspace(0.0, 200.0, 9).reshape(3, 3)
+        result = cost.evaluate_series(p)
+
+        assert result.shape == (3, 3)
+        assert np.allclose(result.ravel(), [cost.evaluate(x) for x in p.ravel()])
+        empty = GeneratorCost(gen_index=0, model=2, coefficients=[])
+        assert empty.evaluate_series([10.0, 20.0]).tolist() == [0.0, 0.0]
+        with pytest.raises(ValueError, match="Piecewise linear"):
+            GeneratorCost(gen_index=0, model=1, coefficients=[0.0, 0.0]).evaluate_series([1.0])
+
+
+class TestStatusClassification:
+    """Test cases for vectorized voltage/loading status classification."""
+
+    VOLTAGES = [0.85, 0.8999, 0.9, 0.93, 0.95, 1.0, 1.05, 1.07, 1.1, 1.1001, 1.2, math.nan]
+    LOADINGS = [0.0, 49.9, 50.0, 79.9, 80.0, 99.9, 100.0, 150.0, math.nan]
+
+    def test_voltage_matches_scalar(self):
+        """Test that array codes agree with VoltageStatus.from_value."""
+        codes = VoltageStatus.classify_array(self.VOLTAGES)
+        assert codes.dtype == np.int8
+        for v, code in zip(self.VOLTAGES, codes, strict=True):
+            assert VOLTAGE_STATUS_CODES[code] is VoltageStatus.from_value(v)
+
+    def test_voltage_custom_limits(self):
+        """Test that custom limits are honoured."""
+        codes = classify_voltages(
+            [0.91, 0.96, 1.02, 1.04], v_min=0.92, v_max=1.03, critical_margin=0.02
+        )
+        assert codes.tolist() == [1, 2, 2, 3]
+
+    def test_voltage_inclusive_upper_limits(self):
+        """Test that v_max and v_max + margin themselves are not escalated."""
+        v_max, margin = 1.05, 0.05
+        codes = classify_voltages([v_max, v_max + margin], v_max=v_max, critical_margin=margin)
+        assert codes.tolist() == [2, 3]
+
+    def test_loading_matches_scalar(self):
+        """Test that array codes agree with LoadingStatus.from_percent."""
+        codes = LoadingStatus.classify_array(self.LOADINGS)
+        assert codes.dtype == np.int8
+        for p, code in zip(self.LOADINGS, codes, strict=True):
+            assert LOADING_STATUS_CODES[code] is LoadingStatus.from_percent(p)
+
+    def test_severity_tables_match_enums(self):
+        """Test severity gathers agree with the enum severity properties."""
+        v_codes = np.arange(len(VOLTAGE_STATUS_CODES), dtype=np.int8)
+        for code, sev in zip(v_codes, voltage_severities(v_codes), strict=True):
+            assert SEVERITY_CODES[sev] is VOLTAGE_STATUS_CODES[code].severity
+        l_codes = np.arange(len(LOADING_STATUS_CODES), dtype=np.int8)
+        for code, sev in zip(l_codes, loading_severities(l_codes), strict=True):
+            assert SEVERITY_CODES[sev] is LOADING_STATUS_CODES[code].severity
+
+    def test_contingency_loading_matrix(self):
+        """Test 2-D (branch x contingency) loading classification and health."""
+        pct = np.array([[45.0, 60.0], [85.0, 70.0]])
+        codes = classify_loadings(pct)
+        assert codes.shape == (2, 2)
+        assert codes.tolist() == [[0, 1], [2, 1]]
+        health = health_from_severity_codes(loading_severities(codes))
+        assert health is SystemHealthStatus.WARNING
+
+    @pytest.mark.parametrize(
+        "severities",
+        [[], [Severity.INFO], [Severity.INFO, Severity.WARNING], [Severity.ERROR, Severity.INFO]],
+    )
+    def test_health_matches_from_severities(self, severities):
+        """Test array health reduction against SystemHealthStatus.from_severities."""
+        codes = np.array([SEVERITY_CODES.index(s) for s in severities], dtype=np.int8)
+        expected = SystemHealthStatus.from_severities(severities)
+        assert health_from_severity_codes(codes) is expected
+
+    def test_bus_array_voltages(self, ieee14_system):
+        """Test classification of a parsed system's bus voltages."""
+        arr = BusArray.from_buses(ieee14_system.buses)
+        codes = classify_voltages(arr.v_magnitude)
+        assert len(codes) == len(arr)
+        for bus, code in zip(ieee14_system.buses, codes, strict=True):
+            assert VOLTAGE_STATUS_CODES[code] is VoltageStatus.from_value(bus.v_magnitude)
+
+    @pytest.mark.parametrize("limits", [LimitsConfig.normal(), LimitsConfig.strict()])
+    def test_limits_array_checks_match_scalar(self, limits):
+        """Test LimitsConfig array methods against their scalar counterparts."""
+        v = [0.85, 0.9, 0.95, 0.97, 1.0, 1.03, 1.05, 1.1, 1.2]
+        loading = [50.0, 80.0, 100.0, 100.5, 130.0]
+
+        assert limits.is_voltage_normal_array(v).tolist() == [
+            limits.is_voltage_normal(x) for x in v
+        ]
+        assert limits.is_voltage_critical_array(v).tolist() == [
+            limits.is_voltage_critical(x) for x in v
+        ]
+        assert limits.is_overload_array(loading).tolist() == [
+            limits.is_overload(x) for x in loading
+        ]
+        assert np.allclose(
+            limits.voltage_margin_percent_array(v),
+            [limits.voltage_margin_percent(x) for x in v],
+        )
+
+    def test_limits_classification(self):
+        """Test LimitsConfig array classification against the scalar enum classifiers."""
+        limits = LimitsConfig.emergency()
+        v = [0.79, 0.85, 0.95, 1.1, 1.15, 1.2]
+        loading = [40.0, 90.0, 110.0, 130.0]
+
+        codes = limits.classify_voltage_array(v)
+        assert [VOLTAGE_STATUS_CODES[c] for c in codes] == [
+            VoltageStatus.from_value(x, 0.90, 1.10, 0.05) for x in v
+        ]
+        codes = limits.classify_loading_array(loading)
+        assert [LOADING_STATUS_CODES[c] for c in codes] == [
+            LoadingStatus.from_percent(x, 50.0, 100.0, 120.0) for x in loading
+        ]
+
+
+class TestYbus:
+    """Test cases for branch admittance matrix assembly."""
+
+    def test_ybus_matches_scalar_assembly(self, ieee14_system):
+        """Test dense Ybus against a per-branch scalar assembly."""
+        buses = BusArray.from_buses(ieee14_system.buses)
+        ybus = BranchArray.from_branches(ieee14_system.branches).build_ybus(buses)
+
+        n = len(buses)
+        expected = [[0j] * n for _ in range(n)]
+        for branch in ieee14_system.branches:
+            f = ieee14_system.get_bus_index(branch.from_bus)
+            t = ieee14_system.get_bus_index(branch.to_bus)
+            ys = branch.admittance_pu
+            tap = branch.tap_ratio
+            ytt = ys + 0.5j * branch.b_pu
+            expected[f][f] += ytt / tap**2
+            expected[f][t] += -ys / tap
+            expected[t][f] += -ys / tap
+            expected[t][t] += ytt
+
+        assert ybus.shape == (n, n)
+        assert np.allclose(ybus, np.array(expected))
+
+    def test_ybus_coo_shapes(self, ieee14_system):
+        """Test that COO triplets have four entries per branch."""
+        buses = BusArray.from_buses(ieee14_system.buses)
+        arr = BranchArray.from_branches(ieee14_system.branches)
+        values, rows, cols = arr.ybus_coo(buses)
+        assert len(values) == len(rows) == len(cols) == 4 * len(arr)
+        assert rows.max() < len(buses)
+
+    def test_bus_adjacency_matches_system(self, ieee14_system):
+        """Test CSR adjacency against System.get_branches_at_bus for every bus."""
+        ieee14_system.branches[0].status = 0
+        buses = BusArray.from_buses(ieee14_system.buses)
+        arr = BranchArray.from_branches(ieee14_system.branches)
+        indptr, branch_idx = arr.bus_adjacency(buses)
+
+        assert len(indptr) == len(buses) + 1
+        for i, bus in enumerate(ieee14_system.buses):
+            at_bus = {id(b) for b in ieee14_system.get_branches_at_bus(bus.bus_id)}
+            expected = [j for j, b in enumerate(ieee14_system.branches) if id(b) in at_bus]
+            assert branch_idx[indptr[i] : indptr[i + 1]].tolist() == expected
+
+    def test_bus_adjacency_self_loop_and_out_of_service(self):
+        """Test that self-loops are listed once and status filtering is optional."""
+        buses = BusArray.from_buses([Bus(bus_id=1, bus_type=3), Bus(bus_id=2, bus_type=1)])
+        arr = BranchArray.from_branches(
+            [
+                Branch(from_bus=1, to_bus=1, r_pu=0.0, x_pu=0.1),
+                Branch(from_bus=1, to_bus=2, r_pu=0.0, x_pu=0.1, status=0),
+            ]
+        )
+        indptr, branch_idx = arr.bus_adjacency(buses)
+        assert indptr.tolist() == [0, 1, 1]
+        assert branch_idx.tolist() == [0]
+
+        indptr, branch_idx = arr.bus_adjacency(buses, in_service_only=False)
+        assert indptr.tolist() == [0, 2, 3]
+        assert branch_idx.tolist() == [0, 1, 1]
+
+    def test_ybus_out_of_service_branch(self):
+        """Test that an out-of-service branch does not contribute."""
+        buses = BusArray.from_buses([Bus(bus_id=1, bus_type=3), Bus(bus_id=2, bus_type=1)])
+        arr = BranchArray.from_branches(
+            [Branch(from_bus=1, to_bus=2, r_pu=0.0, x_pu=0.1, status=0)]
+        )
+        assert not arr.build_ybus(buses).any()
+
+    def test_ybus_unknown_bus(self):
+        """Test that branches referring to missing buses raise ValueError."""
+        buses = BusArray.from_buses([Bus(bus_id=1, bus_type=3)])
+        arr = BranchArray.from_branches([Branch(from_bus=1, to_bus=2, r_pu=0.0, x_pu=0.1)])
+        with pytest.raises(ValueError, match="not found"):
+            arr.build_ybus(buses)
+
+
+class TestRecords:
+    """Test cases for structured-dtype record conversion."""
+
+    def test_bus_records_round_trip(self, ieee14_system):
+        """Test BusArray -> records -> BusArray preserves every column."""
+        arr = BusArray.from_buses(ieee14_system.buses)
+        records = arr.to_records()
+        assert records.dtype == BUS_DTYPE
+        back = BusArray.from_records(records)
+        assert back.bus_id.tolist() == arr.bus_id.tolist()
+        assert np.array_equal(back.v_angle, arr.v_angle)
+        assert back.bus_type.dtype == np.int8
+        assert back.v_magnitude.flags["C_CONTIGUOUS"]
+
+    def test_branch_records_file_round_trip(self, ieee14_system, tmp_path):
+        """Test branch records survive a binary file and memmap load."""
+        arr = BranchArray.from_branches(ieee14_system.branches)
+        path = tmp_path / "branches.bin"
+        arr.to_records().tofile(path)
+
+        mapped = np.memmap(path, dtype=BRANCH_DTYPE, mode="r")
+        back = BranchArray.from_records(mapped)
+        del mapped
+
+        assert len(back) == len(arr)
+        assert np.array_equal(back.x_pu, arr.x_pu)
+        assert np.array_equal(back.rate_a, arr.rate_a, equal_nan=True)
+        assert back.status.tolist() == arr.status.tolist()
+
+    def test_from_records_missing_field(self):
+        """Test that records lacking a required field raise ValueError."""
+        records = np.zeros(2, dtype=[("bus_id", "<i4"), ("bus_type", "i1")])
+        with pytest.raises(ValueError, match="v_magnitude"):
+            BusArray.from_records(records)
+
+
+class TestSystemArrays:
+    """Test cases for SystemArrays and System.as_arrays()."""
+
+    def test_as_arrays_matches_components(self):
+        """Test that every container mirrors its System list in order."""
+        system = System.from_matpower("tests/fixtures/pglib_opf_case14_ieee.m")
+        arrays = system.as_arrays()
+
+        assert isinstance(arrays, SystemArrays)
+        assert arrays.buses.bus_id.tolist() == system.get_bus_ids()
+        assert arrays.branches.to_bus.tolist() == [b.to_bus for b in system.branches]
+        assert arrays.generators.p_gen.tolist() == [g.p_gen for g in system.generators]
+        assert arrays.loads.p_load.tolist() == [ld.p_load for ld in system.loads]
+        assert len(arrays.shunts) == len(system.shunts)
+        assert len(arrays.generator_costs) == len(system.generator_costs)
+        assert arrays.base_mva == system.base_mva
+
+    def test_as_arrays_is_snapshot(self, ieee14_system):
+        """Test that later System changes do not leak into a snapshot."""
+        arrays = ieee14_system.as_arrays()
+        ieee14_system.generators[0].p_gen += 1.0
+        assert arrays.generators.p_gen[0] == ieee14_system.generators[0].p_gen - 1.0
+        assert ieee14_system.as_arrays().generators.p_gen[0] == ieee14_system.generators[0].p_gen
+
+    def test_net_injections_shorthand(self, ieee14_system):
+        """Test SystemArrays.net_injections against the scalar method."""
+        p_inj, q_inj = ieee14_system.as_arrays().net_injections()
+        for i, bus_id in enumerate(ieee14_system.get_bus_ids()):
+            p, q = ieee14_system.get_bus_pq_injection(bus_id)
+            assert p_inj[i] == pytest.approx(p)
+            assert q_inj[i] == pytest.approx(q)
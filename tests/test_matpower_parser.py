@@ -5,6 +5,7 @@ including pglib-opf benchmark cases.
 """
 
 import math
+from collections import defaultdict
 from pathlib import Path
 
 import pytest
@@ -14,11 +15,59 @@ from psforge_grid.io.matpower_parser import MatpowerParser, parse_matpower
 from psforge_grid.models.generator_cost import GeneratorCost
 from psforge_grid.models.system import System
 
+# Path to test fixtures
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+CASE5_PATH = FIXTURES_DIR / "pglib_opf_case5_pjm.m"
+CASE14_PATH = FIXTURES_DIR / "pglib_opf_case14_ieee.m"
 
-@pytest.fixture
-def fixtures_dir():
-    """Return path to test fixtures directory."""
-    return Path(__file__).parent / "fixtures"
+# Branch angle limits of pglib_opf_case5_pjm (+/-30 degrees), in radians
+_ANGMIN_RAD = math.radians(-30.0)
+_ANGMAX_RAD = math.radians(30.0)
+
+
+# Parsed once per module and shared by every test that reads them; tests
+# that modify a system must parse their own copy.
+@pytest.fixture(scope="module")
+def case5_system():
+    """Parse the 5-bus PJM system."""
+    return parse_matpower(CASE5_PATH)
+
+
+@pytest.fixture(scope="module")
+def case14_system():
+    """Parse the IEEE 14-bus system."""
+    return parse_matpower(CASE14_PATH)
+
+
+@pytest.fixture(scope="module")
+def case14_raw_system():
+    """Parse the IEEE 14-bus system from RAW format."""
+    raw_file = FIXTURES_DIR / "ieee14.raw"
+    if not raw_file.exists():
+        pytest.skip("ieee14.raw fixture not available")
+    from psforge_grid.io.raw_parser import parse_raw
+
+    return parse_raw(raw_file)
+
+
+def _branches_by_endpoints(system):
+    """Group branches by (from_bus, to_bus), keeping parallel branches."""
+    branches = defaultdict(list)
+    for branch in system.branches:
+        branches[(branch.from_bus, branch.to_bus)].append(branch)
+    return dict(branches)
+
+
+@pytest.fixture(scope="module")
+def case5_branches(case5_system):
+    """Branches of the 5-bus PJM system keyed by (from_bus, to_bus)."""
+    return _branches_by_endpoints(case5_system)
+
+
+@pytest.fixture(scope="module")
+def case14_branches(case14_system):
+    """Branches of the IEEE 14-bus system keyed by (from_bus, to_bus)."""
+    return _branches_by_endpoints(case14_system)
 
 
 class TestMatpowerParser:
@@ -29,9 +78,9 @@ class TestMatpowerParser:
         with pytest.raises(FileNotFoundError):
             parse_matpower("nonexistent_file.m")
 
-    def test_parse_returns_system(self, fixtures_dir):
+    def test_parse_returns_system(self):
         """Test that parse_matpower returns a System object."""
-        system = parse_matpower(fixtures_dir / "pglib_opf_case5_pjm.m")
+        system = parse_matpower(CASE5_PATH)
         assert isinstance(system, System)
 
     def test_parser_class_interface(self):
@@ -40,10 +89,10 @@ class TestMatpowerParser:
         assert parser.format_name == "MATPOWER"
         assert "m" in parser.supported_extensions
 
-    def test_parser_class_parse(self, fixtures_dir):
+    def test_parser_class_parse(self):
         """Test that MatpowerParser.parse() works correctly."""
         parser = MatpowerParser()
-        system = parser.parse(fixtures_dir / "pglib_opf_case5_pjm.m")
+        system = parser.parse(CASE5_PATH)
         assert isinstance(system, System)
         assert system.num_buses() == 5
 
@@ -52,9 +101,9 @@ class TestCase5PJM:
     """Test cases for pglib_opf_case5_pjm (5-bus PJM system)."""
 
     @pytest.fixture
-    def system(self, fixtures_dir):
-        """Parse the 5-bus PJM system."""
-        return parse_matpower(fixtures_dir / "pglib_opf_case5_pjm.m")
+    def system(self, case5_system):
+        """Shared parsed 5-bus PJM system."""
+        return case5_system
 
     def test_base_mva(self, system):
         """Test that base MVA is correctly parsed."""
@@ -90,12 +139,11 @@ class TestCase5PJM:
 
     def test_bus_types(self, system):
         """Test bus type assignments."""
-        bus_types = {b.bus_id: b.bus_type for b in system.buses}
-        assert bus_types[1] == 2  # PV
-        assert bus_types[2] == 1  # PQ
-        assert bus_types[3] == 2  # PV
-        assert bus_types[4] == 3  # Slack
-        assert bus_types[5] == 2  # PV
+        assert system.get_bus(1).bus_type == 2  # PV
+        assert system.get_bus(2).bus_type == 1  # PQ
+        assert system.get_bus(3).bus_type == 2  # PV
+        assert system.get_bus(4).bus_type == 3  # Slack
+        assert system.get_bus(5).bus_type == 2  # PV
 
     def test_bus_voltage_limits(self, system):
         """Test bus voltage limits."""
@@ -114,8 +162,8 @@ class TestCase5PJM:
         # Bus 2: Pd=300 MW, Qd=98.61 MVAr on 100 MVA base
         bus2_loads = system.get_bus_loads(2)
         assert len(bus2_loads) == 1
-        assert abs(bus2_loads[0].p_load - 3.0) < 1e-6
-        assert abs(bus2_loads[0].q_load - 0.9861) < 1e-4
+        assert bus2_loads[0].p_load == pytest.approx(3.0, abs=1e-6)
+        assert bus2_loads[0].q_load == pytest.approx(0.9861, abs=1e-4)
 
     def test_generator_pu_conversion(self, system):
         """Test that generator values are correctly converted to per-unit."""
@@ -123,30 +171,29 @@ class TestCase5PJM:
         bus1_gens = system.get_bus_generators(1)
         assert len(bus1_gens) == 2
         gen1 = bus1_gens[0]
-        assert abs(gen1.p_gen - 0.2) < 1e-6
-        assert abs(gen1.p_max - 0.4) < 1e-6
-        assert abs(gen1.p_min - 0.0) < 1e-6
+        assert gen1.p_gen == pytest.approx(0.2, abs=1e-6)
+        assert gen1.p_max == pytest.approx(0.4, abs=1e-6)
+        assert gen1.p_min == pytest.approx(0.0, abs=1e-6)
 
     def test_multiple_generators_same_bus(self, system):
         """Test that multiple generators on bus 1 get unique gen_ids."""
         bus1_gens = system.get_bus_generators(1)
         assert len(bus1_gens) == 2
-        gen_ids = {g.gen_id for g in bus1_gens}
-        assert gen_ids == {"1", "2"}
+        assert sorted(g.gen_id for g in bus1_gens) == ["1", "2"]
 
-    def test_branch_impedance(self, system):
+    def test_branch_impedance(self, case5_branches):
         """Test branch impedance values (already in per-unit)."""
         # Branch 1-2: r=0.00281, x=0.0281, b=0.00712
-        branch_1_2 = [b for b in system.branches if b.from_bus == 1 and b.to_bus == 2]
+        branch_1_2 = case5_branches[(1, 2)]
         assert len(branch_1_2) == 1
         br = branch_1_2[0]
-        assert abs(br.r_pu - 0.00281) < 1e-6
-        assert abs(br.x_pu - 0.0281) < 1e-6
-        assert abs(br.b_pu - 0.00712) < 1e-6
+        assert br.r_pu == pytest.approx(0.00281, abs=1e-6)
+        assert br.x_pu == pytest.approx(0.0281, abs=1e-6)
+        assert br.b_pu == pytest.approx(0.00712, abs=1e-6)
 
-    def test_branch_ratings(self, system):
+    def test_branch_ratings(self, case5_branches):
         """Test that branch ratings are correctly parsed."""
-        branch_1_2 = [b for b in system.branches if b.from_bus == 1 and b.to_bus == 2]
+        branch_1_2 = case5_branches[(1, 2)]
         br = branch_1_2[0]
         assert br.rate_a == 400.0
         assert br.rate_b == 400.0
@@ -157,8 +204,8 @@ class TestCase5PJM:
         branch = system.branches[0]
         assert branch.angmin is not None
         assert branch.angmax is not None
-        assert abs(branch.angmin - math.radians(-30.0)) < 1e-6
-        assert abs(branch.angmax - math.radians(30.0)) < 1e-6
+        assert branch.angmin == pytest.approx(_ANGMIN_RAD, abs=1e-6)
+        assert branch.angmax == pytest.approx(_ANGMAX_RAD, abs=1e-6)
 
     def test_branch_no_transformers(self, system):
         """Test that all branches are transmission lines (ratio=0 → tap=1.0)."""
@@ -188,7 +235,7 @@ class TestCase5PJM:
         """Test cost function evaluation."""
         # Gen 0: cost = 0*P^2 + 14*P + 0
         cost0 = system.generator_costs[0]
-        assert abs(cost0.evaluate(50.0) - 700.0) < 1e-6
+        assert cost0.evaluate(50.0) == pytest.approx(700.0, abs=1e-6)
 
     def test_validation(self, system):
         """Test that the parsed system passes validation."""
@@ -200,9 +247,9 @@ class TestCase14IEEE:
     """Test cases for pglib_opf_case14_ieee (IEEE 14-bus system)."""
 
     @pytest.fixture
-    def system(self, fixtures_dir):
-        """Parse the IEEE 14-bus system."""
-        return parse_matpower(fixtures_dir / "pglib_opf_case14_ieee.m")
+    def system(self, case14_system):
+        """Shared parsed IEEE 14-bus system."""
+        return case14_system
 
     def test_num_buses(self, system):
         """Test that all 14 buses are parsed."""
@@ -226,7 +273,7 @@ class TestCase14IEEE:
         assert system.num_shunts() == 1
         shunt = system.shunts[0]
         assert shunt.bus_id == 9
-        assert abs(shunt.b_pu - 0.19) < 1e-6  # 19.0 / 100.0
+        assert shunt.b_pu == pytest.approx(0.19, abs=1e-6)  # 19.0 / 100.0
 
     def test_num_branches(self, system):
         """Test that 20 branches are parsed."""
@@ -237,23 +284,23 @@ class TestCase14IEEE:
         transformers = [b for b in system.branches if b.is_transformer]
         assert len(transformers) == 3
         # Transformers: 4-7 (0.978), 4-9 (0.969), 5-6 (0.932)
-        xfmr_buses = {(t.from_bus, t.to_bus) for t in transformers}
+        xfmr_buses = [(t.from_bus, t.to_bus) for t in transformers]
         assert (4, 7) in xfmr_buses
         assert (4, 9) in xfmr_buses
         assert (5, 6) in xfmr_buses
 
-    def test_transformer_tap_ratios(self, system):
+    def test_transformer_tap_ratios(self, case14_branches):
         """Test specific transformer tap ratios."""
-        xfmr_4_7 = [b for b in system.branches if b.from_bus == 4 and b.to_bus == 7]
+        xfmr_4_7 = case14_branches[(4, 7)]
         assert len(xfmr_4_7) == 1
-        assert abs(xfmr_4_7[0].tap_ratio - 0.978) < 1e-6
+        assert xfmr_4_7[0].tap_ratio == pytest.approx(0.978, abs=1e-6)
 
     def test_bus_voltage_limits(self, system):
         """Test voltage limits (IEEE 14-bus pglib uses 0.94-1.06)."""
         bus = system.get_bus(1)
         assert bus is not None
-        assert abs(bus.v_max - 1.06) < 1e-6
-        assert abs(bus.v_min - 0.94) < 1e-6
+        assert bus.v_max == pytest.approx(1.06, abs=1e-6)
+        assert bus.v_min == pytest.approx(0.94, abs=1e-6)
 
     def test_slack_bus(self, system):
         """Test that bus 1 is the slack bus."""
@@ -266,8 +313,8 @@ class TestCase14IEEE:
         # Gen at bus 2: Qmax=30, Qmin=-30 MVAr → 0.3, -0.3 pu
         gen_bus2 = system.get_bus_generators(2)
         assert len(gen_bus2) == 1
-        assert abs(gen_bus2[0].q_max - 0.3) < 1e-6
-        assert abs(gen_bus2[0].q_min - (-0.3)) < 1e-6
+        assert gen_bus2[0].q_max == pytest.approx(0.3, abs=1e-6)
+        assert gen_bus2[0].q_min == pytest.approx(-0.3, abs=1e-6)
 
     def test_num_generator_costs(self, system):
         """Test that 5 cost functions are parsed."""
@@ -289,19 +336,14 @@ class TestCrossFormatConsistency:
     """Test consistency between MATPOWER and RAW parsers for IEEE 14-bus."""
 
     @pytest.fixture
-    def mat_system(self, fixtures_dir):
-        """Parse IEEE 14-bus from MATPOWER format."""
-        return parse_matpower(fixtures_dir / "pglib_opf_case14_ieee.m")
+    def mat_system(self, case14_system):
+        """Shared IEEE 14-bus system parsed from MATPOWER format."""
+        return case14_system
 
     @pytest.fixture
-    def raw_system(self, fixtures_dir):
-        """Parse IEEE 14-bus from RAW format."""
-        raw_file = fixtures_dir / "ieee14.raw"
-        if not raw_file.exists():
-            pytest.skip("ieee14.raw fixture not available")
-        from psforge_grid.io.raw_parser import parse_raw
-
-        return parse_raw(raw_file)
+    def raw_system(self, case14_raw_system):
+        """Shared IEEE 14-bus system parsed from RAW format."""
+        return case14_raw_system
 
     def test_same_num_buses(self, mat_system, raw_system):
         """Test that both formats produce the same number of buses."""
@@ -334,9 +376,9 @@ class TestParserFactory:
         parser = ParserFactory.from_extension("m")
         assert isinstance(parser, MatpowerParser)
 
-    def test_from_path(self, fixtures_dir):
+    def test_from_path(self):
         """Test creating parser from file path."""
-        parser = ParserFactory.from_path(fixtures_dir / "pglib_opf_case5_pjm.m")
+        parser = ParserFactory.from_path(CASE5_PATH)
         assert isinstance(parser, MatpowerParser)
 
     def test_available_formats_includes_matpower(self):
@@ -349,19 +391,31 @@ class TestParserFactory:
         extensions = ParserFactory.supported_extensions()
         assert "m" in extensions
 
-    def test_system_from_file(self, fixtures_dir):
+    def test_system_from_file(self):
         """Test System.from_file() auto-detection with .m extension."""
-        system = System.from_file(fixtures_dir / "pglib_opf_case5_pjm.m")
+        system = System.from_file(CASE5_PATH)
         assert isinstance(system, System)
         assert system.num_buses() == 5
 
-    def test_system_from_matpower(self, fixtures_dir):
+    def test_system_from_matpower(self):
         """Test System.from_matpower() factory method."""
-        system = System.from_matpower(fixtures_dir / "pglib_opf_case5_pjm.m")
+        system = System.from_matpower(CASE5_PATH)
         assert isinstance(system, System)
         assert system.num_buses() == 5
 
 
+@pytest.fixture(scope="module")
+def quadratic_cost():
+    """Quadratic cost 0.04*P^2 + 20*P + 100, shared read-only."""
+    return GeneratorCost(gen_index=0, model=2, coefficients=[0.04, 20.0, 100.0])
+
+
+@pytest.fixture(scope="module")
+def piecewise_cost():
+    """Piecewise linear cost through (0, 0) and (100, 2000), shared read-only."""
+    return GeneratorCost(gen_index=0, model=1, coefficients=[0, 0, 100, 2000])
+
+
 class TestGeneratorCost:
     """Test GeneratorCost dataclass."""
 
@@ -370,40 +424,36 @@ class TestGeneratorCost:
         with pytest.raises(ValueError, match="Invalid cost model"):
             GeneratorCost(gen_index=0, model=3)
 
-    def test_polynomial_model(self):
+    def test_polynomial_model(self, quadratic_cost):
         """Test polynomial cost model properties."""
-        cost = GeneratorCost(gen_index=0, model=2, coefficients=[0.04, 20.0, 100.0])
-        assert cost.is_polynomial
-        assert not cost.is_piecewise_linear
-        assert cost.n_coefficients == 3
+        assert quadratic_cost.is_polynomial
+        assert not quadratic_cost.is_piecewise_linear
+        assert quadratic_cost.n_coefficients == 3
 
-    def test_piecewise_linear_model(self):
+    def test_piecewise_linear_model(self, piecewise_cost):
         """Test piecewise linear cost model properties."""
-        cost = GeneratorCost(gen_index=0, model=1, coefficients=[0, 0, 100, 2000])
-        assert cost.is_piecewise_linear
-        assert not cost.is_polynomial
+        assert piecewise_cost.is_piecewise_linear
+        assert not piecewise_cost.is_polynomial
 
-    def test_evaluate_quadratic(self):
+    def test_evaluate_quadratic(self, quadratic_cost):
         """Test polynomial evaluation: 0.04*P^2 + 20*P + 100."""
-        cost = GeneratorCost(gen_index=0, model=2, coefficients=[0.04, 20.0, 100.0])
         # At P=50: 0.04*2500 + 20*50 + 100 = 100 + 1000 + 100 = 1200
-        assert abs(cost.evaluate(50.0) - 1200.0) < 1e-6
+        assert quadratic_cost.evaluate(50.0) == pytest.approx(1200.0, abs=1e-6)
 
     def test_evaluate_linear(self):
         """Test polynomial evaluation of linear cost: 14*P + 0."""
         cost = GeneratorCost(gen_index=0, model=2, coefficients=[0.0, 14.0, 0.0])
-        assert abs(cost.evaluate(100.0) - 1400.0) < 1e-6
+        assert cost.evaluate(100.0) == pytest.approx(1400.0, abs=1e-6)
 
     def test_evaluate_empty_coefficients(self):
         """Test evaluation with empty coefficients returns 0."""
         cost = GeneratorCost(gen_index=0, model=2)
         assert cost.evaluate(50.0) == 0.0
 
-    def test_evaluate_piecewise_raises(self):
+    def test_evaluate_piecewise_raises(self, piecewise_cost):
         """Test that piecewise linear evaluate raises ValueError."""
-        cost = GeneratorCost(gen_index=0, model=1, coefficients=[0, 0, 100, 2000])
         with pytest.raises(ValueError, match="Piecewise linear"):
-            cost.evaluate(50.0)
+            piecewise_cost.evaluate(50.0)
 
     def test_to_description(self):
         """Test LLM-friendly description output."""
@@ -1,13 +1,25 @@
 """Tests for power system data models.
 
-Tests the fundamental data classes: Bus, Branch, Generator, Load, Shunt, and System.
+Tests the fundamental data classes: Bus, Branch, Generator, Load, Shunt, and System,
+plus the semantic status enums and LimitsConfig.
 """
 
+import dataclasses
+import io
+
 import pytest
 
 from psforge_grid.models.branch import Branch
 from psforge_grid.models.bus import Bus
+from psforge_grid.models.enums import (
+    BusType,
+    LoadingStatus,
+    Severity,
+    SystemHealthStatus,
+    VoltageStatus,
+)
 from psforge_grid.models.generator import Generator
+from psforge_grid.models.limits import LimitsConfig
 from psforge_grid.models.load import Load
 from psforge_grid.models.shunt import Shunt
 from psforge_grid.models.system import System
@@ -76,6 +88,42 @@ class TestBus:
         assert bus.area == 2
         assert bus.zone == 3
 
+    def test_bus_type_name(self):
+        """Test bus type display names, including out-of-range codes."""
+        names = [Bus(bus_id=1, bus_type=t).bus_type_name for t in (1, 2, 3, 4)]
+        assert names == ["PQ (Load)", "PV (Generator)", "Slack", "Isolated"]
+
+        bus = Bus(bus_id=1, bus_type=1)
+        bus.bus_type = 0
+        assert bus.bus_type_name == "Unknown (0)"
+
+    def test_bus_write_description(self):
+        """Test that write_description streams to_description plus newline."""
+        buses = [Bus(bus_id=1, bus_type=3, name="Main"), Bus(bus_id=2, bus_type=1)]
+        buf = io.StringIO()
+        for bus in buses:
+            bus.write_description(buf)
+        assert buf.getvalue() == "".join(f"{b.to_description()}\n" for b in buses)
+
+    def test_bus_from_rows(self):
+        """Test bulk creation matches keyword construction."""
+        rows = [
+            (1, 3, 1.06, 0.0, 138.0, 1, 1, 1.1, 0.9, "Gen", None),
+            (2, 1, 0.98, -0.1, 138.0, 2, 1, 1.05, 0.95, None, "load bus"),
+        ]
+        buses = Bus.from_rows(rows)
+        assert buses[0] == Bus(1, 3, 1.06, 0.0, 138.0, 1, 1, 1.1, 0.9, "Gen", None)
+        assert buses[1].description == "load bus"
+        assert buses[1].is_pq
+        assert Bus.from_rows([]) == []
+
+    def test_bus_from_rows_invalid_type(self):
+        """Test that bulk creation validates bus types."""
+        rows = [(1, 3, 1.0, 0.0, 1.0, 1, 1, 1.1, 0.9, None, None)]
+        rows.append((2, 7, 1.0, 0.0, 1.0, 1, 1, 1.1, 0.9, None, None))
+        with pytest.raises(ValueError, match="Invalid bus_type: 7"):
+            Bus.from_rows(rows)
+
 
 class TestBranch:
     """Test cases for Branch class."""
@@ -119,6 +167,29 @@ class TestBranch:
         assert xfmr_tap.is_transformer is True
         assert xfmr_shift.is_transformer is True
 
+    def test_branch_admittance(self):
+        """Test series admittance is the reciprocal of series impedance."""
+        branch = Branch(from_bus=1, to_bus=2, r_pu=0.0, x_pu=0.1)
+        assert branch.admittance_pu == pytest.approx(-10j)
+
+    def test_branch_type_name_tracks_settings(self):
+        """Test that branch_type_name follows tap/shift changes after creation."""
+        branch = Branch(from_bus=1, to_bus=2, r_pu=0.0, x_pu=0.05)
+        assert branch.branch_type_name == "Transmission Line"
+
+        branch.tap_ratio = 1.05
+        assert branch.branch_type_name == "Transformer"
+
+        branch.shift_angle = 0.1
+        assert branch.branch_type_name == "Phase-Shifting Transformer"
+
+    def test_branch_key(self):
+        """Test that key distinguishes parallel circuits between the same buses."""
+        c1 = Branch(from_bus=1, to_bus=2, r_pu=0.01, x_pu=0.1)
+        c2 = Branch(from_bus=1, to_bus=2, r_pu=0.01, x_pu=0.1, circuit_id="2")
+        assert c1.key == (1, 2, "1")
+        assert len({c1.key, c2.key}) == 2
+
     def test_branch_status(self):
         """Test branch status."""
         branch_in = Branch(from_bus=1, to_bus=2, r_pu=0.01, x_pu=0.1, status=1)
@@ -127,6 +198,32 @@ class TestBranch:
         assert branch_in.is_in_service is True
         assert branch_out.is_in_service is False
 
+    def test_branch_write_description(self):
+        """Test that write_description streams to_description plus newline."""
+        branch = Branch(from_bus=1, to_bus=2, r_pu=0.01, x_pu=0.1, rate_a=100.0)
+        buf = io.StringIO()
+        branch.write_description(buf)
+        assert buf.getvalue() == branch.to_description() + "\n"
+        assert "Rating: 100.0 MVA" in buf.getvalue()
+
+    def test_branch_from_rows(self):
+        """Test bulk creation matches keyword construction."""
+        row = (1, 2, 0.01, 0.1, 0.02, 1.05, 0.0, 100.0, None, None, None, None, 1, "2", None, None)
+        (branch,) = Branch.from_rows([row])
+        assert branch == Branch(*row)
+        assert branch.circuit_id == "2"
+        assert branch.is_transformer
+
+    @pytest.mark.parametrize(
+        "tap_ratio,status,message",
+        [(0.0, 1, "tap_ratio cannot be zero"), (1.0, 3, "Invalid status")],
+    )
+    def test_branch_from_rows_invalid(self, tap_ratio, status, message):
+        """Test that bulk creation validates status and tap ratio."""
+        row = (1, 2, 0.01, 0.1, 0.0, tap_ratio, 0.0, None, None, None, None, None, status, "1")
+        with pytest.raises(ValueError, match=message):
+            Branch.from_rows([(*row, None, None)])
+
     def test_branch_invalid_status(self):
         """Test that invalid status raises ValueError."""
         with pytest.raises(ValueError, match="Invalid status"):
@@ -196,6 +293,17 @@ class TestGenerator:
         assert within is False
         assert val == -0.3
 
+    def test_generator_write_description(self):
+        """Test that write_description streams to_description plus newline."""
+        gens = [
+            Generator(bus_id=1, p_gen=1.0, q_max=0.5, name="G1"),
+            Generator(bus_id=2, p_gen=0.3),
+        ]
+        buf = io.StringIO()
+        for gen in gens:
+            gen.write_description(buf)
+        assert buf.getvalue() == "".join(f"{g.to_description()}\n" for g in gens)
+
 
 class TestLoad:
     """Test cases for Load class."""
@@ -243,6 +351,23 @@ class TestLoad:
         zero_load = Load(bus_id=2, p_load=0.0, q_load=0.0)
         assert zero_load.power_factor == 1.0
 
+    def test_load_derived_values_track_changes(self):
+        """Test that apparent power and power factor follow demand changes."""
+        load = Load(bus_id=2, p_load=0.3, q_load=0.4)
+        load.p_load = 0.0
+        load.q_load = 0.0
+        assert load.apparent_power == 0.0
+        assert load.power_factor == 1.0
+
+    def test_load_from_rows(self):
+        """Test bulk creation matches keyword construction and validates status."""
+        row = (3, 0.3, 0.1, 0, "A", None, "feeder")
+        (load,) = Load.from_rows([row])
+        assert load == Load(*row)
+        assert load.is_in_service is False
+        with pytest.raises(ValueError, match="Invalid status"):
+            Load.from_rows([row, (4, 0.1, 0.0, 2, "1", None, None)])
+
 
 class TestShunt:
     """Test cases for Shunt class."""
@@ -279,6 +404,98 @@ class TestShunt:
         with pytest.raises(ValueError, match="Invalid status"):
             Shunt(bus_id=1, status=2)
 
+    def test_shunt_from_rows(self):
+        """Test bulk creation matches keyword construction and validates status."""
+        rows = [(1, 0.0, 0.5, 1, "1", "Cap1", None), (2, 0.01, -0.3, 1, "R", None, None)]
+        shunts = Shunt.from_rows(rows)
+        assert shunts == [Shunt(*row) for row in rows]
+        assert shunts[1].is_reactor
+        with pytest.raises(ValueError, match="Invalid status"):
+            Shunt.from_rows([(1, 0.0, 0.5, 3, "1", None, None)])
+
+
+class TestLimitsConfig:
+    """Test cases for LimitsConfig class."""
+
+    def test_factories_return_shared_instances(self):
+        """Test that preset factories build each configuration once."""
+        assert LimitsConfig.normal() is LimitsConfig.normal()
+        assert LimitsConfig.normal() == LimitsConfig()
+        assert LimitsConfig.emergency().thermal_limit_percent == 120.0
+        assert LimitsConfig.strict().voltage_min_pu == 0.97
+
+    def test_limits_are_frozen(self):
+        """Test that shared presets cannot be modified."""
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            LimitsConfig.normal().voltage_min_pu = 0.9  # type: ignore[misc]
+
+    def test_description_per_configuration(self):
+        """Test that equal configs share a description and different ones do not."""
+        desc = LimitsConfig().to_description()
+        assert "0.950 - 1.050 pu (normal)" in desc
+        assert LimitsConfig().to_description() == desc
+        assert "0.900 - 1.100 pu (normal)" in LimitsConfig.emergency().to_description()
+
+
+class TestStatusEnums:
+    """Test cases for status enum properties."""
+
+    @pytest.mark.parametrize(
+        "status,severity",
+        [
+            (VoltageStatus.NOT_CLASSIFIED, Severity.INFO),
+            (VoltageStatus.CRITICAL_LOW, Severity.CRITICAL),
+            (VoltageStatus.LOW, Severity.WARNING),
+            (VoltageStatus.NORMAL, Severity.INFO),
+            (VoltageStatus.HIGH, Severity.WARNING),
+            (VoltageStatus.CRITICAL_HIGH, Severity.CRITICAL),
+            (LoadingStatus.NOT_CLASSIFIED, Severity.INFO),
+            (LoadingStatus.LIGHT, Severity.INFO),
+            (LoadingStatus.NORMAL, Severity.INFO),
+            (LoadingStatus.HEAVY, Severity.WARNING),
+            (LoadingStatus.OVERLOAD, Severity.ERROR),
+        ],
+    )
+    def test_severity(self, status, severity):
+        """Test that every status member maps to its severity."""
+        assert status.severity is severity
+
+    def test_voltage_groups(self):
+        """Test violation/critical membership of voltage statuses."""
+        violations = {s for s in VoltageStatus if s.is_violation}
+        critical = {s for s in VoltageStatus if s.is_critical}
+        assert violations == {
+            VoltageStatus.CRITICAL_LOW,
+            VoltageStatus.LOW,
+            VoltageStatus.HIGH,
+            VoltageStatus.CRITICAL_HIGH,
+        }
+        assert critical == {VoltageStatus.CRITICAL_LOW, VoltageStatus.CRITICAL_HIGH}
+
+    def test_string_values_preserved(self):
+        """Test that status values remain the LLM-facing strings."""
+        assert VoltageStatus.LOW.value == "LOW"
+        assert str(LoadingStatus.OVERLOAD) == "OVERLOAD"
+
+    @pytest.mark.parametrize(
+        "severities,health",
+        [
+            ([], SystemHealthStatus.HEALTHY),
+            ([Severity.INFO, Severity.INFO], SystemHealthStatus.HEALTHY),
+            ([Severity.INFO, Severity.WARNING], SystemHealthStatus.WARNING),
+            ([Severity.WARNING, Severity.ERROR], SystemHealthStatus.CRITICAL),
+            ([Severity.INFO, Severity.CRITICAL, Severity.WARNING], SystemHealthStatus.CRITICAL),
+        ],
+    )
+    def test_health_from_severities(self, severities, health):
+        """Test that system health reflects the worst severity."""
+        assert SystemHealthStatus.from_severities(severities) is health
+
+    def test_bus_type(self):
+        """Test BusType display names and generator flag."""
+        assert str(BusType.SLACK) == "Slack (Reference)"
+        assert [t.is_generator for t in BusType] == [False, True, True, False]
+
 
 class TestSystem:
     """Test cases for System class."""
@@ -341,6 +558,76 @@ class TestSystem:
         with pytest.raises(ValueError, match="Bus 3 not found"):
             system.get_bus_index(3)
 
+    def test_system_bus_lookup_follows_list_changes(self):
+        """Test bus lookups stay correct when buses change after a lookup."""
+        bus1 = Bus(bus_id=1, bus_type=3)
+        bus2 = Bus(bus_id=2, bus_type=1)
+        system = System(buses=[bus1, bus2])
+        assert system.get_bus_index(2) == 1
+
+        bus3 = Bus(bus_id=3, bus_type=1)
+        system.buses.append(bus3)
+        assert system.get_bus(3) is bus3
+
+        system.buses.remove(bus1)
+        assert system.get_bus(1) is None
+        assert system.get_bus_index(2) == 0
+
+        bus2.bus_id = 20
+        assert system.get_bus(2) is None
+        assert system.get_bus(20) is bus2
+
+        system.buses = [bus3]
+        assert system.get_bus_index(3) == 0
+
+    def test_system_warm_caches(self):
+        """Test lookups after warm_caches match a cold system."""
+        gen = Generator(bus_id=2, p_gen=1.0)
+        branch = Branch(from_bus=1, to_bus=2, r_pu=0.01, x_pu=0.1)
+        system = System(
+            buses=[Bus(bus_id=1, bus_type=3), Bus(bus_id=2, bus_type=2)],
+            branches=[branch],
+            generators=[gen],
+        )
+        system.warm_caches()
+        assert system.get_bus_index(2) == 1
+        assert system.get_bus_generators(2) == [gen]
+        assert system.get_branches_at_bus(1) == [branch]
+        assert system.get_bus_loads(1) == []
+
+    def test_system_bus_index_is_not_a_field(self):
+        """Test the private bus index stays out of fields(), asdict() and replace()."""
+        system = System(buses=[Bus(bus_id=1, bus_type=3)])
+        assert system.get_bus(1) is not None  # builds the lookup index
+        assert "_bus_index" not in {f.name for f in dataclasses.fields(System)}
+        assert "_bus_index" not in dataclasses.asdict(system)
+        copied = dataclasses.replace(system)
+        assert copied.get_bus(1) is system.buses[0]
+
+    def test_system_get_buses_bulk(self):
+        """Test bulk lookups match the single-ID methods."""
+        bus1 = Bus(bus_id=1, bus_type=3)
+        bus5 = Bus(bus_id=5, bus_type=1)
+        system = System(buses=[bus1, bus5])
+
+        assert system.get_buses([5, 1, 9]) == [bus5, bus1, None]
+        assert system.get_bus_indices(iter([5, 1, 5])) == [1, 0, 1]
+        assert system.get_buses([]) == []
+
+        bus7 = Bus(bus_id=7, bus_type=1)
+        system.buses.insert(0, bus7)
+        assert system.get_bus_indices([1, 5, 7]) == [1, 2, 0]
+
+        with pytest.raises(ValueError, match=r"\[8, 9\]"):
+            system.get_bus_indices([1, 9, 8, 9])
+
+    def test_system_get_bus_duplicate_returns_first(self):
+        """Test get_bus returns the first bus when IDs are duplicated."""
+        first = Bus(bus_id=1, bus_type=3)
+        system = System(buses=[first, Bus(bus_id=1, bus_type=1)])
+        assert system.get_bus(1) is first
+        assert system.get_bus_index(1) == 0
+
     def test_system_get_bus_ids(self):
         """Test get_bus_ids method."""
         bus1 = Bus(bus_id=1, bus_type=3)
@@ -411,6 +698,67 @@ class TestSystem:
         assert b1 in branches2
         assert b2 in branches2
 
+    def test_system_component_lookup_follows_list_changes(self):
+        """Test per-bus component lookups after the component lists change."""
+        gen1 = Generator(bus_id=1, p_gen=1.0)
+        system = System(generators=[gen1], branches=[Branch(1, 1, r_pu=0.0, x_pu=0.1)])
+        assert system.get_bus_generators(1) == [gen1]
+        assert len(system.get_branches_at_bus(1)) == 1
+
+        gen2 = Generator(bus_id=2, p_gen=0.5)
+        system.generators.append(gen2)
+        assert system.get_bus_generators(2) == [gen2]
+
+        gen1.status = 0
+        assert system.get_bus_generators(1) == []
+        assert system.get_bus_generators(1, in_service_only=False) == [gen1]
+
+        gen2.bus_id = 1
+        assert system.get_bus_generators(2) == []
+        assert system.get_bus_generators(1) == [gen2]
+
+        system.generators = []
+        assert system.get_bus_generators(1) == []
+
+    def test_system_component_lookup_after_pop_and_append(self):
+        """Test lookups when a pop+append leaves the list length unchanged."""
+        load1 = Load(bus_id=1, p_load=0.8, q_load=0.2)
+        system = System(loads=[load1])
+        assert system.get_bus_loads(1) == [load1]
+        assert system.get_bus_pq_injection(1) == pytest.approx((-0.8, -0.2))
+
+        system.loads.pop()
+        load2 = Load(bus_id=2, p_load=0.5, q_load=0.1)
+        system.loads.append(load2)
+        assert system.get_bus_loads(1) == []
+        assert system.get_bus_loads(2) == [load2]
+        assert system.get_bus_pq_injection(1) == (0.0, 0.0)
+        assert system.get_bus_pq_injection(2) == pytest.approx((-0.5, -0.1))
+
+    def test_system_component_lookup_after_in_place_replace(self):
+        """Test lookups when a list element is replaced in place."""
+        system = System(
+            loads=[Load(bus_id=1, p_load=0.8, q_load=0.2)],
+            shunts=[Shunt(bus_id=1, b_pu=0.1)],
+            branches=[Branch(from_bus=1, to_bus=2, r_pu=0.01, x_pu=0.1)],
+        )
+        assert len(system.get_bus_loads(1)) == 1
+        assert system.get_bus_shunt_admittance(1) == pytest.approx((0.0, 0.1))
+        assert len(system.get_branches_at_bus(3)) == 0
+
+        load = Load(bus_id=2, p_load=0.5, q_load=0.1)
+        system.loads[0] = load
+        system.shunts[0] = Shunt(bus_id=2, b_pu=0.2)
+        branch = Branch(from_bus=2, to_bus=3, r_pu=0.01, x_pu=0.1)
+        system.branches[0] = branch
+        assert system.get_bus_loads(1) == []
+        assert system.get_bus_loads(2) == [load]
+        assert system.get_bus_pq_injection(2) == pytest.approx((-0.5, -0.1))
+        assert system.get_bus_shunt_admittance(1) == (0.0, 0.0)
+        assert system.get_bus_shunt_admittance(2) == pytest.approx((0.0, 0.2))
+        assert system.get_branches_at_bus(1) == []
+        assert system.get_branches_at_bus(3) == [branch]
+
     def test_system_power_injection(self):
         """Test power injection calculations."""
         gen1 = Generator(bus_id=1, p_gen=2.0, q_gen=0.5)
@@ -424,6 +772,25 @@ class TestSystem:
         assert p_inj == pytest.approx(1.2)  # 2.0 - 0.8
         assert q_inj == pytest.approx(0.3)  # 0.5 - 0.2
 
+    def test_system_pq_injection(self):
+        """Test fused P/Q injection sums in-service components at the bus."""
+        system = System(
+            generators=[
+                Generator(bus_id=1, p_gen=2.0, q_gen=0.5),
+                Generator(bus_id=1, p_gen=1.0, q_gen=0.4, status=0),
+                Generator(bus_id=2, p_gen=0.7, q_gen=0.1),
+            ],
+            loads=[
+                Load(bus_id=1, p_load=0.8, q_load=0.2),
+                Load(bus_id=1, p_load=0.1, q_load=0.05),
+            ],
+        )
+
+        p_inj, q_inj = system.get_bus_pq_injection(1)
+        assert p_inj == pytest.approx(1.1)  # 2.0 - (0.8 + 0.1)
+        assert q_inj == pytest.approx(0.25)  # 0.5 - (0.2 + 0.05)
+        assert system.get_bus_pq_injection(3) == (0.0, 0.0)
+
     def test_system_shunt_admittance(self):
         """Test shunt admittance calculation."""
         shunt1 = Shunt(bus_id=1, g_pu=0.01, b_pu=0.5)
@@ -476,6 +843,25 @@ class TestSystem:
         assert p == pytest.approx(1.2)
         assert q == pytest.approx(0.3)
 
+    def test_system_totals_are_correctly_rounded(self):
+        """Test totals do not lose small terms next to large cancelling ones."""
+        system = System(
+            generators=[Generator(bus_id=1, p_gen=p) for p in (1e16, 1.0, -1e16)],
+            loads=[Load(bus_id=1, p_load=p) for p in (1e16, 1.0, -1e16)],
+        )
+        assert system.total_generation()[0] == 1.0
+        assert system.total_load()[0] == 1.0
+
+    def test_system_llm_context_bus_types(self):
+        """Test the bus type summary in to_llm_context follows bus changes."""
+        buses = [Bus(1, 3), Bus(2, 2), Bus(3, 1), Bus(4, 1), Bus(5, 3)]
+        system = System(buses=buses)
+        context = system.to_llm_context()
+        assert "- Slack: 2 (1, 5)\n- PV: 1\n- PQ: 2" in context
+
+        buses[1].bus_type = 1  # PV bus switched to PQ (e.g., Q limit hit)
+        assert system.to_llm_context().endswith("- PV: 0\n- PQ: 3")
+
     def test_system_with_name(self):
         """Test System with a custom name."""
         system = System(name="IEEE 9-Bus System")
@@ -10,11 +10,28 @@ import pytest
 from psforge_grid.io.raw_parser import parse_raw
 from psforge_grid.models.system import System
 
+# Path to test fixtures
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
-@pytest.fixture
-def fixtures_dir():
-    """Return path to test fixtures directory."""
-    return Path(__file__).parent / "fixtures"
+
+# Parsed once per module and shared by every test that reads them; tests
+# that modify a system must parse their own copy.
+@pytest.fixture(scope="module")
+def ieee9_system():
+    """Parse the IEEE 9-bus system."""
+    return parse_raw(FIXTURES_DIR / "ieee9.raw")
+
+
+@pytest.fixture(scope="module")
+def ieee14_system():
+    """Parse the IEEE 14-bus system."""
+    return parse_raw(FIXTURES_DIR / "ieee14.raw")
+
+
+@pytest.fixture(scope="module")
+def ieee118_system():
+    """Parse the IEEE 118-bus system."""
+    return parse_raw(FIXTURES_DIR / "ieee118_powsybl.raw")
 
 
 class TestRawParser:
@@ -45,19 +62,21 @@ class TestRawParser:
 class TestIEEE9Bus:
     """Test cases for IEEE 9-bus system (v34 format)."""
 
-    def test_parse_ieee9_returns_system(self, fixtures_dir):
+    @pytest.fixture
+    def system(self, ieee9_system):
+        """Shared parsed IEEE 9-bus system."""
+        return ieee9_system
+
+    def test_parse_ieee9_returns_system(self, system):
         """Test that parsing IEEE 9-bus returns a System object."""
-        system = parse_raw(fixtures_dir / "ieee9.raw")
         assert isinstance(system, System)
 
-    def test_parse_ieee9_base_mva(self, fixtures_dir):
+    def test_parse_ieee9_base_mva(self, system):
         """Test that base MVA is correctly parsed."""
-        system = parse_raw(fixtures_dir / "ieee9.raw")
         assert system.base_mva == 100.0
 
-    def test_parse_ieee9_buses(self, fixtures_dir):
+    def test_parse_ieee9_buses(self, system):
         """Test that all 9 buses are correctly parsed."""
-        system = parse_raw(fixtures_dir / "ieee9.raw")
         assert len(system.buses) == 9
 
         # Check bus types
@@ -70,9 +89,8 @@ class TestIEEE9Bus:
         assert len(pv_buses) == 2
         assert len(pq_buses) == 6
 
-    def test_parse_ieee9_generators(self, fixtures_dir):
+    def test_parse_ieee9_generators(self, system):
         """Test that all 3 generators are correctly parsed."""
-        system = parse_raw(fixtures_dir / "ieee9.raw")
         assert len(system.generators) == 3
 
         # Check generator locations
@@ -83,9 +101,8 @@ class TestIEEE9Bus:
         total_p, _ = system.total_generation()
         assert abs(total_p * system.base_mva - 319.94) < 0.1
 
-    def test_parse_ieee9_loads(self, fixtures_dir):
+    def test_parse_ieee9_loads(self, system):
         """Test that all 3 loads are correctly parsed."""
-        system = parse_raw(fixtures_dir / "ieee9.raw")
         assert len(system.loads) == 3
 
         # Check load locations
@@ -96,9 +113,8 @@ class TestIEEE9Bus:
         total_p, _ = system.total_load()
         assert abs(total_p * system.base_mva - 315.0) < 0.1
 
-    def test_parse_ieee9_branches(self, fixtures_dir):
+    def test_parse_ieee9_branches(self, system):
         """Test that all 9 branches (6 lines + 3 transformers) are parsed."""
-        system = parse_raw(fixtures_dir / "ieee9.raw")
         assert len(system.branches) == 9
 
         # Check that transmission lines have non-zero B (charging susceptance)
@@ -109,10 +125,8 @@ class TestIEEE9Bus:
         transformers = [b for b in system.branches if b.b_pu == 0]
         assert len(transformers) == 3
 
-    def test_parse_ieee9_power_balance(self, fixtures_dir):
+    def test_parse_ieee9_power_balance(self, system):
         """Test that generation exceeds load (accounting for losses)."""
-        system = parse_raw(fixtures_dir / "ieee9.raw")
-
         total_gen, _ = system.total_generation()
         total_load, _ = system.total_load()
 
@@ -127,19 +141,21 @@ class TestIEEE14Bus:
     https://github.com/ITI/models/blob/master/electric-grid/physical/reference/ieee-14bus/
     """
 
-    def test_parse_ieee14_returns_system(self, fixtures_dir):
+    @pytest.fixture
+    def system(self, ieee14_system):
+        """Shared parsed IEEE 14-bus system."""
+        return ieee14_system
+
+    def test_parse_ieee14_returns_system(self, system):
         """Test that parsing IEEE 14-bus returns a System object."""
-        system = parse_raw(fixtures_dir / "ieee14.raw")
         assert isinstance(system, System)
 
-    def test_parse_ieee14_base_mva(self, fixtures_dir):
+    def test_parse_ieee14_base_mva(self, system):
         """Test that base MVA is correctly parsed."""
-        system = parse_raw(fixtures_dir / "ieee14.raw")
         assert system.base_mva == 100.0
 
-    def test_parse_ieee14_buses(self, fixtures_dir):
+    def test_parse_ieee14_buses(self, system):
         """Test that all 14 buses are correctly parsed."""
-        system = parse_raw(fixtures_dir / "ieee14.raw")
         assert len(system.buses) == 14
 
         # Check bus types: 1 slack, 4 PV (gens at buses 2,3,6,8), 9 PQ
@@ -152,41 +168,49 @@ class TestIEEE14Bus:
         assert len(pv_buses) == 4
         assert len(pq_buses) == 9
 
-    def test_parse_ieee14_generators(self, fixtures_dir):
+    def test_parse_ieee14_generators(self, system):
         """Test that all 5 generators are correctly parsed."""
-        system = parse_raw(fixtures_dir / "ieee14.raw")
         assert len(system.generators) == 5
 
         # Check generator locations
         gen_buses = {g.bus_id for g in system.generators}
         assert gen_buses == {1, 2, 3, 6, 8}
 
-    def test_parse_ieee14_loads(self, fixtures_dir):
+    def test_parse_ieee14_loads(self, system):
         """Test that all 11 loads are correctly parsed."""
-        system = parse_raw(fixtures_dir / "ieee14.raw")
         assert len(system.loads) == 11
 
         # Check total load (approximately 259 MW)
         total_p, _ = system.total_load()
         assert abs(total_p * system.base_mva - 259.0) < 1.0
 
-    def test_parse_ieee14_branches(self, fixtures_dir):
+    def test_parse_ieee14_branches(self, system):
         """Test that all 20 branches are parsed (17 lines + 3 transformers)."""
-        system = parse_raw(fixtures_dir / "ieee14.raw")
         assert len(system.branches) == 20
 
-    def test_parse_ieee14_shunts(self, fixtures_dir):
+    def test_parse_ieee14_shunts(self, system):
         """Test that the shunt capacitor at bus 9 is parsed."""
-        system = parse_raw(fixtures_dir / "ieee14.raw")
         assert len(system.shunts) == 1
         assert system.shunts[0].bus_id == 9
         # 19 MVAr capacitor -> positive B
         assert system.shunts[0].b_pu > 0
 
-    def test_parse_ieee14_power_balance(self, fixtures_dir):
+    def test_parse_ieee14_names_trimmed(self, system):
+        """Test that quoted bus names lose their fixed-width padding."""
+        assert system.get_bus(1).name == "Bus 1"
+        assert all(bus.name == bus.name.strip() for bus in system.buses)
+
+    def test_parse_ieee14_ids_trimmed(self, system):
+        """Test that quoted load, generator, shunt and circuit IDs are trimmed."""
+        assert {load.load_id for load in system.loads} == {"1"}
+        assert {g.gen_id for g in system.generators} == {"1"}
+        assert system.shunts[0].shunt_id == "1"
+        keys = {b.key for b in system.branches}
+        assert (1, 2, "1") in keys  # line
+        assert (4, 7, "1") in keys  # transformer
+
+    def test_parse_ieee14_power_balance(self, system):
         """Test that generation exceeds load (accounting for losses)."""
-        system = parse_raw(fixtures_dir / "ieee14.raw")
-
         total_gen, _ = system.total_generation()
         total_load, _ = system.total_load()
 
@@ -201,29 +225,29 @@ class TestIEEE118Bus:
     https://github.com/powsybl/powsybl-distribution/blob/main/resources/PSSE/IEEE_118_bus.raw
     """
 
-    def test_parse_ieee118_returns_system(self, fixtures_dir):
+    @pytest.fixture
+    def system(self, ieee118_system):
+        """Shared parsed IEEE 118-bus system."""
+        return ieee118_system
+
+    def test_parse_ieee118_returns_system(self, system):
         """Test that parsing IEEE 118-bus returns a System object."""
-        system = parse_raw(fixtures_dir / "ieee118_powsybl.raw")
         assert isinstance(system, System)
 
-    def test_parse_ieee118_buses(self, fixtures_dir):
+    def test_parse_ieee118_buses(self, system):
         """Test that all 118 buses are correctly parsed."""
-        system = parse_raw(fixtures_dir / "ieee118_powsybl.raw")
         assert len(system.buses) == 118
 
-    def test_parse_ieee118_generators(self, fixtures_dir):
+    def test_parse_ieee118_generators(self, system):
         """Test that all 54 generators are correctly parsed."""
-        system = parse_raw(fixtures_dir / "ieee118_powsybl.raw")
         assert len(system.generators) == 54
 
-    def test_parse_ieee118_branches(self, fixtures_dir):
+    def test_parse_ieee118_branches(self, system):
         """Test that all 186 branches are parsed."""
-        system = parse_raw(fixtures_dir / "ieee118_powsybl.raw")
         assert len(system.branches) == 186
 
-    def test_parse_ieee118_shunts(self, fixtures_dir):
+    def test_parse_ieee118_shunts(self, system):
         """Test that all 14 shunts are parsed."""
-        system = parse_raw(fixtures_dir / "ieee118_powsybl.raw")
         assert len(system.shunts) == 14
 
 
@@ -236,28 +260,50 @@ class TestParserTolerance:
     - Mixed styles (v33 header with v34-style section markers)
     """
 
-    def test_v33_format_no_begin_marker(self, fixtures_dir):
+    def test_v33_format_no_begin_marker(self, ieee14_system):
         """Test that v33 format without explicit BEGIN BUS DATA marker works."""
         # IEEE 14-bus uses v33 format where bus data starts after line 3
-        system = parse_raw(fixtures_dir / "ieee14.raw")
-        assert len(system.buses) == 14
+        assert len(ieee14_system.buses) == 14
 
-    def test_v34_format_with_begin_markers(self, fixtures_dir):
+    def test_v34_format_with_begin_markers(self, ieee9_system):
         """Test that v34 format with BEGIN markers works."""
         # IEEE 9-bus uses v34 format with explicit section markers
-        system = parse_raw(fixtures_dir / "ieee9.raw")
-        assert len(system.buses) == 9
+        assert len(ieee9_system.buses) == 9
 
-    def test_both_formats_produce_valid_systems(self, fixtures_dir):
+    def test_both_formats_produce_valid_systems(self, ieee14_system, ieee9_system):
         """Test that both formats produce systems with all required data."""
-        s33 = parse_raw(fixtures_dir / "ieee14.raw")
-        s34 = parse_raw(fixtures_dir / "ieee9.raw")
-
         # Both should have valid power balance
-        for system in [s33, s34]:
+        for system in [ieee14_system, ieee9_system]:
             assert len(system.buses) > 0
             assert len(system.generators) > 0
             assert len(system.branches) > 0
             gen_p, _ = system.total_generation()
             load_p, _ = system.total_load()
             assert gen_p >= load_p  # Generation covers load
+
+    def test_blank_line_inside_transformer_record(self, tmp_path):
+        """Test that a blank line inside a transformer record is skipped."""
+        lines = (FIXTURES_DIR / "ieee14.raw").read_text().splitlines()
+        # Insert a blank line after the header line of the 4-7 transformer
+        header = next(i for i, line in enumerate(lines) if line.startswith("    4,    7,    0"))
+        lines.insert(header + 1, "")
+        raw_file = tmp_path / "ieee14_blank.raw"
+        raw_file.write_text("\n".join(lines) + "\n")
+
+        system = parse_raw(raw_file)
+        transformers = [b for b in system.branches if b.is_transformer]
+        assert len(system.branches) == 20
+        assert len(transformers) == 3
+        assert any(t.from_bus == 4 and t.to_bus == 7 for t in transformers)
+
+    def test_apostrophe_inside_quoted_name(self, tmp_path):
+        """Test that only the delimiting quotes of a string field are removed."""
+        text = (FIXTURES_DIR / "ieee14.raw").read_text()
+        text = text.replace("'Bus 1       '", "'O'HARE'", 1)
+        raw_file = tmp_path / "ieee14_apostrophe.raw"
+        raw_file.write_text(text)
+
+        system = parse_raw(raw_file)
+        bus = system.get_bus(1)
+        assert bus is not None
+        assert bus.name == "O'HARE"
@@ -81,6 +81,13 @@ class TestAddBranch:
         small_system.add_branch(new_branch)
         assert small_system.num_branches() == original_count + 1
 
+    def test_add_branch_to_directly_appended_bus(self, small_system: System) -> None:
+        """Buses appended to the list without add_bus() are still found."""
+        assert small_system.get_bus(1) is not None  # builds the lookup index
+        small_system.buses.append(Bus(bus_id=3, bus_type=1))
+        small_system.add_branch(Branch(from_bus=2, to_bus=3, r_pu=0.01, x_pu=0.05))
+        assert small_system.get_branches_at_bus(3)[0].from_bus == 2
+
     def test_add_branch_invalid_from_bus_raises(self, small_system: System) -> None:
         """from_bus not in system raises ValueError."""
         bad_branch = Branch(from_bus=99, to_bus=2, r_pu=0.01, x_pu=0.05)